@@ -189,12 +189,11 @@ class AnimationManager:
         for province_id in list(daimyo.controlled_provinces):
             province = self.game.game_state.get_province(province_id)
             if province:
-                province.owner_daimyo_id = None
+                self.game.game_state.set_province_owner(province_id, None)
                 province.governor_general_id = None
-                daimyo.remove_province(province_id)
+            daimyo.remove_province(province_id)
 
         # 配下の将軍を浪人化
-        for general in list(self.game.game_state.generals.values()):
-            if general.serving_daimyo_id == daimyo_id:
-                general.serving_daimyo_id = None
-                general.unassign()
+        for general in self.game.game_state.general_registry.get_generals(daimyo_id):
+            general.serving_daimyo_id = None
+            general.unassign()
@@ -0,0 +1,108 @@
+"""
+行動の一括評価（systems/action_scoring.py）の計測
+
+1. 大きさの違う合成の格子マップで、1大名の全領地のコマンドを
+   ・従来AI（領地ごとに _ai_decide_military_action → _ai_decide_internal_action）
+   ・一括評価（ActionScorer.decide）
+   で決める時間を比較し、1領地あたりの時間が領地数によらないことを確認する（コマンドは実行しない）。
+2. シードごとに1大名だけ一括評価にした対局と従来AIのみの対局を進め、その大名の最終領地数を比較する。
+
+使い方:
+    python -m benchmarks.action_scoring --sizes 10 20 40 --games 12 --turns 30
+"""
+import argparse
+import contextlib
+import os
+import time
+
+import config
+from benchmarks.route_cache import build_grid_state
+from core.sequential_turn_manager import SequentialTurnManager
+from debug import log_channels
+from sim.headless import HeadlessGame
+from systems.action_scoring import ActionScorer
+from systems.ai import AISystem
+
+
+def time_decisions(size: int, daimyo_count: int, seed: int, repeat: int):
+    """合成マップで大名1の全領地のコマンドを決める時間（1領地あたりのμs）を (従来, 一括評価) で返す"""
+    game_state = build_grid_state(size, daimyo_count, seed)
+    game_state.border_index.rebuild()
+    rng = game_state.get_rng("benchmark")
+    for province in game_state.provinces.values():
+        province.gold = rng.randint(0, 1200)
+        province.rice = rng.randint(0, 1200)
+        province.peasants = rng.randint(100, 8000)
+
+    ai_system = AISystem(game_state, None, None, None)
+    turn_manager = SequentialTurnManager(game_state)
+    turn_manager.ai_system = ai_system
+    scorer = ActionScorer(game_state, ai_system)
+    daimyo = game_state.daimyo[1]
+    provinces = game_state.get_daimyo_provinces(1)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for province in provinces:
+            action = turn_manager._ai_decide_military_action(province, daimyo)
+            if action["type"] == "none":
+                turn_manager._ai_decide_internal_action(province, daimyo)
+    heuristic_us = (time.perf_counter() - start) * 1e6 / (repeat * len(provinces))
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        scorer.decide(1, provinces)
+    scoring_us = (time.perf_counter() - start) * 1e6 / (repeat * len(provinces))
+
+    return len(provinces), heuristic_us, scoring_us
+
+
+def run_game(seed: int, turns: int, daimyo_id: int, use_scoring: bool) -> int:
+    """対局を進めて、指定した大名の最終領地数を返す"""
+    config.AI_USE_SCORING = use_scoring
+    config.AI_SCORING_DAIMYO_IDS = [daimyo_id]
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        record = HeadlessGame(max_turns=turns, seed=seed).run()
+    return record.province_history[-1].get(daimyo_id, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="行動の一括評価の速度と従来AIに対する強さを計測する")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 20, 40], help="合成マップの一辺の領地数")
+    parser.add_argument("--daimyo", type=int, default=4, help="合成マップの大名数")
+    parser.add_argument("--repeat", type=int, default=5, help="合成マップでの決定の繰り返し回数")
+    parser.add_argument("--games", type=int, default=12, help="比較する対局数")
+    parser.add_argument("--turns", type=int, default=30, help="1対局のターン数")
+    parser.add_argument("--seed", type=int, default=0, help="最初の対局のシード")
+    args = parser.parse_args()
+
+    log_channels.disable_all()
+    original = (config.AI_USE_SCORING, config.AI_SCORING_DAIMYO_IDS)
+    try:
+        for size in args.sizes:
+            count, heuristic_us, scoring_us = time_decisions(size, args.daimyo, args.seed, args.repeat)
+            print(f"{size}×{size}マップ 大名1（{count}領地）: 従来AI {heuristic_us:.1f} μs/領地 / "
+                  f"一括評価 {scoring_us:.1f} μs/領地")
+
+        daimyo_count = 0
+        with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+            daimyo_count = len(HeadlessGame(seed=args.seed).game_state.daimyo)
+        baseline_total = scoring_total = 0
+        start = time.perf_counter()
+        for i in range(args.games):
+            seed = args.seed + i
+            target_id = 1 + i % daimyo_count
+            baseline = run_game(seed, args.turns, target_id, use_scoring=False)
+            scored = run_game(seed, args.turns, target_id, use_scoring=True)
+            baseline_total += baseline
+            scoring_total += scored
+            print(f"シード{seed} 大名{target_id}: 従来AI {baseline}領地 / 一括評価 {scored}領地")
+    finally:
+        config.AI_USE_SCORING, config.AI_SCORING_DAIMYO_IDS = original
+
+    print(f"{args.turns}ターン後の平均領地数: 従来AI {baseline_total / args.games:.2f} / "
+          f"一括評価 {scoring_total / args.games:.2f}  ({time.perf_counter() - start:.1f}秒)")
+
+
+if __name__ == "__main__":
+    main()
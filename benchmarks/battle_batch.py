@@ -0,0 +1,73 @@
+"""
+戦闘の一括試行（CombatSystem.simulate_batch）の計測
+
+対局を数ターン進めた状態で隣接する2領地を選び、
+・simulate_batch によるn回の試行
+・resolve_battle をn回呼ぶ処理
+の時間を比較する。同じシードの乱数を渡し、試行ごとの結果が一致することも確認する。
+
+使い方:
+    python -m benchmarks.battle_batch --trials 10000
+"""
+import argparse
+import contextlib
+import os
+import random
+import time
+
+from debug import log_channels
+from sim.headless import HeadlessGame
+from systems.combat import CombatSystem
+
+
+def main():
+    parser = argparse.ArgumentParser(description="戦闘の一括試行と resolve_battle の繰り返しを比較する")
+    parser.add_argument("--trials", type=int, default=10000, help="試行回数")
+    parser.add_argument("--turns", type=int, default=10, help="計測前に進めるターン数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    log_channels.disable_all()
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        game = HeadlessGame(seed=args.seed)
+        for _ in range(args.turns):
+            game.run_turn()
+    game_state = game.game_state
+    combat_system = CombatSystem(game_state)
+
+    # 兵力のある自領地と、隣接する他勢力の領地を選ぶ
+    origin, target = max(
+        ((p, game_state.provinces[adj_id])
+         for p in game_state.provinces.values() if p.owner_daimyo_id
+         for adj_id in p.adjacent_provinces
+         if game_state.provinces[adj_id].owner_daimyo_id != p.owner_daimyo_id),
+        key=lambda pair: pair[0].soldiers
+    )
+    army = combat_system.create_preview_army(origin, origin.soldiers, origin.governor_general_id)
+
+    start = time.perf_counter()
+    batch = combat_system.simulate_batch(army, target, args.trials, random.Random(args.seed))
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    # resolve_battle は combat ストリームを使うため、同じシードで差し替えて比較する
+    game_state.seed_rng(args.seed)
+    start = time.perf_counter()
+    results = [combat_system.resolve_battle(army, target) for _ in range(args.trials)]
+    loop_ms = (time.perf_counter() - start) * 1000
+
+    same = (
+        batch["attacker_casualties"] == [r.attacker_casualties for r in results]
+        and batch["defender_casualties"] == [r.defender_casualties for r in results]
+        and batch["rounds"] == [r.duration_rounds for r in results]
+    )
+    print(f"{origin.name}(兵{army.total_troops}) → {target.name}(兵{target.soldiers})  試行: {args.trials}")
+    print(f"勝率: {batch['win_probability']:.3f} ± {batch['win_probability_stderr']:.3f}  "
+          f"平均損失: 攻{batch['expected_attacker_casualties']:.0f} / 守{batch['expected_defender_casualties']:.0f}  "
+          f"平均ラウンド: {batch['expected_rounds']:.2f}")
+    print(f"simulate_batch:      {batch_ms:.1f} ms")
+    print(f"resolve_battle × n:  {loop_ms:.1f} ms")
+    print(f"速度比: {loop_ms / max(batch_ms, 1e-9):.2f}x  結果一致: {same}")
+
+
+if __name__ == "__main__":
+    main()
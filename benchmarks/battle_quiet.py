@@ -0,0 +1,173 @@
+"""
+戦闘の記録なし解決（CombatSystem.resolve_battle(record_rounds=False)）の計測
+
+対局を数ターン進めた状態で隣接する2領地を選び、
+・ラウンドごとに辞書を作り、戦闘結果サマリーを毎回作る従来の処理
+・ラウンド記録を整数配列に残す処理（record_rounds=True）
+・ラウンド記録を残さない処理（record_rounds=False）
+で戦闘をn回解決する時間を比較する。同じシードの乱数を渡し、結果が一致することも確認する。
+続けてヘッドレス対局を quiet_battles の有無で進め、1ターンあたりの時間を比較する。
+
+使い方:
+    python -m benchmarks.battle_quiet --trials 20000 --turns 100
+"""
+import argparse
+import contextlib
+import os
+import time
+
+import config
+from debug import log_channels
+from sim.headless import HeadlessGame
+from systems.combat import CombatSystem
+
+
+def legacy_resolve_battle(combat_system: CombatSystem, attacker_army, defender_province) -> dict:
+    """ラウンドごとに辞書を作り、戦闘結果サマリーを毎回作る従来の resolve_battle"""
+    game_state = combat_system.game_state
+    rng = game_state.get_rng("combat")
+    rounds_detail = []
+    battle_log = []
+
+    attacker_general = None
+    if attacker_army.general_id:
+        attacker_general = game_state.get_general(attacker_army.general_id)
+    attacker_power = combat_system._calculate_army_power(attacker_army, attacker_general)
+
+    defender_general = None
+    if defender_province.governor_general_id:
+        defender_general = game_state.get_general(defender_province.governor_general_id)
+    defender_power = combat_system._calculate_defender_power(defender_province, defender_general)
+
+    attacker_troops = attacker_army.total_troops
+    defender_troops = defender_province.soldiers
+    attacker_won = False
+
+    for round_num in range(1, config.BATTLE_MAX_ROUNDS + 1):
+        damage_to_attacker = combat_system._calculate_damage(defender_power, defender_troops, is_attacker=False)
+        damage_to_defender = combat_system._calculate_damage(attacker_power, attacker_troops, is_attacker=True)
+        damage_to_attacker = int(damage_to_attacker * defender_province.get_defense_bonus())
+
+        defender_casualties = min(damage_to_defender, defender_troops)
+        attacker_casualties = min(damage_to_attacker, attacker_troops)
+        defender_troops -= defender_casualties
+        attacker_troops -= attacker_casualties
+
+        rounds_detail.append({
+            "round": round_num,
+            "attacker_damage": defender_casualties,
+            "defender_damage": attacker_casualties,
+            "attacker_remaining": max(0, attacker_troops),
+            "defender_remaining": max(0, defender_troops)
+        })
+
+        if defender_troops <= 0:
+            attacker_won = True
+            break
+        elif attacker_troops <= 0:
+            break
+
+        if attacker_troops < attacker_army.total_troops * config.RETREAT_TROOP_RATIO:
+            if rng.random() < config.RETREAT_PROBABILITY:
+                break
+
+    attacker_casualties = attacker_army.total_troops - attacker_troops
+    defender_casualties = defender_province.soldiers - defender_troops
+    attacker_remaining = max(0, attacker_troops)
+    defender_remaining = max(0, defender_troops)
+    if attacker_won:
+        battle_log.append(f"⚔ 攻撃軍が勝利！（損失{attacker_casualties}人、残存{attacker_remaining}人）")
+        battle_log.append(f"   守備軍は壊滅（損失{defender_casualties}人）")
+    else:
+        battle_log.append(f"🛡 守備軍が勝利！（損失{defender_casualties}人、残存{defender_remaining}人）")
+        battle_log.append(f"   攻撃軍は撤退（損失{attacker_casualties}人）")
+    if attacker_won and defender_troops <= 0:
+        battle_log.append(f"★ {defender_province.name}を占領！")
+
+    return {
+        "attacker_won": attacker_won,
+        "attacker_casualties": attacker_casualties,
+        "defender_casualties": defender_casualties,
+        "rounds_detail": rounds_detail,
+        "battle_log": battle_log
+    }
+
+
+def run_headless(seed: int, turns: int, quiet: bool):
+    """ヘッドレス対局を進めて (1ターンあたりのms, 対局記録) を返す"""
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        game = HeadlessGame(max_turns=turns, seed=seed)
+        game.turn_manager.quiet_battles = quiet
+        start = time.perf_counter()
+        record = game.run()
+        elapsed = time.perf_counter() - start
+    return elapsed * 1000 / max(record.turns, 1), record
+
+
+def main():
+    parser = argparse.ArgumentParser(description="戦闘の記録あり・記録なし解決の速度を比較する")
+    parser.add_argument("--trials", type=int, default=20000, help="戦闘の解決回数")
+    parser.add_argument("--turns", type=int, default=100, help="ヘッドレス対局のターン数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    log_channels.disable_all()
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        game = HeadlessGame(seed=args.seed)
+        for _ in range(10):
+            game.run_turn()
+    game_state = game.game_state
+    combat_system = CombatSystem(game_state)
+
+    # 兵力のある自領地と、隣接する他勢力の領地を選ぶ
+    origin, target = max(
+        ((p, game_state.provinces[adj_id])
+         for p in game_state.provinces.values() if p.owner_daimyo_id
+         for adj_id in p.adjacent_provinces
+         if game_state.provinces[adj_id].owner_daimyo_id != p.owner_daimyo_id),
+        key=lambda pair: pair[0].soldiers
+    )
+    army = combat_system.create_preview_army(origin, origin.soldiers, origin.governor_general_id)
+
+    game_state.seed_rng(args.seed)
+    start = time.perf_counter()
+    legacy = [legacy_resolve_battle(combat_system, army, target) for _ in range(args.trials)]
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    game_state.seed_rng(args.seed)
+    start = time.perf_counter()
+    recorded = [combat_system.resolve_battle(army, target) for _ in range(args.trials)]
+    recorded_ms = (time.perf_counter() - start) * 1000
+
+    game_state.seed_rng(args.seed)
+    start = time.perf_counter()
+    quiet = [combat_system.resolve_battle(army, target, record_rounds=False) for _ in range(args.trials)]
+    quiet_ms = (time.perf_counter() - start) * 1000
+
+    same = all(
+        old["attacker_won"] == new.attacker_won == fast.attacker_won
+        and old["attacker_casualties"] == new.attacker_casualties == fast.attacker_casualties
+        and old["defender_casualties"] == new.defender_casualties == fast.defender_casualties
+        and old["rounds_detail"] == new.rounds_detail
+        and old["battle_log"] == new.battle_log == fast.battle_log
+        for old, new, fast in zip(legacy, recorded, quiet)
+    )
+
+    print(f"{origin.name}(兵{army.total_troops}) → {target.name}(兵{target.soldiers})  解決回数: {args.trials}")
+    print(f"従来（辞書・サマリーを毎回作成）: {legacy_ms:.1f} ms")
+    print(f"記録あり（整数配列）:             {recorded_ms:.1f} ms")
+    print(f"記録なし:                         {quiet_ms:.1f} ms")
+    print(f"速度比: {legacy_ms / max(quiet_ms, 1e-9):.2f}x  結果一致: {same}")
+
+    full_ms, full_record = run_headless(args.seed, args.turns, quiet=False)
+    quiet_turn_ms, quiet_record = run_headless(args.seed, args.turns, quiet=True)
+    same_game = (full_record.winner_id, full_record.turns, full_record.battles) == \
+        (quiet_record.winner_id, quiet_record.turns, quiet_record.battles)
+    print(f"ヘッドレス対局 {args.turns}ターン（戦闘 {quiet_record.battles}回）")
+    print(f"quiet_battles=False: {full_ms:.3f} ms/turn")
+    print(f"quiet_battles=True:  {quiet_turn_ms:.3f} ms/turn")
+    print(f"速度比: {full_ms / max(quiet_turn_ms, 1e-9):.2f}x  結果一致: {same_game}")
+
+
+if __name__ == "__main__":
+    main()
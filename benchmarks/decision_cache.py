@@ -0,0 +1,89 @@
+"""
+AI判断のキャッシュ（core/decision_cache.py）の計測（合成の格子マップ）
+
+N×Nの格子マップを少数の大名の地域に分けて作り（前線から離れた領地が多い）、全大名をAIとして
+ターンを進め、キャッシュなし・ありで
+・AIの判断（軍事・内政判断とキャッシュの問い合わせ）にかかった時間
+・ターンごとのキャッシュのヒット率
+を比較する。判断の結果が変わらないこと（最終状態の一致）も確認する。
+
+使い方:
+    python -m benchmarks.decision_cache --size 40 --daimyo 4 --turns 20
+"""
+import argparse
+import time
+
+import config
+from benchmarks.route_cache import build_grid_state
+from core.game_initializer import create_game_systems
+from core.sequential_turn_manager import run_to_completion
+from debug import log_channels
+
+
+def timed(obj, name: str, elapsed: list):
+    """obj.name の呼び出し時間を elapsed[0] に加算するよう置き換える"""
+    method = getattr(obj, name)
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            elapsed[0] += time.perf_counter() - start
+
+    setattr(obj, name, wrapper)
+
+
+def run(args, cached: bool):
+    """ターンを進めて (判断にかかったms, ターンごとの (ヒット数, 問い合わせ数), 最終状態) を返す"""
+    config.AI_DECISION_CACHE = cached
+    game_state = build_grid_state(args.size, args.daimyo, args.seed)
+    game_state.border_index.rebuild()
+    turn_manager = create_game_systems(game_state, [])["turn_manager"]
+
+    elapsed = [0.0]
+    timed(turn_manager, "_ai_decide_military_action", elapsed)
+    timed(turn_manager, "_ai_decide_internal_action", elapsed)
+    if turn_manager.decision_cache is not None:
+        timed(turn_manager.decision_cache, "lookup", elapsed)
+
+    for _ in range(args.turns):
+        run_to_completion(turn_manager.execute_turn())
+
+    history = turn_manager.decision_cache.history if turn_manager.decision_cache else []
+    state = [
+        (p.owner_daimyo_id, p.soldiers, p.gold, p.rice, p.peasant_loyalty, p.development_level,
+         p.town_level, p.flood_control)
+        for p in game_state.provinces.values()
+    ]
+    return elapsed[0] * 1000, history, state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI判断のキャッシュの速度とヒット率を計測する")
+    parser.add_argument("--size", type=int, default=40, help="格子の一辺の領地数")
+    parser.add_argument("--daimyo", type=int, default=4, help="大名数")
+    parser.add_argument("--turns", type=int, default=20, help="ターン数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    log_channels.disable_all()
+    original = config.AI_DECISION_CACHE
+    try:
+        plain_ms, _, plain_state = run(args, cached=False)
+        cached_ms, history, cached_state = run(args, cached=True)
+    finally:
+        config.AI_DECISION_CACHE = original
+
+    print(f"{args.size}×{args.size}領地・{args.daimyo}大名・{args.turns}ターン")
+    for turn, (hits, lookups) in enumerate(history, 1):
+        print(f"ターン{turn}: ヒット {hits}/{lookups}（{hits / max(lookups, 1):.0%}）")
+    hits = sum(h for h, _ in history)
+    lookups = sum(n for _, n in history)
+    print(f"全体のヒット率: {hits / max(lookups, 1):.0%}")
+    print(f"判断の時間: キャッシュなし {plain_ms:.1f} ms / キャッシュあり {cached_ms:.1f} ms")
+    print(f"速度比: {plain_ms / max(cached_ms, 1e-9):.2f}x  結果一致: {plain_state == cached_state}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+イベント効果適用の計測（合成マップ）
+
+data/events.json の全イベント（選択肢があるものは各選択肢）を合成マップの領地へ適用し、
+・コンパイル済みの命令リスト（EventSystem.apply_event_effect）
+・効果辞書をコピーしてキーを1つずつ調べる処理（従来の実装と同じ計算）
+で1回あたりの時間を比較する。適用後の領地の状態が一致することも確認する。
+
+使い方:
+    python -m benchmarks.event_effects --provinces 2000 --rounds 20
+"""
+import argparse
+import time
+
+import config
+from benchmarks.s1_economy import build_synthetic_state
+from systems.events import EventSystem
+
+
+def apply_by_probing(event_system, event, province, choice_id=None):
+    """効果辞書をコピーしてキーを1つずつ調べる従来の処理"""
+    effects = event.effects.copy()
+
+    if choice_id and event.choices:
+        for choice in event.choices:
+            if choice.choice_id == choice_id:
+                effects.update(choice.effect)
+                if "gold" in choice.cost:
+                    province.add_gold(-choice.cost["gold"])
+                if "rice" in choice.cost:
+                    province.add_rice(-choice.cost["rice"])
+                break
+
+    mitigation = event.mitigation
+    if mitigation and mitigation.get("attribute") == "flood_control" \
+            and province.flood_control >= mitigation.get("threshold", 0):
+        reduction = mitigation.get("reduction_factor", 1.0)
+        if "rice_multiplier" in effects:
+            effects["rice_multiplier"] = 1.0 - ((1.0 - effects["rice_multiplier"]) * reduction)
+        for key in list(effects.keys()):
+            if "loss" in key or key in ["peasants", "soldiers", "gold", "rice"]:
+                if effects[key] < 0:
+                    effects[key] = int(effects[key] * reduction)
+        if "loyalty_change" in effects and effects["loyalty_change"] < 0:
+            effects["loyalty_change"] = int(effects["loyalty_change"] * reduction)
+
+    if "rice_multiplier" in effects:
+        province.add_rice(int(province.calculate_rice_production() * (effects["rice_multiplier"] - 1.0)))
+    if "rice" in effects:
+        province.add_rice(effects["rice"])
+    if "gold" in effects:
+        province.add_gold(effects["gold"])
+    if "peasant_loss" in effects:
+        province.peasants = max(0, province.peasants + effects["peasant_loss"])
+    if "peasants" in effects:
+        province.peasants = max(0, province.peasants + effects["peasants"])
+    if "soldier_loss" in effects:
+        province.soldiers = max(0, province.soldiers + effects["soldier_loss"])
+    if "soldiers" in effects:
+        province.soldiers = max(0, province.soldiers + effects["soldiers"])
+    if "soldier_loss_percent" in effects:
+        loss_count = int(province.soldiers * abs(effects["soldier_loss_percent"]))
+        province.soldiers = max(0, province.soldiers - loss_count)
+    if "loyalty_change" in effects:
+        province.peasant_loyalty = max(0, min(100, province.peasant_loyalty + effects["loyalty_change"]))
+    if "development_level" in effects:
+        province.development_level = max(0, province.development_level + effects["development_level"])
+    if "town_level" in effects:
+        province.town_level = max(0, province.town_level + effects["town_level"])
+
+    event_system.event_history.append({
+        "turn": event_system.game_state.current_turn,
+        "season": event_system.game_state.get_season_name(),
+        "event_id": event.event_id,
+        "province_id": province.id,
+        "choice": choice_id,
+        "effects": effects
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="イベント効果適用（命令リスト / 辞書の探索）の速度を比較する")
+    parser.add_argument("--provinces", type=int, default=2000, help="領地数")
+    parser.add_argument("--rounds", type=int, default=20, help="全領地への適用を繰り返す回数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    compiled_state = build_synthetic_state(args.provinces, 50, args.seed)
+    for province in compiled_state.provinces.values():
+        province.flood_control = compiled_state.rng.randint(0, 100)
+        province.gold = 5000
+        province.rice = 5000
+    probing_state = compiled_state.fork()
+
+    event_system = EventSystem(compiled_state)
+    event_system.load_events_from_file(config.EVENTS_DATA)
+
+    # (イベント, 選択肢ID) の組を領地に順番に割り当てる
+    cases = []
+    for event in event_system.events:
+        cases.append((event, None))
+        for choice in event.choices:
+            cases.append((event, choice.choice_id))
+    # 将軍登用は将軍の状態を変えるため除外（効果の計算とは無関係）
+    cases = [(event, choice_id) for event, choice_id in cases
+             if not event.compiled.variants.get(choice_id, event.compiled.variants[None]).recruit_general_id]
+
+    compiled_provinces = list(compiled_state.provinces.values())
+    probing_provinces = list(probing_state.provinces.values())
+    applications = args.rounds * len(compiled_provinces)
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for i, province in enumerate(compiled_provinces):
+            event, choice_id = cases[i % len(cases)]
+            event_system.apply_event_effect(event, province, choice_id)
+    compiled_us = (time.perf_counter() - start) * 1e6 / applications
+    event_system.event_history.clear()
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for i, province in enumerate(probing_provinces):
+            event, choice_id = cases[i % len(cases)]
+            apply_by_probing(event_system, event, province, choice_id)
+    probing_us = (time.perf_counter() - start) * 1e6 / applications
+
+    same = compiled_state.province_store.columns == probing_state.province_store.columns
+    print(f"領地数: {args.provinces}  繰り返し: {args.rounds}  効果の種類: {len(cases)}")
+    print(f"命令リスト:   {compiled_us:.2f} us/回")
+    print(f"辞書の探索:   {probing_us:.2f} us/回")
+    print(f"速度比: {probing_us / max(compiled_us, 1e-9):.2f}x  結果一致: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+イベント発生判定の計測（合成マップ・合成イベント）
+
+N領地・M件の合成イベントで、1ターン分の発生判定を
+・季節・地形ごとの発生判定表（EventSystem.check_events_for_turn）
+・領地×イベントを1件ずつ判定する処理（従来の実装と同じ判定）
+で実行して時間を比較する。イベントごとの発生回数の分布が一致することも確認する。
+
+使い方:
+    python -m benchmarks.events --provinces 10000 --events 100 --turns 20
+"""
+import argparse
+import time
+from collections import Counter
+
+import config
+from benchmarks.s1_economy import build_synthetic_state
+from models.event import GameEvent, EventType
+from systems.events import EventSystem
+
+SEASONS = ["春", "夏", "秋", "冬"]
+
+
+def build_synthetic_events(num_events: int, rng) -> list:
+    """季節・地形・トリガー条件をばらつかせた合成イベントを作成"""
+    terrains = list(config.TERRAIN_EFFECTS.keys())
+    events = []
+    for i in range(num_events):
+        event = GameEvent(f"synthetic_{i}", EventType.ECONOMIC, f"イベント{i}", "{province_name}")
+        event.probability = rng.uniform(0.0, 0.02)
+        if rng.random() < 0.5:
+            event.season_restriction = rng.sample(SEASONS, rng.randint(1, 2))
+        if rng.random() < 0.3:
+            event.terrain_restriction = rng.sample(terrains, rng.randint(1, 2))
+        if rng.random() < 0.3:
+            event.trigger_conditions = rng.choice([
+                {"peasant_loyalty_min": 60},
+                {"peasant_loyalty_max": 40},
+                {"town_level_min": 5},
+                {"soldiers_max": 300},
+            ])
+        events.append(event)
+    return events
+
+
+def per_pair_check(event_system: EventSystem, season: str, rng) -> list:
+    """領地×イベントを1件ずつ判定する従来の処理"""
+    triggered = []
+    for province in event_system.game_state.provinces.values():
+        for event in event_system.events:
+            if event.season_restriction and season not in event.season_restriction:
+                continue
+            if event.terrain_restriction and province.terrain_type not in event.terrain_restriction:
+                continue
+            conditions = event.trigger_conditions
+            if "peasant_loyalty_max" in conditions and province.peasant_loyalty > conditions["peasant_loyalty_max"]:
+                continue
+            if "peasant_loyalty_min" in conditions and province.peasant_loyalty < conditions["peasant_loyalty_min"]:
+                continue
+            if "town_level_min" in conditions and province.town_level < conditions["town_level_min"]:
+                continue
+            if "soldiers_max" in conditions and province.soldiers > conditions["soldiers_max"]:
+                continue
+            if rng.random() < event.probability:
+                triggered.append((event, province))
+                break
+    return triggered
+
+
+def main():
+    parser = argparse.ArgumentParser(description="イベント発生判定（発生判定表 / 1件ずつ）の速度を比較する")
+    parser.add_argument("--provinces", type=int, default=10000, help="領地数")
+    parser.add_argument("--events", type=int, default=100, help="イベント数")
+    parser.add_argument("--turns", type=int, default=20, help="計測ターン数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    game_state = build_synthetic_state(args.provinces, 50, args.seed)
+    event_system = EventSystem(game_state)
+    event_system.events = build_synthetic_events(args.events, game_state.rng)
+    rng = game_state.get_rng("events")
+
+    table_counts = Counter()
+    start = time.perf_counter()
+    for turn in range(args.turns):
+        for event, _ in event_system.check_events_for_turn(SEASONS[turn % 4]):
+            table_counts[event.event_id] += 1
+    table_ms = (time.perf_counter() - start) * 1000 / args.turns
+
+    pair_counts = Counter()
+    start = time.perf_counter()
+    for turn in range(args.turns):
+        for event, _ in per_pair_check(event_system, SEASONS[turn % 4], rng):
+            pair_counts[event.event_id] += 1
+    pair_ms = (time.perf_counter() - start) * 1000 / args.turns
+
+    # イベントごとの発生割合の差（全変動距離、0に近いほど一致）
+    table_total = max(sum(table_counts.values()), 1)
+    pair_total = max(sum(pair_counts.values()), 1)
+    distance = 0.5 * sum(
+        abs(table_counts[event.event_id] / table_total - pair_counts[event.event_id] / pair_total)
+        for event in event_system.events
+    )
+
+    print(f"領地数: {args.provinces}  イベント数: {args.events}  ターン数: {args.turns}")
+    print(f"発生判定表:   {table_ms:.2f} ms/turn  発生{sum(table_counts.values())}件")
+    print(f"1件ずつ判定: {pair_ms:.2f} ms/turn  発生{sum(pair_counts.values())}件")
+    print(f"速度比: {pair_ms / max(table_ms, 1e-9):.2f}x  分布の差（全変動距離）: {distance:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+GameState.fork() の計測
+
+対局を数ターン進めた状態で、fork() と copy.deepcopy() の1回あたりの時間を比較する。
+
+使い方:
+    python -m benchmarks.fork --turns 20 --repeat 1000
+"""
+import argparse
+import contextlib
+import copy
+import os
+import time
+
+from debug import log_channels
+from sim.headless import HeadlessGame
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GameState.fork() と deepcopy の速度を比較する")
+    parser.add_argument("--turns", type=int, default=20, help="計測前に進めるターン数")
+    parser.add_argument("--repeat", type=int, default=1000, help="fork() の実行回数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    log_channels.disable_all()
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        game = HeadlessGame(seed=args.seed)
+        for _ in range(args.turns):
+            game.run_turn()
+    game_state = game.game_state
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        game_state.fork()
+    fork_us = (time.perf_counter() - start) * 1e6 / args.repeat
+
+    deepcopy_repeat = max(1, args.repeat // 20)
+    start = time.perf_counter()
+    for _ in range(deepcopy_repeat):
+        copy.deepcopy(game_state)
+    deepcopy_us = (time.perf_counter() - start) * 1e6 / deepcopy_repeat
+
+    print(f"fork():          {fork_us:.1f} us")
+    print(f"copy.deepcopy(): {deepcopy_us:.1f} us")
+    print(f"速度比: {deepcopy_us / max(fork_us, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
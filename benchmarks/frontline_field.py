@@ -0,0 +1,122 @@
+"""
+AIの転送判断（SequentialTurnManager._ai_decide_transfer_action）の計測（合成の格子マップ）
+
+N×Nの格子マップを大名ごとの地域に分けて作り、毎ターン数領地の所有者を変えながら
+全領地の転送判断を
+・隣接領地ごとに国境索引を引く従来の処理（前線に隣接する領地だけが転送する）
+・前線までの距離場（FrontlineField、所有者が変わった大名の距離場だけを作り直す）
+・前線までの距離場を判断のたびに作り直す処理（config.AI_FRONTLINE_LOGISTICS=True の比較用）
+で行う時間を比較する。従来の処理と距離場（AI_FRONTLINE_LOGISTICS=False）の判断が一致すること、
+後方支援を有効にした場合に毎回作り直した距離場と判断が一致することも確認する。
+
+使い方:
+    python -m benchmarks.frontline_field --size 40 --daimyo 4 --turns 20
+"""
+import argparse
+import random
+import time
+
+import config
+from benchmarks.route_cache import build_grid_state
+from core.sequential_turn_manager import SequentialTurnManager
+
+
+def legacy_decide_transfer_action(turn_manager: SequentialTurnManager, province, daimyo) -> dict:
+    """隣接する自領地ごとに国境索引を引く従来の転送判断"""
+    border_index = turn_manager.game_state.border_index
+    transfer_targets = []
+    for adj_id in province.adjacent_provinces:
+        adj = turn_manager.game_state.get_province(adj_id)
+        if not adj or adj.owner_daimyo_id != daimyo.id:
+            continue
+        if border_index.has_foreign_neighbor(adj.id):
+            priority = 0
+            if adj.has_castle:
+                priority += 1000
+            if adj.soldiers < 200:
+                priority += 500
+            transfer_targets.append((adj, priority))
+
+    if not transfer_targets:
+        return {"type": "none"}
+
+    transfer_targets.sort(key=lambda x: x[1], reverse=True)
+    target = transfer_targets[0][0]
+    if target.soldiers < 300 and province.soldiers > 100:
+        return {"type": "transfer_soldiers", "target_id": target.id, "amount": 60}
+    if target.gold < 500 and province.gold > 380:
+        return {"type": "transfer_gold", "target_id": target.id, "amount": 300}
+    if province.rice > 500:
+        return {"type": "transfer_rice", "target_id": target.id, "amount": 300}
+    return {"type": "none"}
+
+
+def run(args, mode: str):
+    """毎ターン所有者を変えてから全領地の転送判断を行い、(ms, 判断のリスト) を返す
+
+    mode: "legacy"（従来）, "field"（距離場）, "logistics"（距離場・後方支援あり）,
+          "logistics_uncached"（後方支援あり・判断のたびに距離場を作り直す）
+    """
+    game_state = build_grid_state(args.size, args.daimyo, args.seed)
+    game_state.border_index.rebuild()
+    turn_manager = SequentialTurnManager(game_state)
+    frontline_field = game_state.frontline_field
+    rng = random.Random(args.seed)
+    province_ids = sorted(game_state.provinces)
+    config.AI_FRONTLINE_LOGISTICS = mode.startswith("logistics")
+
+    decisions = []
+    elapsed = 0.0
+    for _ in range(args.turns):
+        for _ in range(args.captures):
+            province = game_state.provinces[rng.choice(province_ids)]
+            adj = game_state.provinces[rng.choice(province.adjacent_provinces)]
+            game_state.set_province_owner(province.id, adj.owner_daimyo_id)
+
+        start = time.perf_counter()
+        for province_id in province_ids:
+            province = game_state.provinces[province_id]
+            daimyo = game_state.daimyo[province.owner_daimyo_id]
+            if mode == "legacy":
+                action = legacy_decide_transfer_action(turn_manager, province, daimyo)
+            else:
+                if mode == "logistics_uncached":
+                    frontline_field.clear()
+                action = turn_manager._ai_decide_transfer_action(province, daimyo)
+            decisions.append(action)
+        elapsed += time.perf_counter() - start
+
+    return elapsed * 1000, decisions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="前線までの距離場による転送判断の速度を比較する")
+    parser.add_argument("--size", type=int, default=40, help="格子の一辺の領地数")
+    parser.add_argument("--daimyo", type=int, default=4, help="大名数")
+    parser.add_argument("--turns", type=int, default=20, help="ターン数")
+    parser.add_argument("--captures", type=int, default=2, help="1ターンあたりの所有者の変更数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    original = config.AI_FRONTLINE_LOGISTICS
+    try:
+        legacy_ms, legacy = run(args, "legacy")
+        field_ms, field = run(args, "field")
+        uncached_ms, uncached = run(args, "logistics_uncached")
+        logistics_ms, logistics = run(args, "logistics")
+    finally:
+        config.AI_FRONTLINE_LOGISTICS = original
+
+    decided = sum(1 for action in field if action["type"] != "none")
+    decided_logistics = sum(1 for action in logistics if action["type"] != "none")
+    print(f"{args.size}×{args.size}領地・{args.daimyo}大名・{args.turns}ターン（判断 {len(field)}回）")
+    print(f"従来（隣接領地ごとに国境索引）: {legacy_ms:.1f} ms  転送する判断 {decided}回")
+    print(f"距離場:                         {field_ms:.1f} ms")
+    print(f"速度比: {legacy_ms / max(field_ms, 1e-9):.2f}x  結果一致: {legacy == field}")
+    print(f"後方支援あり・距離場を毎回作成: {uncached_ms:.1f} ms")
+    print(f"後方支援あり・距離場:           {logistics_ms:.1f} ms  転送する判断 {decided_logistics}回")
+    print(f"速度比: {uncached_ms / max(logistics_ms, 1e-9):.2f}x  結果一致: {uncached == logistics}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+将軍の配置の割当問題（systems/general_assignment.py）の計測（合成の将軍・領地）
+
+・小さな問題で、ハンガリアン法の割当の効用の合計が全探索の最適値と一致することを確認する
+・数千〜数万人の将軍（複数の大名に分ける）と守将のいない領地で、全大名の配置を
+  - 従来: 全将軍を走査して空いている将軍を集め、能力値の合計順に優先度順の領地へ配置
+  - 割当問題: 将軍の索引（core/general_registry.py）から空いている将軍を取り、効用の合計が最大の組み合わせで配置
+  で決め、1大名あたりの時間と効用の合計を比較する（割当問題の時間は将軍の総数にほぼよらない）
+
+使い方:
+    python -m benchmarks.general_assignment --generals 1000 10000 50000 --daimyo 10 --provinces 5
+"""
+import argparse
+import itertools
+import random
+import time
+from types import SimpleNamespace
+
+from models.general import General
+from core.general_registry import GeneralRegistry
+from systems.general_assignment import GeneralAssignment, solve_assignment
+
+
+def make_generals(count: int, daimyo_count: int, rng: random.Random) -> dict:
+    """将軍ID → 将軍（能力値は乱数、1割は配置済み）"""
+    generals = {}
+    for general_id in range(count):
+        general = General(general_id, f"武将{general_id}", rng.randint(1, daimyo_count))
+        general.war_skill = rng.randint(20, 100)
+        general.leadership = rng.randint(20, 100)
+        general.politics = rng.randint(20, 100)
+        general.intelligence = rng.randint(20, 100)
+        if rng.random() < 0.1:
+            general.assign_to_province(0)
+        generals[general_id] = general
+    return generals
+
+
+def make_provinces(count: int, rng: random.Random) -> list:
+    """守将のいない領地（兵士数・城・敵に面した隣接領地の数は乱数）"""
+    return [
+        SimpleNamespace(id=province_id, soldiers=rng.randint(0, 1500), has_castle=rng.random() < 0.3,
+                        foreign_neighbors=rng.choice((0, 0, 1, 2)))
+        for province_id in range(count)
+    ]
+
+
+def priority(province) -> int:
+    return province.soldiers + (1000 if province.has_castle else 0) + 500 * province.foreign_neighbors
+
+
+def is_front(province) -> bool:
+    return province.foreign_neighbors > 0
+
+
+def total_utility(solver: GeneralAssignment, pairs) -> float:
+    """組の効用の合計（GeneralAssignment と同じ効用）"""
+    total = 0.0
+    for province, general in pairs:
+        military = 0.75 if solver.is_front(province) else 0.25
+        total += (solver.priority(province) + 1) * (
+            military * (general.war_skill + general.leadership)
+            + (1 - military) * (general.politics + general.intelligence))
+    return total
+
+
+def greedy(generals: dict, daimyo_id: int, provinces: list) -> list:
+    """従来の配置（全将軍の走査 + 能力値の合計順）"""
+    available = [g for g in generals.values() if g.serving_daimyo_id == daimyo_id and g.is_available]
+    ordered = sorted(provinces, key=priority, reverse=True)
+    available.sort(key=lambda g: g.war_skill + g.leadership + g.politics + g.intelligence, reverse=True)
+    return list(zip(ordered, available))
+
+
+def check_optimal(trials: int, rng: random.Random) -> bool:
+    """小さな問題でハンガリアン法と全探索の最適値が一致するか"""
+    for _ in range(trials):
+        n = rng.randint(1, 5)
+        m = rng.randint(n, 7)
+        utility = [[rng.randint(0, 100) for _ in range(m)] for _ in range(n)]
+        assignment = solve_assignment(utility)
+        value = sum(utility[i][j] for i, j in enumerate(assignment))
+        best = max(sum(utility[i][j] for i, j in enumerate(columns))
+                   for columns in itertools.permutations(range(m), n))
+        if len(set(assignment)) != n or value != best:
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="将軍の配置の割当問題の速度と効用を計測する")
+    parser.add_argument("--generals", type=int, nargs="+", default=[1000, 10000, 50000], help="将軍の総数")
+    parser.add_argument("--daimyo", type=int, default=10, help="大名数（将軍を振り分ける）")
+    parser.add_argument("--provinces", type=int, default=5, help="1大名あたりの守将のいない領地数")
+    parser.add_argument("--trials", type=int, default=200, help="全探索と比べる小さな問題の数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"全探索との一致（{args.trials}問）: {check_optimal(args.trials, rng)}")
+
+    for count in args.generals:
+        generals = make_generals(count, args.daimyo, rng)
+        provinces = {daimyo_id: make_provinces(args.provinces, rng) for daimyo_id in range(1, args.daimyo + 1)}
+        solver = GeneralAssignment(priority, is_front)
+        registry = GeneralRegistry(SimpleNamespace(generals=generals))
+        registry.rebuild()
+
+        start = time.perf_counter()
+        greedy_pairs = {daimyo_id: greedy(generals, daimyo_id, provinces[daimyo_id]) for daimyo_id in provinces}
+        greedy_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        solver_pairs = {
+            daimyo_id: solver.assign(provinces[daimyo_id], registry.get_available(daimyo_id))
+            for daimyo_id in provinces
+        }
+        solver_ms = (time.perf_counter() - start) * 1000
+
+        greedy_total = sum(total_utility(solver, pairs) for pairs in greedy_pairs.values())
+        solver_total = sum(total_utility(solver, pairs) for pairs in solver_pairs.values())
+        print(f"将軍{count}人・{args.daimyo}大名・1大名あたり領地{args.provinces}: "
+              f"従来 {greedy_ms / args.daimyo:.2f} ms/大名 / 割当問題 {solver_ms / args.daimyo:.2f} ms/大名  "
+              f"速度比: {greedy_ms / max(solver_ms, 1e-9):.2f}x  "
+              f"効用の合計: {solver_total / max(greedy_total, 1):.3f}倍")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+将軍の索引（core/general_registry.py）の計測（合成の将軍）
+
+数千〜数万人の将軍を多数の大名に振り分け、
+・全将軍の走査: serving_daimyo_id と is_available で絞り込み、能力値の合計順に並べる
+・将軍の索引: GeneralRegistry.get_available
+で全大名の「空いている将軍を能力値順に」を求める時間を比較する。
+索引の更新にかかる時間（配属・配属解除・登用・討死）も計測し、結果が走査と一致することを確認する。
+
+使い方:
+    python -m benchmarks.general_registry --generals 1000 10000 50000 --daimyo 50
+"""
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from core.general_registry import GeneralRegistry
+from models.general import General
+
+
+def make_state(count: int, daimyo_count: int, rng: random.Random):
+    """将軍ID → 将軍（能力値は乱数、1割は浪人、1割は配属済み）を持つ最小のゲーム状態"""
+    generals = {}
+    for general_id in range(count):
+        daimyo_id = None if rng.random() < 0.1 else rng.randint(1, daimyo_count)
+        general = General(general_id, f"武将{general_id}", daimyo_id)
+        general.war_skill = rng.randint(20, 100)
+        general.leadership = rng.randint(20, 100)
+        general.politics = rng.randint(20, 100)
+        general.intelligence = rng.randint(20, 100)
+        if daimyo_id is not None and rng.random() < 0.1:
+            general.assign_to_province(rng.randint(1, 1000))
+        generals[general_id] = general
+    return SimpleNamespace(generals=generals)
+
+
+def scan(game_state, daimyo_id):
+    """全将軍の走査による空いている将軍（能力値の合計の高い順、同点はID順）"""
+    available = [
+        g for g in game_state.generals.values()
+        if g.serving_daimyo_id == daimyo_id and g.is_available
+    ]
+    available.sort(key=lambda g: g.war_skill + g.leadership + g.politics + g.intelligence, reverse=True)
+    return available
+
+
+def mutate(game_state, rng: random.Random, daimyo_count: int, steps: int):
+    """配属・配属解除・登用・討死をランダムに行う"""
+    generals = game_state.generals
+    registry = game_state.general_registry
+    ids = list(generals)
+    for _ in range(steps):
+        general = generals.get(rng.choice(ids))
+        if general is None:
+            continue
+        roll = rng.random()
+        if roll < 0.4:
+            general.assign_to_province(rng.randint(1, 1000))
+        elif roll < 0.8:
+            general.unassign()
+        elif roll < 0.95:
+            general.serving_daimyo_id = rng.randint(1, daimyo_count)
+        else:
+            registry.remove(general)
+            del generals[general.id]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="将軍の索引の問い合わせ・更新の速度を計測する")
+    parser.add_argument("--generals", type=int, nargs="+", default=[1000, 10000, 50000], help="将軍の総数")
+    parser.add_argument("--daimyo", type=int, default=50, help="大名数")
+    parser.add_argument("--updates", type=int, default=10000, help="索引の更新の回数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    daimyo_ids = list(range(1, args.daimyo + 1))
+    for count in args.generals:
+        game_state = make_state(count, args.daimyo, rng)
+        game_state.general_registry = GeneralRegistry(game_state)
+
+        start = time.perf_counter()
+        game_state.general_registry.rebuild()
+        rebuild_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        mutate(game_state, rng, args.daimyo, args.updates)
+        update_us = (time.perf_counter() - start) * 1e6 / args.updates
+
+        start = time.perf_counter()
+        scanned = [scan(game_state, daimyo_id) for daimyo_id in daimyo_ids]
+        scan_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        indexed = [game_state.general_registry.get_available(daimyo_id) for daimyo_id in daimyo_ids]
+        index_ms = (time.perf_counter() - start) * 1000
+
+        print(f"将軍{count}人・{args.daimyo}大名: 走査 {scan_ms:.2f} ms / 索引 {index_ms:.2f} ms（全大名）  "
+              f"索引の作成 {rebuild_ms:.1f} ms・更新 {update_us:.1f} μs/回  "
+              f"速度比: {scan_ms / max(index_ms, 1e-9):.1f}x  結果一致: {scanned == indexed}")
+
+
+if __name__ == "__main__":
+    main()
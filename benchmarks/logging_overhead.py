@@ -0,0 +1,54 @@
+"""
+ログ出力のオーバーヘッド計測
+
+同じシードの対局を「全チャンネルDEBUG（従来のprintと同等）」と
+「全チャンネル無効」で実行し、1ターンあたりの時間を比較する。
+出力先はどちらも /dev/null（ヘッドレス実行と同じ条件）。
+
+使い方:
+    python -m benchmarks.logging_overhead --games 20
+"""
+import argparse
+import contextlib
+import os
+import time
+
+import config
+from debug import log_channels
+from sim.headless import HeadlessGame
+
+
+def run(games: int, max_turns: int, base_seed: int, enabled: bool) -> float:
+    """対局を実行し、1ターンあたりの平均時間（ミリ秒）を返す"""
+    if enabled:
+        log_channels.configure_logging({channel: "DEBUG" for channel in log_channels.CHANNELS})
+    else:
+        log_channels.disable_all()
+
+    total_turns = 0
+    start = time.perf_counter()
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(games):
+            record = HeadlessGame(max_turns, base_seed + i).run()
+            total_turns += record.turns
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / max(total_turns, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ログ有効/無効でのターン時間を比較する")
+    parser.add_argument("--games", type=int, default=20, help="対局数")
+    parser.add_argument("--max-turns", type=int, default=config.VICTORY_TURN_LIMIT, help="1対局の最大ターン数")
+    parser.add_argument("--seed", type=int, default=0, help="最初のシード")
+    args = parser.parse_args()
+
+    debug_ms = run(args.games, args.max_turns, args.seed, enabled=True)
+    off_ms = run(args.games, args.max_turns, args.seed, enabled=False)
+
+    print(f"ログ全チャンネルDEBUG: {debug_ms:.3f} ms/turn")
+    print(f"ログ無効:             {off_ms:.3f} ms/turn")
+    print(f"速度比: {debug_ms / max(off_ms, 1e-9):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
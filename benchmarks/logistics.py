@@ -0,0 +1,146 @@
+"""
+兵站計画（systems/logistics.py の最小費用流）の計測（合成の格子マップ）
+
+N×Nの格子マップを少数の大名の地域に分けて作り（1大名あたり数百領地）、毎ターン
+・領地ごとに前線までの距離場の勾配に沿って1ホップ先へ送る処理（config.AI_FRONTLINE_LOGISTICS）
+・大名ごとに最小費用流で転送をまとめて決め、自領地を経由して前線へ直接送る処理（config.AI_FLOW_LOGISTICS）
+で全領地の転送を決めて実行し、転送の決定にかかる時間と、前線の領地に集まった兵士・金・米の
+割合（全領地の合計に対する）を比較する。毎ターン全領地に一定の収入を加え、所有者は変えない。
+資源ごとに、前線の領地へ届いた量の合計と、1ターン目の転送後に前線に残った不足
+（LogisticsPlanner の目標量に対する割合）も表示する。
+
+使い方:
+    python -m benchmarks.logistics --size 40 --daimyo 4 --turns 10
+"""
+import argparse
+import time
+
+import config
+from debug import log_channels
+from benchmarks.route_cache import build_grid_state
+from core.sequential_turn_manager import SequentialTurnManager, run_to_completion
+from systems.logistics import LogisticsPlanner
+from systems.transfer_system import TransferSystem
+
+ATTRIBUTES = ("soldiers", "gold", "rice")
+
+
+def front_share(game_state) -> dict:
+    """前線の領地にある量の、全領地の合計に対する割合（資源ごと）"""
+    share = {}
+    for attribute in ATTRIBUTES:
+        total = front = 0
+        for province in game_state.provinces.values():
+            amount = getattr(province, attribute)
+            total += amount
+            if game_state.frontline_field.get_distance(province.id) == 0:
+                front += amount
+        share[attribute] = front / max(total, 1)
+    return share
+
+
+def front_shortage(game_state) -> dict:
+    """前線の領地の不足の合計の、目標量（LogisticsPlanner）の合計に対する割合（資源ごと）"""
+    planner = LogisticsPlanner(game_state)
+    shortage = {}
+    for attribute in ATTRIBUTES:
+        total = short = 0
+        for province in game_state.provinces.values():
+            if game_state.frontline_field.get_distance(province.id) == 0:
+                target = planner._get_target(province, attribute)
+                total += target
+                short += max(target - getattr(province, attribute), 0)
+        shortage[attribute] = short / max(total, 1)
+    return shortage
+
+
+def run(args, mode: str):
+    """毎ターン全領地の転送を決めて実行し、
+    (決定にかかったms, 転送回数, 前線にある割合, 前線へ届いた量, 1ターン目の転送後の前線の不足) を返す
+    """
+    game_state = build_grid_state(args.size, args.daimyo, args.seed)
+    game_state.border_index.rebuild()
+    rng = game_state.get_rng("benchmark")
+    for province in game_state.provinces.values():
+        province.gold = rng.randint(0, 1200)
+        province.rice = rng.randint(0, 1200)
+
+    turn_manager = SequentialTurnManager(game_state)
+    turn_manager.transfer_system = TransferSystem(game_state)
+    config.AI_FRONTLINE_LOGISTICS = mode == "greedy"
+    config.AI_FLOW_LOGISTICS = mode == "flow"
+
+    elapsed = 0.0
+    transfers = 0
+    delivered = dict.fromkeys(ATTRIBUTES, 0)
+    shortage = None
+    for turn in range(args.turns):
+        for province in game_state.provinces.values():
+            province.command_used_this_turn = False
+
+        for daimyo_id in sorted(game_state.daimyo):
+            daimyo = game_state.daimyo[daimyo_id]
+            provinces = game_state.get_daimyo_provinces(daimyo_id)
+            start = time.perf_counter()
+            if mode == "flow":
+                turn_manager._ai_plan_logistics(daimyo)
+            for province in provinces:
+                action = turn_manager._ai_decide_transfer_action(province, daimyo)
+                # 領地ごとの判断は直前の転送の結果を見るため、判断ごとに実行する（実行時間は含めない）
+                if action["type"] != "none":
+                    elapsed += time.perf_counter() - start
+                    attribute = action["type"][len("transfer_"):]
+                    target = game_state.provinces[action["target_id"]]
+                    before = getattr(target, attribute)
+                    run_to_completion(turn_manager._execute_internal_command(province, daimyo, action))
+                    transfers += province.command_used_this_turn
+                    if game_state.frontline_field.get_distance(target.id) == 0:
+                        delivered[attribute] += getattr(target, attribute) - before
+                    start = time.perf_counter()
+            elapsed += time.perf_counter() - start
+
+        if turn == 0:
+            shortage = front_shortage(game_state)
+
+        # 収入
+        for province in game_state.provinces.values():
+            province.gold += args.income
+            province.rice += args.income
+            province.soldiers += args.income // 10
+
+    return elapsed * 1000, transfers, front_share(game_state), delivered, shortage
+
+
+def main():
+    parser = argparse.ArgumentParser(description="兵站計画（最小費用流）と領地ごとの転送判断を比較する")
+    parser.add_argument("--size", type=int, default=40, help="格子の一辺の領地数")
+    parser.add_argument("--daimyo", type=int, default=4, help="大名数")
+    parser.add_argument("--turns", type=int, default=10, help="ターン数")
+    parser.add_argument("--income", type=int, default=100, help="1ターンあたりの各領地の金・米の収入（兵士はその1/10）")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    log_channels.disable_all()
+    original = (config.AI_FRONTLINE_LOGISTICS, config.AI_FLOW_LOGISTICS)
+    try:
+        greedy_ms, greedy_transfers, greedy_share, greedy_delivered, greedy_shortage = run(args, "greedy")
+        flow_ms, flow_transfers, flow_share, flow_delivered, flow_shortage = run(args, "flow")
+    finally:
+        config.AI_FRONTLINE_LOGISTICS, config.AI_FLOW_LOGISTICS = original
+
+    def describe(share):
+        return f"兵{share['soldiers']:.0%} 金{share['gold']:.0%} 米{share['rice']:.0%}"
+
+    def amounts(delivered):
+        return f"兵{delivered['soldiers']} 金{delivered['gold']} 米{delivered['rice']}"
+
+    print(f"{args.size}×{args.size}領地・{args.daimyo}大名・{args.turns}ターン")
+    print(f"領地ごと（勾配に沿って1ホップ）: {greedy_ms:.1f} ms  転送 {greedy_transfers}回  前線にある割合 {describe(greedy_share)}")
+    print(f"最小費用流（前線へ直接）:       {flow_ms:.1f} ms  転送 {flow_transfers}回  前線にある割合 {describe(flow_share)}")
+    print(f"前線へ届いた量:        領地ごと {amounts(greedy_delivered)} / 最小費用流 {amounts(flow_delivered)}")
+    print(f"1ターン目の前線の不足: 領地ごと {describe(greedy_shortage)} / 最小費用流 {describe(flow_shortage)}")
+    print(f"1ターンあたり: {greedy_ms / args.turns:.2f} ms / {flow_ms / args.turns:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+並列計画（core/parallel_planner.py）の計測
+
+同じシードの対局を
+・逐次計画（各大名の手番でコマンドを決める）
+・並列計画（S3の開始時点で全AI大名の計画をプロセスプールで作り、入力が変わった大名だけ決め直す）
+で進め、1ターンあたりの時間と計画の再利用率を比較する。
+計画の作成が重い探索AI（反復回数で打ち切るため再現可能）で計測し、
+従来AIでは並列計画でも対局結果が逐次と一致することを確認する。
+
+使い方:
+    python -m benchmarks.parallel_planning --turns 10 --workers 8 --iterations 40
+"""
+import argparse
+import contextlib
+import os
+import time
+
+import config
+from debug import log_channels
+from sim.headless import HeadlessGame
+
+
+def run(seed: int, turns: int, parallel: bool, workers: int):
+    """対局を進めて (1ターンあたりのms, 対局記録, 再利用した計画数, 決め直した計画数) を返す"""
+    config.AI_PARALLEL_PLANNING = parallel
+    config.AI_PLANNING_WORKERS = workers
+    reused = replanned = 0
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        game = HeadlessGame(max_turns=turns, seed=seed)
+        start = time.perf_counter()
+        try:
+            for _ in range(turns):
+                winner = game.run_turn()
+                planner = game.turn_manager.parallel_planner
+                if planner:
+                    reused += planner.reused
+                    replanned += planner.replanned
+                if winner is not None:
+                    break
+        finally:
+            game.turn_manager.close()
+        elapsed = time.perf_counter() - start
+    state = [(p.owner_daimyo_id, p.soldiers, p.gold, p.rice) for p in game.game_state.provinces.values()]
+    return elapsed * 1000 / max(game.record.turns, 1), (game.record.province_history, state), reused, replanned
+
+
+def main():
+    parser = argparse.ArgumentParser(description="逐次計画と並列計画のターン時間を比較する")
+    parser.add_argument("--turns", type=int, default=10, help="ターン数")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="ワーカープロセス数")
+    parser.add_argument("--iterations", type=int, default=40, help="探索AIの1大名あたりの反復回数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    log_channels.disable_all()
+
+    # 従来AI: 並列計画でも逐次と同じ対局になる
+    _, sequential_result, _, _ = run(args.seed, args.turns, parallel=False, workers=args.workers)
+    _, parallel_result, reused, replanned = run(args.seed, args.turns, parallel=True, workers=args.workers)
+    print(f"従来AI: 結果一致: {sequential_result == parallel_result}  "
+          f"計画の再利用 {reused} / 決め直し {replanned}")
+
+    # 探索AI: 計画の作成が重い場合の時間
+    config.AI_USE_SEARCH = True
+    config.AI_SEARCH_BUDGET_MS = None
+    config.AI_SEARCH_MAX_ITERATIONS = args.iterations
+    sequential_ms, _, _, _ = run(args.seed, args.turns, parallel=False, workers=args.workers)
+    parallel_ms, _, reused, replanned = run(args.seed, args.turns, parallel=True, workers=args.workers)
+    print(f"探索AI（反復{args.iterations}回）  ワーカー数: {args.workers}")
+    print(f"逐次計画: {sequential_ms:.1f} ms/turn")
+    print(f"並列計画: {parallel_ms:.1f} ms/turn  計画の再利用 {reused} / 決め直し {replanned}")
+    print(f"速度比: {sequential_ms / max(parallel_ms, 1e-9):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
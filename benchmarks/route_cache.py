@@ -0,0 +1,117 @@
+"""
+自領地間の経路キャッシュ（RouteCache）の計測（合成の格子マップ）
+
+N×Nの格子マップを大名ごとの地域に分けて作り、毎ターン数領地の所有者を変えながら
+・問い合わせのたびに自領地だけを通る幅優先探索をする処理
+・RouteCache（所有者が変わった大名の木だけを作り直す）
+で全領地の転送先一覧と最も遠い転送先への経路を求める時間を比較する。
+画面の描画（毎フレーム選択中の領地の転送先を数える）のように、所有者が変わるまでに
+同じ問い合わせを繰り返す回数を --queries で指定する。結果が一致することも確認する。
+
+使い方:
+    python -m benchmarks.route_cache --size 40 --daimyo 16 --turns 20 --queries 5
+"""
+import argparse
+import random
+import time
+from collections import deque
+
+from benchmarks.s1_economy import build_synthetic_state
+from core.game_state import GameState
+
+
+def build_grid_state(size: int, num_daimyo: int, seed: int) -> GameState:
+    """格子状に隣接させ、大名ごとに縦長の地域へ分けた合成マップを作成"""
+    game_state = build_synthetic_state(size * size, num_daimyo, seed)
+    for province_id, province in game_state.provinces.items():
+        row, col = divmod(province_id - 1, size)
+        province.adjacent_provinces = [
+            r * size + c + 1
+            for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+            if 0 <= r < size and 0 <= c < size
+        ]
+        game_state.set_province_owner(province_id, col * num_daimyo // size + 1)
+    game_state.route_cache.clear()
+    return game_state
+
+
+def bfs_targets(game_state: GameState, from_province_id: int):
+    """問い合わせのたびに幅優先探索で (転送先IDリスト, 最も遠い転送先への経路) を求める"""
+    provinces = game_state.provinces
+    owner_id = provinces[from_province_id].owner_daimyo_id
+    parents = {from_province_id: from_province_id}
+    order = []
+    queue = deque([from_province_id])
+    while queue:
+        province_id = queue.popleft()
+        for adj_id in provinces[province_id].adjacent_provinces:
+            if adj_id not in parents and provinces[adj_id].owner_daimyo_id == owner_id:
+                parents[adj_id] = province_id
+                order.append(adj_id)
+                queue.append(adj_id)
+
+    if not order:
+        return order, None
+    route = [order[-1]]
+    while route[-1] != from_province_id:
+        route.append(parents[route[-1]])
+    return order, route[::-1]
+
+
+def run(game_state: GameState, turns: int, captures: int, queries: int, seed: int, cached: bool):
+    """毎ターン所有者を変えてから全領地の転送先と経路を queries 回求め、(ms, 結果) を返す"""
+    rng = random.Random(seed)
+    province_ids = sorted(game_state.provinces)
+    route_cache = game_state.route_cache
+    results = []
+    elapsed = 0.0
+
+    for _ in range(turns):
+        # 国境の領地を隣接する他勢力に奪わせる
+        for _ in range(captures):
+            province = game_state.provinces[rng.choice(province_ids)]
+            adj = game_state.provinces[rng.choice(province.adjacent_provinces)]
+            game_state.set_province_owner(province.id, adj.owner_daimyo_id)
+
+        start = time.perf_counter()
+        for _ in range(queries):
+            turn_result = []
+            for province_id in province_ids:
+                if cached:
+                    targets = route_cache.get_reachable(province_id)
+                    route = route_cache.get_route(province_id, targets[-1]) if targets else None
+                else:
+                    targets, route = bfs_targets(game_state, province_id)
+                turn_result.append((len(targets), route))
+        elapsed += time.perf_counter() - start
+        results.append(turn_result)
+
+    return elapsed * 1000, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="自領地間の経路キャッシュの速度を比較する")
+    parser.add_argument("--size", type=int, default=40, help="格子の一辺の領地数")
+    parser.add_argument("--daimyo", type=int, default=16, help="大名数")
+    parser.add_argument("--turns", type=int, default=20, help="ターン数")
+    parser.add_argument("--captures", type=int, default=2, help="1ターンあたりの所有者の変更数")
+    parser.add_argument("--queries", type=int, default=5, help="所有者の変更までに問い合わせを繰り返す回数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    bfs_ms, bfs_results = run(
+        build_grid_state(args.size, args.daimyo, args.seed), args.turns, args.captures, args.queries, args.seed, cached=False
+    )
+    cached_ms, cached_results = run(
+        build_grid_state(args.size, args.daimyo, args.seed), args.turns, args.captures, args.queries, args.seed, cached=True
+    )
+
+    print(f"{args.size}×{args.size}領地・{args.daimyo}大名・{args.turns}ターン"
+          f"（毎ターン{args.captures}領地の所有者を変更、問い合わせ{args.queries}回）")
+    print(f"問い合わせごとの幅優先探索: {bfs_ms:.1f} ms")
+    print(f"RouteCache:                 {cached_ms:.1f} ms")
+    print(f"速度比: {bfs_ms / max(cached_ms, 1e-9):.2f}x  結果一致: {bfs_results == cached_results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+S1経済処理の計測（合成マップ）
+
+N領地の合成マップを作り、S1のPhase1・Phase2・Phase4を
+・列の一括処理（SequentialTurnManager._s1_economy_batch）
+・Provinceのメソッドを1領地ずつ呼ぶ処理（従来の実装と同じ計算）
+で実行して1ターンあたりの時間を比較する。結果が一致することも確認する。
+
+使い方:
+    python -m benchmarks.s1_economy --provinces 5000 --turns 20
+"""
+import argparse
+import time
+
+import config
+from core.game_state import GameState
+from core.sequential_turn_manager import SequentialTurnManager
+from models.daimyo import Daimyo
+from models.province import Province
+
+
+def build_synthetic_state(num_provinces: int, num_daimyo: int, seed: int) -> GameState:
+    """地形・開発度・兵力をばらつかせた合成マップを作成"""
+    game_state = GameState(seed)
+    rng = game_state.rng
+    terrains = list(config.TERRAIN_EFFECTS.keys())
+
+    for daimyo_id in range(1, num_daimyo + 1):
+        game_state.daimyo[daimyo_id] = Daimyo(daimyo_id, f"大名{daimyo_id}", f"家{daimyo_id}")
+
+    for province_id in range(1, num_provinces + 1):
+        province = Province(
+            province_id=province_id,
+            name=f"領地{province_id}",
+            position=(0, 0),
+            terrain_type=rng.choice(terrains),
+            max_peasants=rng.randint(4000, 12000),
+            store=game_state.province_store
+        )
+        province.development_level = rng.randint(1, 10)
+        province.town_level = rng.randint(1, 10)
+        province.tax_rate = rng.choice([40, 50, 60, 70])
+        province.soldiers = rng.randint(50, 800)
+        province.peasant_loyalty = rng.randint(20, 90)
+        game_state.provinces[province_id] = province
+        # 一部は無所属のまま残す
+        if rng.random() < 0.9:
+            game_state.set_province_owner(province_id, rng.randint(1, num_daimyo))
+
+    return game_state
+
+
+def per_province_economy(game_state: GameState):
+    """Provinceのメソッドを1領地ずつ呼ぶ従来のS1処理（Phase1・2・4）"""
+    for province in game_state.provinces.values():
+        if province.owner_daimyo_id is None:
+            continue
+
+        # Phase1: 税収・米生産
+        peasant_growth = int(province.peasants * 0.01)
+        if peasant_growth > 0:
+            province.add_peasants(peasant_growth)
+        province.add_rice(province.calculate_rice_production())
+        province.add_gold(province.calculate_tax_income())
+
+        # Phase2: 維持費処理
+        province.add_rice(-province.calculate_soldier_rice_consumption())
+        if province.rice < 0:
+            province.rice = 0
+            province.update_morale(config.MORALE_LOW_RICE_PENALTY)
+        else:
+            province.update_morale(config.MORALE_DECAY_RATE)
+
+        # Phase4: 忠誠度減衰
+        loyalty_change = config.LOYALTY_DECAY_RATE
+        if province.tax_rate > 50:
+            loyalty_change += int((province.tax_rate - 50) * config.LOYALTY_TAX_PENALTY)
+        province.update_loyalty(loyalty_change)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="S1経済処理（列の一括処理 / 1領地ずつ）の速度を比較する")
+    parser.add_argument("--provinces", type=int, default=5000, help="領地数")
+    parser.add_argument("--daimyo", type=int, default=50, help="大名数")
+    parser.add_argument("--turns", type=int, default=20, help="計測ターン数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    batch_state = build_synthetic_state(args.provinces, args.daimyo, args.seed)
+    loop_state = batch_state.fork()
+    turn_manager = SequentialTurnManager(batch_state)
+
+    start = time.perf_counter()
+    for _ in range(args.turns):
+        turn_manager._s1_economy_batch(None)
+    batch_ms = (time.perf_counter() - start) * 1000 / args.turns
+
+    start = time.perf_counter()
+    for _ in range(args.turns):
+        per_province_economy(loop_state)
+    loop_ms = (time.perf_counter() - start) * 1000 / args.turns
+
+    same = batch_state.province_store.columns == loop_state.province_store.columns
+    print(f"領地数: {args.provinces}  ターン数: {args.turns}")
+    print(f"列の一括処理:   {batch_ms:.2f} ms/turn")
+    print(f"1領地ずつ処理: {loop_ms:.2f} ms/turn")
+    print(f"速度比: {loop_ms / max(batch_ms, 1e-9):.2f}x  結果一致: {same}")
+
+
+if __name__ == "__main__":
+    main()
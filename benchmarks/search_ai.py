@@ -0,0 +1,82 @@
+"""
+探索AI（systems/search_ai.py）の計測
+
+1. 対局を数ターン進めた状態で1大名のコマンドを探索し、1秒あたりの反復（プレイアウト）回数と
+   置換表で既存ノードにまとめた展開の数を表示する。
+2. シードごとに1大名だけ探索AIにした対局と従来AIのみの対局を進め、その大名の最終領地数を比較する
+   （探索は反復回数で打ち切るため、同じ引数なら結果を再現できる）。
+
+使い方:
+    python -m benchmarks.search_ai --games 12 --turns 30 --iterations 60
+"""
+import argparse
+import contextlib
+import os
+import time
+
+import config
+from debug import log_channels
+from sim.headless import HeadlessGame
+from systems.search_ai import SearchAI
+
+
+def run_game(seed: int, turns: int, daimyo_id: int, use_search: bool) -> int:
+    """対局を進めて、指定した大名の最終領地数を返す"""
+    config.AI_USE_SEARCH = use_search
+    config.AI_SEARCH_DAIMYO_IDS = [daimyo_id]
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        record = HeadlessGame(max_turns=turns, seed=seed).run()
+    return record.province_history[-1].get(daimyo_id, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="探索AIの反復速度と従来AIに対する強さを計測する")
+    parser.add_argument("--games", type=int, default=12, help="比較する対局数")
+    parser.add_argument("--turns", type=int, default=30, help="1対局のターン数")
+    parser.add_argument("--iterations", type=int, default=60, help="1大名あたりの探索の反復回数")
+    parser.add_argument("--seed", type=int, default=0, help="最初の対局のシード")
+    args = parser.parse_args()
+
+    log_channels.disable_all()
+    config.AI_SEARCH_BUDGET_MS = None
+    config.AI_SEARCH_MAX_ITERATIONS = args.iterations
+
+    # 反復速度
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        game = HeadlessGame(seed=args.seed)
+        for _ in range(5):
+            game.run_turn()
+    game_state = game.game_state
+    daimyo_id, province_ids = max(
+        ((d.id, [p.id for p in game_state.get_daimyo_provinces(d.id)])
+         for d in game_state.daimyo.values() if d.is_alive),
+        key=lambda item: len(item[1])
+    )
+    search_ai = SearchAI(game_state, game.systems["event_system"].events)
+    search_ai.max_iterations = args.iterations * 5
+    start = time.perf_counter()
+    plan = search_ai.plan(daimyo_id, province_ids)
+    elapsed = time.perf_counter() - start
+    print(f"大名{daimyo_id}（{len(province_ids)}領地）: 反復{search_ai.last_iterations}回 "
+          f"{search_ai.last_iterations / elapsed:.0f}回/秒  置換{search_ai.last_transpositions}回  "
+          f"決定{len(plan)}領地")
+
+    # 強さの比較（対局ごとに探索AIにする大名を変える）
+    daimyo_count = len(game_state.daimyo)
+    baseline_total = search_total = 0
+    start = time.perf_counter()
+    for i in range(args.games):
+        seed = args.seed + i
+        target_id = 1 + i % daimyo_count
+        baseline = run_game(seed, args.turns, target_id, use_search=False)
+        searched = run_game(seed, args.turns, target_id, use_search=True)
+        baseline_total += baseline
+        search_total += searched
+        print(f"シード{seed} 大名{target_id}: 従来AI {baseline}領地 / 探索AI {searched}領地")
+
+    print(f"{args.turns}ターン後の平均領地数: 従来AI {baseline_total / args.games:.2f} / "
+          f"探索AI {search_total / args.games:.2f}  ({time.perf_counter() - start:.1f}秒)")
+
+
+if __name__ == "__main__":
+    main()
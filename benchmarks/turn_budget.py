@@ -0,0 +1,82 @@
+"""
+AIの1ターンあたりの時間予算（config.AI_TURN_BUDGET_MS）の計測（合成の格子マップ）
+
+大きさ・大名数の違う格子マップで全大名をAIとしてターンを進め、
+・従来AIのみ
+・探索AI（大名ごとに AI_SEARCH_BUDGET_MS）
+・時間予算（従来AIの判断のあと、S3全体で AI_TURN_BUDGET_MS までを探索による改善に使う）
+の1ターンあたりのS3（大名の行動）の時間（平均・最大）を比較する。
+大名ごとの探索時間はマップが大きく大名が多いほど増えるが、時間予算では従来AIの判断と
+戦闘の時間に予算を足した程度に収まることを確認する。
+
+使い方:
+    python -m benchmarks.turn_budget --sizes 10 20 30 --budget 100 --turns 5
+"""
+import argparse
+import time
+
+import config
+from benchmarks.route_cache import build_grid_state
+from core.game_initializer import create_game_systems
+from core.sequential_turn_manager import run_to_completion
+from debug import log_channels
+
+
+def run(size: int, daimyo_count: int, turns: int, seed: int, mode: str, budget_ms: float):
+    """ターンを進めて、1ターンあたりのS3の時間 (平均ms, 最大ms) を返す
+
+    mode: "heuristic"（従来AIのみ）, "search"（大名ごとの探索時間）, "budget"（ターンの時間予算）
+    """
+    config.AI_USE_SEARCH = mode == "search"
+    config.AI_TURN_BUDGET_MS = budget_ms if mode == "budget" else None
+    game_state = build_grid_state(size, daimyo_count, seed)
+    game_state.border_index.rebuild()
+    turn_manager = create_game_systems(game_state, [])["turn_manager"]
+
+    # S3の時間だけを計る
+    section_3 = turn_manager._section_3_daimyo_actions
+    elapsed = []
+
+    def timed_section_3():
+        start = time.perf_counter()
+        result = yield from section_3()
+        elapsed.append((time.perf_counter() - start) * 1000)
+        return result
+
+    turn_manager._section_3_daimyo_actions = timed_section_3
+    for _ in range(turns):
+        if run_to_completion(turn_manager.execute_turn()):
+            break
+
+    return sum(elapsed) / max(len(elapsed), 1), max(elapsed, default=0.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AIのターンの時間予算による1ターンの時間を比較する")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 20, 30], help="格子の一辺の領地数")
+    parser.add_argument("--provinces-per-daimyo", type=int, default=50, help="1大名あたりの領地数（大名数を決める）")
+    parser.add_argument("--budget", type=float, default=100, help="1ターンの時間予算（ms）")
+    parser.add_argument("--turns", type=int, default=5, help="ターン数")
+    parser.add_argument("--seed", type=int, default=0, help="シード")
+    args = parser.parse_args()
+
+    log_channels.disable_all()
+    original = (config.AI_USE_SEARCH, config.AI_TURN_BUDGET_MS)
+    try:
+        for size in args.sizes:
+            daimyo_count = max(2, size * size // args.provinces_per_daimyo)
+            results = {
+                mode: run(size, daimyo_count, args.turns, args.seed, mode, args.budget)
+                for mode in ("heuristic", "search", "budget")
+            }
+            print(f"{size}×{size}領地・{daimyo_count}大名: "
+                  + " / ".join(f"{label} 平均{results[mode][0]:.0f}ms 最大{results[mode][1]:.0f}ms"
+                               for mode, label in (("heuristic", "従来AI"),
+                                                   ("search", f"探索（大名ごと{config.AI_SEARCH_BUDGET_MS}ms）"),
+                                                   ("budget", f"時間予算{args.budget:.0f}ms"))))
+    finally:
+        config.AI_USE_SEARCH, config.AI_TURN_BUDGET_MS = original
+
+
+if __name__ == "__main__":
+    main()
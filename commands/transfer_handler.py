@@ -25,12 +25,14 @@ class TransferHandler:
         if not province:
             return
 
-        # 転送可能な隣接領地を取得
+        # 転送可能な自領地を取得（自領地を経由して到達できる領地を含む、近い順）
         target_provinces = self.game.transfer_system.get_valid_transfer_targets(self.game.selected_province_id)
 
         if not target_provinces:
-            self.game.add_message("転送可能な隣接領地がありません")
+            self.game.add_message("転送可能な自領地がありません")
             return
+        route_cache = self.game.game_state.route_cache
+        target_hops = [route_cache.get_hops(province.id, target.id) for target in target_provinces]
 
         # 転送可能な最大量を計算
         max_amount = 0
@@ -53,7 +55,8 @@ class TransferHandler:
             resource_type,
             max_amount,
             lambda target_id, amount: self.execute_transfer(resource_type, target_id, amount),
-            lambda: None  # キャンセル時は何もしない
+            lambda: None,  # キャンセル時は何もしない
+            target_hops
         )
 
     def execute_transfer(self, resource_type, target_province_id, amount):
@@ -123,10 +126,7 @@ class TransferHandler:
         if not player_daimyo:
             return
 
-        available_generals = [
-            general for general in self.game.game_state.generals.values()
-            if general.serving_daimyo_id == player_daimyo.id and general.is_available
-        ]
+        available_generals = self.game.game_state.general_registry.get_available(player_daimyo.id)
 
         # 現在配置されている将軍を取得
         current_general = None
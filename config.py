@@ -68,6 +68,7 @@ PROVINCES_DATA = os.path.join(DATA_DIR, "provinces.json")
 DAIMYO_DATA = os.path.join(DATA_DIR, "daimyo.json")
 GENERALS_DATA = os.path.join(DATA_DIR, "generals.json")
 EVENTS_DATA = os.path.join(DATA_DIR, "events.json")
+WIN_TABLE_DATA = os.path.join(DATA_DIR, "win_table.bin")  # 戦闘の勝率表（systems/win_table.py）
 SCENARIOS_DATA = os.path.join(DATA_DIR, "scenarios.json")
 
 # ========================================
@@ -117,6 +118,21 @@ CASTLE_DEFENSE_BONUS = 1.42  # 城防御ボーナス 1+50*(BONUS-1)/100
 MORALE_COMBAT_MODIFIER = 0.02  # 士気50以上で1ポイントあたり2%ボーナス
 GENERAL_SKILL_MODIFIER = 0.01  # 武将戦闘スキル1ポイントあたり1%ボーナス
 
+# 戦闘ラウンド（CombatSystem.resolve_battle / simulate_batch）
+BATTLE_MAX_ROUNDS = 10  # 最大ラウンド数
+BATTLE_DAMAGE_SCALE = 0.5  # ダメージ率の倍率
+ATTACKER_DAMAGE_RATIO = (0.13, 0.09)  # 攻撃側ダメージ率（下限, 乱数幅）: 13-22% × 倍率
+DEFENDER_DAMAGE_RATIO = (0.10, 0.07)  # 防御側ダメージ率（下限, 乱数幅）: 10-17% × 倍率
+EXPEDITION_PENALTY = 0.8  # 攻撃側の戦力倍率（遠征による士気低下）
+RETREAT_TROOP_RATIO = 0.3  # 攻撃側の兵力がこの割合を下回ると撤退判定
+RETREAT_PROBABILITY = 0.3  # 撤退判定で撤退する確率
+
+# 戦闘予測（CombatSystem.predict_battle_outcome）の試行回数
+BATTLE_PREDICTION_TRIALS = 1000
+
+# 勝率表（systems/win_table.py）の1マスあたりの試行回数（上記の戦闘ラウンド定数を変えると自動で作り直す）
+WIN_TABLE_TRIALS = 200
+
 # ========================================
 # AI兵力派遣設定
 # ========================================
@@ -131,9 +147,82 @@ AI_ATTACK_RATIO_THRESHOLDS = {
     # 1.5未満は攻撃中止（勝算なし）
 }
 
+# 勝率表（systems/win_table.py）による攻撃判断
+# True: 攻撃対象・派遣率を勝率表の勝率で決める（上の戦力比閾値と攻撃対象の1.35倍条件の代わり）
+AI_USE_WIN_TABLE = False
+AI_ATTACK_WIN_PROBABILITY = 0.9  # この勝率以上が見込める最小の派遣率で攻撃する
+
+# 探索AI（systems/search_ai.py）
+# True: AI大名の領地ごとのコマンドをモンテカルロ木探索で決める（将軍配置は従来通り）
+AI_USE_SEARCH = False
+AI_SEARCH_DAIMYO_IDS = None  # 探索AIを使う大名IDのリスト（Noneの場合は全AI大名）
+AI_SEARCH_BUDGET_MS = 50  # 1大名あたりの探索時間（Noneの場合は反復回数のみで打ち切る＝再現可能）
+AI_SEARCH_MAX_ITERATIONS = 400  # 1大名あたりの最大反復回数
+AI_SEARCH_HORIZON_TURNS = 1  # プレイアウトで先読みするターン数
+AI_SEARCH_EXPLORATION = 0.5  # UCB1の探索係数
+AI_SEARCH_MAX_CANDIDATES = 6  # 1領地あたりの候補コマンド数（従来AIの選択を含む）
+
+# AIの1ターンあたりの時間予算（ms、Noneの場合は予算なし）
+# 設定すると、AI大名は従来AIの判断を常に行い（全領地の有効な計画）、探索AIによる改善は
+# S3の開始からこの時間までに収める（AI_USE_SEARCH の設定によらず、AI_SEARCH_DAIMYO_IDS の大名を探索で改善する）。
+# 残り時間はまだ手番の来ていない大名で等分し（AI_SEARCH_BUDGET_MS の代わり）、1反復の時間に満たない大名は探索しない
+AI_TURN_BUDGET_MS = None
+
+# 並列計画（core/parallel_planner.py）
+# True: S3の開始時点の状態で全AI大名の行動計画をプロセスプールで並列に作成し、
+#       各大名の手番で計画の入力が変わっていなければそのまま使う（探索AIと併用すると効果がある）
+AI_PARALLEL_PLANNING = False
+AI_PLANNING_WORKERS = None  # ワーカープロセス数（NoneはCPU数）
+
+# 前線への後方支援（core/frontline_field.py）
+# True: 前線から2ホップ以上離れた後方の領地も、前線までの距離場の勾配に沿って
+#       兵士・金・米を前線側の隣接自領地へ送る（False: 前線に隣接する領地だけが前線へ送る）
+AI_FRONTLINE_LOGISTICS = False
+
+# 兵站計画（systems/logistics.py）
+# True: AI大名ごとに毎ターン、後方の余剰（兵士・金・米）を前線の不足へ配る転送を
+#       自領地の隣接関係上の最小費用流でまとめて決める（領地ごとの転送判断の代わり、AI_FRONTLINE_LOGISTICSより優先）
+AI_FLOW_LOGISTICS = False
+
+# 行動の一括評価（systems/action_scoring.py）
+# True: AI大名の全領地 × 全行動のスコアを特徴量と重みの内積でまとめて求め、
+#       領地ごとに実行可能でスコアが最も高い（0より大きい）行動を選ぶ（将軍配置は従来通り）
+AI_USE_SCORING = False
+AI_SCORING_DAIMYO_IDS = None  # 一括評価を使う大名IDのリスト（Noneの場合は全AI大名）
+# 行動 → {特徴量: 重み}（特徴量は systems/action_scoring.py の FEATURES、未指定の重みは0）
+AI_SCORING_WEIGHTS = {
+    "attack": {"bias": -1.0, "strength_ratio": 0.75, "soldiers": 0.5},  # 兵力比1.35倍前後から
+    "recruit": {"bias": 0.1, "enemy_soldiers": 1.35, "soldiers": -1.0, "front_distance": -0.1},
+    "give_rice": {"bias": 1.2, "loyalty": -3.0},  # 忠誠度40未満
+    "cultivate": {"bias": 0.5, "development": -1.0},  # 開発レベル5未満
+    "develop_town": {"bias": 0.45, "town": -0.9},  # 町レベル5未満
+    "flood_control": {"bias": 0.32, "flood_control": -0.4},  # 治水80%未満
+    "transfer_soldiers": {"bias": 0.1, "soldiers": 0.5},  # 後方から前線側へ
+    "transfer_gold": {"gold": 0.3},
+    "transfer_rice": {"rice": 0.2},
+}
+
+# AI判断のキャッシュ（core/decision_cache.py）
+# True: 前線から離れた領地の内政・転送の判断を、判断の閾値で区切った領地の状態（シグネチャ）ごとに保持し、
+#       シグネチャが前回と同じ領地は判断を省いて前回の判断を使う（判断の結果は変わらない）
+AI_DECISION_CACHE = False
+
+# 将軍の配置（systems/general_assignment.py）
+# True: AI大名の空いている将軍と守将のいない領地の組み合わせを、将軍の能力値（前線は武力・統率、
+#       後方は政治・知略を重視）と領地の優先度による効用の合計が最大になるよう割当問題で決める
+#       （False: 能力値の合計の高い将軍から優先度の高い領地へ順に配置）
+AI_OPTIMAL_GENERAL_ASSIGNMENT = False
+
 # 最低守備兵力（攻撃時に領地に残す兵力）
 MIN_GARRISON_TROOPS = 110
 
+# AIプロファイル（systems/ai_profile.py、作成は sim/tuner.py）
+# AIの判断のパラメータ（攻撃・徴兵の兵力比、転送の優先度、派遣率の閾値、最低守備兵力など）の名前付きの組。
+# プロファイルにないパラメータは既定値（上の定数と各判断の従来の値）を使う
+AI_PROFILES_DATA = os.path.join(DATA_DIR, "ai_profiles.json")
+AI_PROFILE = None  # 全AI大名に使うプロファイル名（Noneの場合は既定値）
+AI_DAIMYO_PROFILES = {}  # 大名ID → プロファイル名、またはパラメータの辞書（AI_PROFILEより優先）
+
 # ========================================
 # ゲームバランス定数 - 忠誠度と士気
 # ========================================
@@ -304,3 +393,14 @@ AI_ACTION_DELAY = 2.0  # 2秒の間
 # ========================================
 DEBUG_MODE = True
 SHOW_FPS = True
+
+# チャンネル別ログレベル（debug/log_channels.py）
+# "DEBUG" / "INFO" / "WARNING" / "ERROR" のいずれか
+# ai / transfer の領地ごとの詳細なトレース（[AI DEBUG]・[TRANSFER ...]・[NEIGHBOR DEBUG]）は
+# DEBUGでも全AI操作モード（プレイヤー大名なし）の場合だけ出力する
+LOG_LEVELS = {
+    "ai": "DEBUG" if DEBUG_MODE else "WARNING",        # AIの意思決定
+    "combat": "DEBUG" if DEBUG_MODE else "WARNING",    # 戦闘
+    "transfer": "DEBUG" if DEBUG_MODE else "WARNING",  # 資源転送
+    "turn": "DEBUG" if DEBUG_MODE else "WARNING"       # ターン進行
+}
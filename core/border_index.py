@@ -0,0 +1,151 @@
+"""
+BorderIndex - 国境（前線）索引
+領地ごとに「他勢力の隣接領地数」と「隣接する他勢力領地の最大兵力」を保持し、
+AIの「敵に隣接しているか」の判定を隣接領地の走査なしで返す
+"""
+from typing import Dict, List, Optional, Set
+
+
+class BorderIndex:
+    """国境索引クラス
+
+    - 他勢力の隣接領地数: 所有者の変更時（GameState.set_province_owner）に差分更新
+    - 隣接する他勢力領地の最大兵力: 兵力が変わった領地の隣接領地を「要再計算」にし、
+      問い合わせ時にその領地だけ再計算する
+
+    「他勢力」は領地の所有者と異なる所有者（無所属を含む）を指す。
+    外交関係（同盟・不可侵）は考慮しないため、条約を結んでいる大名は呼び出し側で従来の判定を使う。
+    """
+
+    def __init__(self, game_state):
+        self.game_state = game_state
+        self.ready = False  # rebuild()済みか
+
+        # 領地ID → 他勢力の隣接領地数
+        self.foreign_neighbor_count: Dict[int, int] = {}
+        # 領地ID → 隣接する他勢力領地の最大兵力（要再計算の領地は値が古い）
+        self.max_foreign_soldiers: Dict[int, int] = {}
+        # 最大兵力の再計算が必要な領地ID
+        self.dirty: Set[int] = set()
+        # 領地ID → その領地を隣接リストに含む領地ID（隣接リストが非対称でも正しく更新するため）
+        self.reverse_adjacency: Dict[int, List[int]] = {}
+
+    def rebuild(self):
+        """全領地の索引を作り直す"""
+        provinces = self.game_state.provinces
+        self.foreign_neighbor_count = {}
+        self.max_foreign_soldiers = {}
+        self.dirty = set(provinces.keys())
+        self.game_state.province_store.soldiers_changed.clear()
+
+        self.reverse_adjacency = {province_id: [] for province_id in provinces}
+        for province in provinces.values():
+            for adj_id in province.adjacent_provinces:
+                if adj_id in self.reverse_adjacency:
+                    self.reverse_adjacency[adj_id].append(province.id)
+
+        for province in provinces.values():
+            self.foreign_neighbor_count[province.id] = self._count_foreign_neighbors(province)
+
+        self.ready = True
+
+    def clone(self, game_state) -> "BorderIndex":
+        """分岐したゲーム状態用のコピーを作成（GameState.fork用）"""
+        clone = BorderIndex(game_state)
+        clone.ready = self.ready
+        clone.foreign_neighbor_count = dict(self.foreign_neighbor_count)
+        clone.max_foreign_soldiers = dict(self.max_foreign_soldiers)
+        clone.dirty = set(self.dirty)
+        clone.reverse_adjacency = self.reverse_adjacency  # 隣接関係は変化しないため共有
+        return clone
+
+    # ========================================
+    # 更新
+    # ========================================
+
+    def on_owner_changed(self, province_id: int, old_owner_id: Optional[int], new_owner_id: Optional[int]):
+        """領地の所有者が変わった（GameState.set_province_owner から呼ばれる）"""
+        if not self.ready:
+            return
+
+        provinces = self.game_state.provinces
+        province = provinces[province_id]
+
+        # 自領地の他勢力隣接数は数え直す
+        self.foreign_neighbor_count[province_id] = self._count_foreign_neighbors(province)
+        self.dirty.add(province_id)
+
+        # この領地を隣接に持つ領地から見た「他勢力か」の変化を差分で反映
+        for neighbor_id in self.reverse_adjacency[province_id]:
+            neighbor_owner_id = provinces[neighbor_id].owner_daimyo_id
+            was_foreign = old_owner_id != neighbor_owner_id
+            is_foreign = new_owner_id != neighbor_owner_id
+            if was_foreign != is_foreign:
+                self.foreign_neighbor_count[neighbor_id] += 1 if is_foreign else -1
+            self.dirty.add(neighbor_id)
+
+    def _flush_soldier_changes(self):
+        """兵力が変わった領地の隣接領地を要再計算にする"""
+        changed = self.game_state.province_store.soldiers_changed
+        if not changed:
+            return
+
+        reverse_adjacency = self.reverse_adjacency
+        for province_id in changed:
+            self.dirty.update(reverse_adjacency.get(province_id, ()))
+        changed.clear()
+
+    # ========================================
+    # 問い合わせ
+    # ========================================
+
+    def has_foreign_neighbor(self, province_id: int) -> bool:
+        """他勢力（無所属を含む）の領地に隣接しているか"""
+        if not self.ready:
+            self.rebuild()
+        return self.foreign_neighbor_count[province_id] > 0
+
+    def get_foreign_neighbor_count(self, province_id: int) -> int:
+        """他勢力（無所属を含む）の隣接領地数"""
+        if not self.ready:
+            self.rebuild()
+        return self.foreign_neighbor_count[province_id]
+
+    def get_max_foreign_soldiers(self, province_id: int) -> int:
+        """隣接する他勢力領地の最大兵力（隣接していない場合は0）"""
+        if not self.ready:
+            self.rebuild()
+        self._flush_soldier_changes()
+
+        if province_id in self.dirty:
+            self.max_foreign_soldiers[province_id] = self._compute_max_foreign_soldiers(
+                self.game_state.provinces[province_id]
+            )
+            self.dirty.discard(province_id)
+        return self.max_foreign_soldiers[province_id]
+
+    # ========================================
+    # 計算
+    # ========================================
+
+    def _count_foreign_neighbors(self, province) -> int:
+        """隣接領地を走査して他勢力の領地数を数える"""
+        provinces = self.game_state.provinces
+        owner_id = province.owner_daimyo_id
+        count = 0
+        for adj_id in province.adjacent_provinces:
+            adj = provinces.get(adj_id)
+            if adj and adj.owner_daimyo_id != owner_id:
+                count += 1
+        return count
+
+    def _compute_max_foreign_soldiers(self, province) -> int:
+        """隣接領地を走査して他勢力領地の最大兵力を求める"""
+        provinces = self.game_state.provinces
+        owner_id = province.owner_daimyo_id
+        max_soldiers = 0
+        for adj_id in province.adjacent_provinces:
+            adj = provinces.get(adj_id)
+            if adj and adj.owner_daimyo_id != owner_id and adj.soldiers > max_soldiers:
+                max_soldiers = adj.soldiers
+        return max_soldiers
@@ -0,0 +1,136 @@
+"""
+DecisionCache - AIの領地ごとの判断のメモ化
+前線から離れた領地（他勢力に隣接しない自領地）は軍事コマンドを出さず、内政・転送の判断も
+毎ターン同じ分岐に入ることが多い。判断に使う値を判断の閾値で区切ったシグネチャ
+（金・米の区間、開発・町・治水・忠誠度の閾値判定、転送先候補の状態）を領地ごとに保持し、
+シグネチャが前回と同じ領地は前回の判断をそのまま使う。
+
+シグネチャは SequentialTurnManager._ai_decide_internal_action / _ai_decide_transfer_action の
+閾値だけで区切るため、同じシグネチャの領地の判断は必ず同じになる（結果は変わらない）。
+"""
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+import config
+
+# 判断の閾値（SequentialTurnManager の内政・転送判断と同じ値）
+LOW_LOYALTY = 40
+LOW_LEVEL = 5
+LOW_FLOOD_CONTROL = 80
+TRANSFER_SOLDIERS_MIN = 100   # 兵士転送: 転送元の兵士 > 100
+TRANSFER_GOLD_MIN = 380       # 金転送: 転送元の金 > 380
+TRANSFER_RICE_MIN = 500       # 米転送: 転送元の米 > 500
+TARGET_GOLD_BOUND = 500  # 転送先の金（金転送 < 500）
+# 転送先の兵士の閾値（優先度・兵士転送）はAIのパラメータ（systems/ai_profile.py）から取る
+
+
+class DecisionCache:
+    """AI判断のキャッシュクラス
+
+    - 対象は他勢力に隣接しない自領地だけ（軍事判断は常に「なし」のため、内政判断だけを保持する）
+    - 所有者の変更（GameState.set_province_owner）は、転送先候補（前線までの距離場）と
+      国境索引を通じてシグネチャに反映される。兵站計画（config.AI_FLOW_LOGISTICS）を使う場合は
+      判断が大名ごとの計画に依存するため使わない
+    - ターンごとの (ヒット数, 問い合わせ数) を history に記録する（end_turn）
+    """
+
+    def __init__(self, game_state):
+        self.game_state = game_state
+
+        # 領地ID → (シグネチャ, 判断)
+        self.entries: Dict[int, Tuple[tuple, Dict]] = {}
+
+        # 金・米の区間の境界（境界以上で次の区間）
+        self.gold_bounds = sorted({
+            config.CULTIVATION_COST, config.TOWN_DEVELOPMENT_COST,
+            config.FLOOD_CONTROL_COST, TRANSFER_GOLD_MIN + 1
+        })
+        self.rice_bounds = sorted({config.GIVE_RICE_AMOUNT, TRANSFER_RICE_MIN + 1})
+
+        # 統計（このターンのヒット数・問い合わせ数、ターンごとの記録）
+        self.hits = 0
+        self.lookups = 0
+        self.history: List[Tuple[int, int]] = []
+
+    def clear(self):
+        """全領地の判断を捨てる"""
+        self.entries = {}
+
+    # ========================================
+    # 問い合わせ
+    # ========================================
+
+    def lookup(self, province, daimyo_id: int, params: Dict[str, float]) -> Tuple[Optional[tuple], Optional[Dict]]:
+        """領地のシグネチャと、前回と同じシグネチャなら前回の判断を返す
+
+        Args:
+            params: 大名のAIのパラメータ（SequentialTurnManager._ai_params）
+
+        Returns:
+            (シグネチャ（対象外の領地はNone）, 前回の判断（なければNone）)
+        """
+        signature = self.get_signature(province, daimyo_id, params)
+        if signature is None:
+            return None, None
+
+        self.lookups += 1
+        entry = self.entries.get(province.id)
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            return signature, dict(entry[1])
+        return signature, None
+
+    def store(self, province_id: int, signature: Optional[tuple], action: Dict):
+        """判断を保持（lookup で得たシグネチャと組にする）"""
+        if signature is not None:
+            self.entries[province_id] = (signature, dict(action))
+
+    def end_turn(self) -> Tuple[int, int]:
+        """このターンの (ヒット数, 問い合わせ数) を記録してリセット"""
+        record = (self.hits, self.lookups)
+        self.history.append(record)
+        self.hits = 0
+        self.lookups = 0
+        return record
+
+    # ========================================
+    # シグネチャ
+    # ========================================
+
+    def get_signature(self, province, daimyo_id: int, params: Dict[str, float]) -> Optional[tuple]:
+        """判断の閾値で区切った領地の状態（対象外の領地はNone、数値は領地ストアの列から直接読む）"""
+        if config.AI_FLOW_LOGISTICS:
+            return None
+        game_state = self.game_state
+        store = game_state.province_store
+        columns = store.columns
+        row = store.rows[province.id]
+        if columns["owner_daimyo_id"][row] != daimyo_id or game_state.border_index.has_foreign_neighbor(province.id):
+            return None
+
+        # 転送先の候補（前線へ向かう隣接自領地）の状態
+        hops = ()
+        distances, next_hops = game_state.frontline_field.get_field(daimyo_id)
+        distance = distances.get(province.id)
+        if distance is not None and (distance <= 1 or config.AI_FRONTLINE_LOGISTICS):
+            provinces = game_state.provinces
+            soldiers = columns["soldiers"]
+            gold = columns["gold"]
+            soldier_bounds = sorted((params["transfer_weak_soldiers"], params["transfer_soldier_target"]))
+            hops = tuple(
+                (target_id, provinces[target_id].has_castle,
+                 bisect_right(soldier_bounds, soldiers[store.rows[target_id]]),
+                 gold[store.rows[target_id]] < TARGET_GOLD_BOUND)
+                for target_id in next_hops.get(province.id, ())
+            )
+
+        return (
+            bisect_right(self.gold_bounds, columns["gold"][row]),
+            bisect_right(self.rice_bounds, columns["rice"][row]),
+            columns["peasant_loyalty"][row] < LOW_LOYALTY,
+            columns["development_level"][row] < LOW_LEVEL,
+            columns["town_level"][row] < LOW_LEVEL,
+            province.flood_control < LOW_FLOOD_CONTROL,
+            columns["soldiers"][row] > TRANSFER_SOLDIERS_MIN,
+            hops,
+        )
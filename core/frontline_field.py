@@ -0,0 +1,123 @@
+"""
+FrontlineField - 前線までの距離場
+大名ごとに「自領地だけを通って前線（他勢力に隣接する自領地）まで何ホップか」を
+全前線領地を起点とする1回の幅優先探索で求め、前線へ向かう隣接自領地（勾配の方向）とともに保持する。
+AIの転送判断で「隣接領地の隣接領地」を走査せずに転送先を決めるためのもの。
+"""
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+# 距離場: (領地ID → 前線までのホップ数, 領地ID → 前線へ向かう隣接自領地のIDリスト)
+Field = Tuple[Dict[int, int], Dict[int, List[int]]]
+
+
+class FrontlineField:
+    """前線距離場クラス
+
+    - 距離場は大名ごとに初回の問い合わせ時に作る（所有者が変わらなければターンをまたいで使う）
+    - 所有者の変更時（GameState.set_province_owner）は旧所有者と新所有者の距離場だけを捨てる
+      （他勢力の領地どうしの所有者の入れ替わりは、どちらも「他勢力」のため前線を変えない）
+
+    前線の判定は国境索引（BorderIndex）と同じく外交関係を考慮しない。
+    前線へ向かう隣接自領地は、前線上の領地（距離0）では隣接する前線上の自領地、
+    それ以外では距離が1小さい隣接自領地（隣接リストの順）とする。
+    """
+
+    def __init__(self, game_state):
+        self.game_state = game_state
+
+        # 大名ID → 距離場
+        self.fields: Dict[int, Field] = {}
+
+    def clone(self, game_state) -> "FrontlineField":
+        """分岐したゲーム状態用のコピーを作成（GameState.fork用、作成済みの距離場は変更しないため共有）"""
+        clone = FrontlineField(game_state)
+        clone.fields = dict(self.fields)
+        return clone
+
+    # ========================================
+    # 更新
+    # ========================================
+
+    def on_owner_changed(self, province_id: int, old_owner_id: Optional[int], new_owner_id: Optional[int]):
+        """領地の所有者が変わった（GameState.set_province_owner から呼ばれる）"""
+        self.fields.pop(old_owner_id, None)
+        self.fields.pop(new_owner_id, None)
+
+    def clear(self):
+        """全大名の距離場を捨てる"""
+        self.fields = {}
+
+    # ========================================
+    # 問い合わせ
+    # ========================================
+
+    def get_distance(self, province_id: int) -> Optional[int]:
+        """前線までのホップ数（前線上は0、前線に到達できない・無所属の領地はNone）"""
+        field = self._get_field(province_id)
+        if field is None:
+            return None
+        return field[0].get(province_id)
+
+    def get_next_hops(self, province_id: int) -> List[int]:
+        """前線へ向かう隣接自領地のID（前線上の領地では隣接する前線上の自領地）"""
+        field = self._get_field(province_id)
+        if field is None:
+            return []
+        return field[1].get(province_id, [])
+
+    def get_field(self, daimyo_id: int) -> Field:
+        """大名の距離場を取得（未作成なら作る、全領地をまとめて引く場合用）"""
+        field = self.fields.get(daimyo_id)
+        if field is None:
+            field = self._build_field(daimyo_id)
+            self.fields[daimyo_id] = field
+        return field
+
+    # ========================================
+    # 計算
+    # ========================================
+
+    def _get_field(self, province_id: int) -> Optional[Field]:
+        """領地の所有者の距離場を取得（未作成なら作る）"""
+        province = self.game_state.provinces.get(province_id)
+        if province is None or province.owner_daimyo_id is None:
+            return None
+        return self.get_field(province.owner_daimyo_id)
+
+    def _build_field(self, daimyo_id: int) -> Field:
+        """全前線領地を起点とする幅優先探索（自領地だけを通る）"""
+        game_state = self.game_state
+        provinces = game_state.provinces
+        border_index = game_state.border_index
+        owned = sorted(game_state.provinces_by_owner.get(daimyo_id, ()))
+
+        distance = {}
+        queue = deque()
+        for province_id in owned:
+            if border_index.has_foreign_neighbor(province_id):
+                distance[province_id] = 0
+                queue.append(province_id)
+
+        while queue:
+            province_id = queue.popleft()
+            next_distance = distance[province_id] + 1
+            for adj_id in provinces[province_id].adjacent_provinces:
+                if adj_id in distance:
+                    continue
+                adj = provinces.get(adj_id)
+                if adj is None or adj.owner_daimyo_id != daimyo_id:
+                    continue
+                distance[adj_id] = next_distance
+                queue.append(adj_id)
+
+        # 前線へ向かう隣接自領地（勾配の方向）
+        next_hops = {}
+        for province_id, d in distance.items():
+            wanted = d - 1 if d > 0 else 0
+            next_hops[province_id] = [
+                adj_id for adj_id in provinces[province_id].adjacent_provinces
+                if adj_id != province_id and distance.get(adj_id) == wanted
+            ]
+
+        return distance, next_hops
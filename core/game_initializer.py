@@ -4,7 +4,6 @@
 ゲームシステムの初期化とUIコンポーネントの作成を担当
 """
 import os
-import pygame
 import config
 from core.game_state import GameState
 from core.sequential_turn_manager import SequentialTurnManager
@@ -16,18 +15,9 @@ from systems.diplomacy import DiplomacySystem
 from systems.ai import AISystem
 from systems.events import EventSystem
 from systems.transfer_system import TransferSystem
-from ui.widgets import Button
-from ui.event_dialog import EventDialog
-from ui.event_history_screen import EventHistoryScreen
-from ui.battle_animation import BattleAnimationScreen
-from ui.battle_preview import BattlePreviewScreen
-from ui.power_map import PowerMap
-from ui.transfer_dialog import TransferDialog
-from ui.general_assign_dialog import GeneralAssignDialog
-from ui.daimyo_death_screen import DaimyoDeathScreen
-from utils.image_manager import ImageManager
-from utils.sound_manager import SoundManager
-from utils.bgm_manager import BGMManager
+
+# pygame・UI・リソース管理は各関数内でimportする
+# （initialize_game_systemsはヘッドレス実行でも使うため、pygameに依存させない）
 
 
 def initialize_pygame():
@@ -36,6 +26,8 @@ def initialize_pygame():
     Returns:
         tuple: (screen, clock, font_large, font_medium, font_small)
     """
+    import pygame
+
     pygame.init()
 
     # 画面の設定
@@ -64,6 +56,10 @@ def initialize_managers():
     Returns:
         tuple: (image_manager, sound_manager, bgm_manager)
     """
+    from utils.image_manager import ImageManager
+    from utils.sound_manager import SoundManager
+    from utils.bgm_manager import BGMManager
+
     assets_path = os.path.join(config.BASE_DIR, "assets")
 
     # 画像管理の初期化
@@ -80,9 +76,14 @@ def initialize_managers():
     return image_manager, sound_manager, bgm_manager
 
 
-def initialize_game_systems():
+def initialize_game_systems(all_ai: bool = False, seed=None, independent_rng_streams: bool = False):
     """ゲームシステムの初期化
 
+    Args:
+        all_ai: Trueの場合、プレイヤー大名を置かず全大名をAI操作にする
+        seed: 乱数シード（Noneの場合はランダム、game_state.seedで確認できる）
+        independent_rng_streams: Trueの場合、戦闘・イベント・AI・加齢で独立した乱数列を使う
+
     Returns:
         dict: 各種ゲームシステムを含む辞書
             - game_state: GameState
@@ -97,9 +98,25 @@ def initialize_game_systems():
             - event_system: EventSystem
     """
     # ゲーム状態の初期化
-    game_state = GameState()
-    game_state.load_game_data()
+    game_state = GameState(seed, independent_rng_streams)
+    game_state.load_game_data(all_ai=all_ai)
+
+    return create_game_systems(game_state)
+
+
+def create_game_systems(game_state, events=None):
+    """既存のゲーム状態に対してゲームシステム一式を作成
 
+    GameState.fork() で分岐した状態を先読みシミュレーションする場合などに使う。
+
+    Args:
+        game_state: ゲーム状態
+        events: 読み込み済みのイベントリスト（List[GameEvent]、読み取り専用として共有）。
+            Noneの場合はconfig.EVENTS_DATAから読み込む
+
+    Returns:
+        dict: initialize_game_systems() と同じ構成の辞書
+    """
     # 基本システムの初期化
     economy_system = EconomySystem(game_state)
     internal_affairs = InternalAffairsSystem(game_state)
@@ -122,7 +139,10 @@ def initialize_game_systems():
 
     # イベントシステム
     event_system = EventSystem(game_state)
-    event_system.load_events_from_file(config.EVENTS_DATA)
+    if events is None:
+        event_system.load_events_from_file(config.EVENTS_DATA)
+    else:
+        event_system.events = events
     event_system.general_pool = game_state.general_pool
 
     # SequentialTurnManagerにシステムを設定
@@ -163,6 +183,14 @@ def create_ui_components(screen, font_large, font_medium, font_small,
     Returns:
         dict: UIコンポーネントを含む辞書
     """
+    from ui.event_dialog import EventDialog
+    from ui.event_history_screen import EventHistoryScreen
+    from ui.battle_animation import BattleAnimationScreen
+    from ui.battle_preview import BattlePreviewScreen
+    from ui.transfer_dialog import TransferDialog
+    from ui.general_assign_dialog import GeneralAssignDialog
+    from ui.daimyo_death_screen import DaimyoDeathScreen
+
     return {
         'event_dialog': EventDialog(screen, font_medium, sound_manager),
         'event_history_screen': EventHistoryScreen(screen, font_medium, sound_manager),
@@ -187,6 +215,8 @@ def create_buttons(font_medium, font_small, sound_manager, game_instance):
     Returns:
         dict: ボタンオブジェクトを含む辞書
     """
+    from ui.widgets import Button
+
     button_y = config.SCREEN_HEIGHT - 50
     buttons = {}
 
@@ -2,28 +2,66 @@
 GameState - ゲーム状態管理
 全ての領地、大名、武将、軍隊を管理
 """
+import heapq
 import json
-from typing import Dict, List, Optional
-from models.province import Province
+import random
+from typing import Dict, List, Optional, Set, Tuple
+from models.province import Province, ProvinceStore
 from models.daimyo import Daimyo
 from models.general import General
 from models.army import Army
 from models.diplomacy import DiplomaticRelation
+from core.border_index import BorderIndex
+from core.frontline_field import FrontlineField
+from core.general_registry import GeneralRegistry
+from core.route_cache import RouteCache
 import config
 
 
 class GameState:
     """ゲーム状態を管理するメインクラス"""
 
-    def __init__(self):
+    # 独立させられる乱数サブストリーム
+    RNG_STREAMS = ("combat", "events", "ai", "characters")
+    # 常に独立した乱数サブストリーム（戦闘予測など、対局の進行に影響させない用途）
+    DETACHED_RNG_STREAMS = ("forecast",)
+
+    def __init__(self, seed: Optional[int] = None, independent_rng_streams: bool = False):
+        """
+        Args:
+            seed: 乱数シード（Noneの場合はランダムに決め、self.seedに記録する）
+            independent_rng_streams: Trueの場合、戦闘・イベント・AI・加齢で独立した乱数列を使う
+        """
         # ========================================
         # ゲームエンティティ
         # ========================================
         self.provinces: Dict[int, Province] = {}
+        self.province_store = ProvinceStore()  # 領地の数値フィールド（列形式）
+
+        # 所有者 → 領地IDの索引（set_province_owner()でのみ更新する）
+        self.provinces_by_owner: Dict[int, Set[int]] = {}
+
+        # 国境索引（他勢力の隣接領地数・隣接する他勢力の最大兵力）
+        self.border_index = BorderIndex(self)
+        # 自領地間の経路キャッシュ（複数の自領地を経由する転送用）
+        self.route_cache = RouteCache(self)
+        # 前線までの距離場（AIの転送判断用）
+        self.frontline_field = FrontlineField(self)
         self.daimyo: Dict[int, Daimyo] = {}
         self.generals: Dict[int, General] = {}
+        # 将軍の索引（仕える大名・配属先・空いているか、add_general/remove_generalと将軍の状態変更で更新）
+        self.general_registry = GeneralRegistry(self)
         self.armies: Dict[int, Army] = {}
         self.diplomatic_relations: List[DiplomaticRelation] = []
+        # (小さい大名ID, 大きい大名ID) → 外交関係
+        self.relation_index: Dict[Tuple[int, int], DiplomaticRelation] = {}
+
+        # 条約期限: 条約クロック（update_treatiesの呼び出し回数）と
+        # (期限, 大名ID, 大名ID) の最小ヒープ
+        self.treaty_clock = 0
+        self.treaty_expiry_heap: List[Tuple[int, int, int]] = []
+        # 大名ID → 締結中の条約（同盟・不可侵）の数
+        self.treaty_counts: Dict[int, int] = {}
 
         # ========================================
         # ゲーム進行
@@ -52,8 +90,21 @@ class GameState:
         # command_stats[daimyo_id][province_id][command_type] = count
         self.command_stats: Dict[int, Dict[int, Dict[str, int]]] = {}
 
-    def load_game_data(self):
-        """JSONファイルからゲームデータを読み込む"""
+        # ========================================
+        # 乱数（ゲームごとに独立、シードで再現可能）
+        # ========================================
+        self.seed: int = 0
+        self.rng = random.Random()
+        self.independent_rng_streams = False
+        self._rng_streams: Dict[str, random.Random] = {}
+        self.seed_rng(seed, independent_rng_streams)
+
+    def load_game_data(self, all_ai: bool = False):
+        """JSONファイルからゲームデータを読み込む
+
+        Args:
+            all_ai: Trueの場合、プレイヤー大名を置かず全大名をAI操作にする
+        """
         # Windowsのコンソール出力問題を回避
         try:
             print("ゲームデータを読み込んでいます...")
@@ -64,7 +115,7 @@ class GameState:
         self._load_provinces()
 
         # 大名データの読み込み
-        self._load_daimyo()
+        self._load_daimyo(all_ai)
 
         # 武将データの読み込み
         self._load_generals()
@@ -72,6 +123,12 @@ class GameState:
         # 外交関係の初期化
         self._initialize_diplomacy()
 
+        # 国境索引の構築
+        self.border_index.rebuild()
+        self.route_cache.clear()
+        self.frontline_field.clear()
+        self.general_registry.rebuild()
+
         # 将軍プールの初期化
         from systems.general_pool import GeneralPool
         self.general_pool = GeneralPool(self)
@@ -93,14 +150,15 @@ class GameState:
                 name=province_data["name"],
                 position=tuple(province_data["position"]),
                 terrain_type=province_data.get("terrain", config.TERRAIN_PLAINS),
-                max_peasants=province_data.get("max_peasants", 8000)
+                max_peasants=province_data.get("max_peasants", 8000),
+                store=self.province_store
             )
             province.adjacent_provinces = province_data.get("adjacent", [])
             province.has_castle = province_data.get("has_castle", True)
 
             self.provinces[province.id] = province
 
-    def _load_daimyo(self):
+    def _load_daimyo(self, all_ai: bool = False):
         """大名データを読み込み、領地を割り当てる"""
         with open(config.DAIMYO_DATA, 'r', encoding='utf-8') as f:
             data = json.load(f)
@@ -110,8 +168,7 @@ class GameState:
                 daimyo_id=daimyo_data["id"],
                 name=daimyo_data["name"],
                 clan_name=daimyo_data["clan"],
-                is_player=(i == 0)  # 最初の大名をプレイヤーとする
-                #is_player=False  # すべてAI操作でデバッグ
+                is_player=(i == 0 and not all_ai)  # 最初の大名をプレイヤーとする（all_ai時は全てAI）
             )
 
             # 能力値を設定
@@ -135,14 +192,12 @@ class GameState:
             if starting_provinces and starting_provinces[0] in self.provinces:
                 daimyo.capital_province_id = starting_provinces[0]
 
+            self.daimyo[daimyo.id] = daimyo
+
             # すべての開始領地を割り当て
             for province_id in starting_provinces:
                 if province_id in self.provinces:
-                    province = self.provinces[province_id]
-                    province.owner_daimyo_id = daimyo.id
-                    daimyo.add_province(province_id)
-
-            self.daimyo[daimyo.id] = daimyo
+                    self.set_province_owner(province_id, daimyo.id)
 
             if daimyo.is_player:
                 self.player_daimyo_id = daimyo.id
@@ -177,7 +232,83 @@ class GameState:
                 relation = DiplomaticRelation(daimyo_a_id, daimyo_b_id)
                 # 初期関係値はランダムまたは中立
                 relation.set_relation(0)
-                self.diplomatic_relations.append(relation)
+                self.add_diplomatic_relation(relation)
+
+    def seed_rng(self, seed: Optional[int] = None, independent_streams: bool = False):
+        """乱数を初期化
+
+        Args:
+            seed: 乱数シード（Noneの場合はランダムに決め、self.seedに記録する）
+            independent_streams: Trueの場合、用途ごとに独立した乱数列を使う
+                （戦闘の回数が変わってもイベントの乱数列がずれない）
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.independent_rng_streams = independent_streams
+        self._rng_streams = {}
+
+        if independent_streams:
+            for stream in self.RNG_STREAMS:
+                self._rng_streams[stream] = random.Random(f"{seed}:{stream}")
+        for stream in self.DETACHED_RNG_STREAMS:
+            self._rng_streams[stream] = random.Random(f"{seed}:{stream}")
+
+    def get_rng(self, stream: str) -> random.Random:
+        """用途別の乱数生成器を取得（combat / events / ai / characters / forecast）
+
+        独立ストリームが無効の場合は forecast 以外の全用途で同じ乱数生成器を返す
+        """
+        return self._rng_streams.get(stream, self.rng)
+
+    def fork(self) -> "GameState":
+        """独立したゲーム状態のコピーを作成（先読み・仮想シミュレーション用）
+
+        copy.deepcopyやto_dict/from_dictを経由せず、各モデルのclone()で
+        インスタンス辞書を直接コピーする。ゲーム中に変化しないデータ
+        （隣接リスト・座標など）は元の状態と共有する。
+        乱数は現在の内部状態ごとコピーするため、元の状態と同じ乱数列を引き継ぐ。
+        """
+        forked = GameState.__new__(GameState)
+        forked.__dict__.update(self.__dict__)
+
+        forked.province_store = self.province_store.clone()
+        forked.provinces = {pid: p.clone(forked.province_store) for pid, p in self.provinces.items()}
+        forked.daimyo = {did: d.clone() for did, d in self.daimyo.items()}
+        forked.generals = {gid: g.clone() for gid, g in self.generals.items()}
+        forked.general_registry = self.general_registry.clone(forked)
+        forked.armies = {aid: a.clone() for aid, a in self.armies.items()}
+        forked.diplomatic_relations = [r.clone() for r in self.diplomatic_relations]
+        forked.relation_index = {
+            self._relation_key(r.daimyo_a_id, r.daimyo_b_id): r for r in forked.diplomatic_relations
+        }
+        forked.treaty_expiry_heap = list(self.treaty_expiry_heap)
+        forked.treaty_counts = dict(self.treaty_counts)
+        forked.border_index = self.border_index.clone(forked)
+        forked.route_cache = self.route_cache.clone(forked)
+        forked.frontline_field = self.frontline_field.clone(forked)
+
+        if self.general_pool is not None:
+            forked.general_pool = self.general_pool.clone(forked)
+
+        forked.provinces_by_owner = {did: set(ids) for did, ids in self.provinces_by_owner.items()}
+
+        forked.command_stats = {
+            did: {pid: dict(commands) for pid, commands in provinces.items()}
+            for did, provinces in self.command_stats.items()
+        }
+
+        # 乱数の内部状態をコピー
+        forked.rng = random.Random()
+        forked.rng.setstate(self.rng.getstate())
+        forked._rng_streams = {}
+        for stream, rng in self._rng_streams.items():
+            forked._rng_streams[stream] = random.Random()
+            forked._rng_streams[stream].setstate(rng.getstate())
+
+        return forked
 
     def get_province(self, province_id: int) -> Optional[Province]:
         """IDで領地を取得"""
@@ -191,6 +322,18 @@ class GameState:
         """IDで武将を取得"""
         return self.generals.get(general_id)
 
+    def add_general(self, general: General):
+        """武将を追加（将軍の索引に登録する）"""
+        self.generals[general.id] = general
+        general._registry = self.general_registry
+        self.general_registry.update(general)
+
+    def remove_general(self, general_id: int):
+        """武将を削除（討死など、将軍の索引からも削除する）"""
+        general = self.generals.pop(general_id, None)
+        if general is not None:
+            self.general_registry.remove(general)
+
     def get_player_daimyo(self) -> Optional[Daimyo]:
         """プレイヤー大名を取得"""
         if self.player_daimyo_id:
@@ -202,25 +345,94 @@ class GameState:
         if not self.player_daimyo_id:
             return []
 
-        return [
-            province for province in self.provinces.values()
-            if province.owner_daimyo_id == self.player_daimyo_id
-        ]
+        return self.get_daimyo_provinces(self.player_daimyo_id)
 
     def get_daimyo_provinces(self, daimyo_id: int) -> List[Province]:
-        """特定の大名の領地リストを取得"""
-        return [
-            province for province in self.provinces.values()
-            if province.owner_daimyo_id == daimyo_id
-        ]
+        """特定の大名の領地リストを取得（領地ID順）"""
+        province_ids = self.provinces_by_owner.get(daimyo_id)
+        if not province_ids:
+            return []
+        return [self.provinces[pid] for pid in sorted(province_ids)]
+
+    def get_province_count(self, daimyo_id: int) -> int:
+        """特定の大名の支配領地数を取得"""
+        province_ids = self.provinces_by_owner.get(daimyo_id)
+        return len(province_ids) if province_ids else 0
+
+    def set_province_owner(self, province_id: int, new_owner_id: Optional[int]):
+        """領地の所有者を変更（所有権の変更は必ずこのメソッドを通す）
+
+        領地の owner_daimyo_id、所有者索引、大名の controlled_provinces をまとめて更新する。
+
+        Args:
+            province_id: 領地ID
+            new_owner_id: 新しい所有大名ID（Noneの場合は無所属）
+        """
+        province = self.provinces[province_id]
+        old_owner_id = province.owner_daimyo_id
+        if old_owner_id == new_owner_id:
+            return
+
+        if old_owner_id is not None:
+            owned = self.provinces_by_owner.get(old_owner_id)
+            if owned is not None:
+                owned.discard(province_id)
+                if not owned:
+                    del self.provinces_by_owner[old_owner_id]
+            old_daimyo = self.daimyo.get(old_owner_id)
+            if old_daimyo:
+                old_daimyo.remove_province(province_id)
+
+        if new_owner_id is not None:
+            self.provinces_by_owner.setdefault(new_owner_id, set()).add(province_id)
+            new_daimyo = self.daimyo.get(new_owner_id)
+            if new_daimyo:
+                new_daimyo.add_province(province_id)
+
+        province.owner_daimyo_id = new_owner_id
+        self.border_index.on_owner_changed(province_id, old_owner_id, new_owner_id)
+        self.route_cache.on_owner_changed(province_id, old_owner_id, new_owner_id)
+        self.frontline_field.on_owner_changed(province_id, old_owner_id, new_owner_id)
+
+    @staticmethod
+    def _relation_key(daimyo_a_id: int, daimyo_b_id: int) -> Tuple[int, int]:
+        """外交関係の索引キー（大名IDの小さい順）"""
+        if daimyo_a_id < daimyo_b_id:
+            return daimyo_a_id, daimyo_b_id
+        return daimyo_b_id, daimyo_a_id
+
+    def add_diplomatic_relation(self, relation: DiplomaticRelation):
+        """外交関係を追加（索引にも登録）"""
+        self.diplomatic_relations.append(relation)
+        self.relation_index[self._relation_key(relation.daimyo_a_id, relation.daimyo_b_id)] = relation
 
     def get_diplomatic_relation(self, daimyo_a_id: int, daimyo_b_id: int) -> Optional[DiplomaticRelation]:
         """2つの大名間の外交関係を取得"""
-        for relation in self.diplomatic_relations:
-            if ((relation.daimyo_a_id == daimyo_a_id and relation.daimyo_b_id == daimyo_b_id) or
-                    (relation.daimyo_a_id == daimyo_b_id and relation.daimyo_b_id == daimyo_a_id)):
-                return relation
-        return None
+        if daimyo_a_id is None or daimyo_b_id is None:
+            return None
+        return self.relation_index.get(self._relation_key(daimyo_a_id, daimyo_b_id))
+
+    def schedule_treaty_expiry(self, relation: DiplomaticRelation, duration: int):
+        """条約の期限を登録（duration回後のupdate_treatiesで期限切れになる）"""
+        if relation.treaty_expires_at is None:
+            for daimyo_id in (relation.daimyo_a_id, relation.daimyo_b_id):
+                self.treaty_counts[daimyo_id] = self.treaty_counts.get(daimyo_id, 0) + 1
+        relation.treaty_expires_at = self.treaty_clock + duration
+        daimyo_a_id, daimyo_b_id = self._relation_key(relation.daimyo_a_id, relation.daimyo_b_id)
+        heapq.heappush(self.treaty_expiry_heap, (relation.treaty_expires_at, daimyo_a_id, daimyo_b_id))
+
+    def end_treaty(self, relation: DiplomaticRelation):
+        """条約を終了（期限切れ・宣戦布告）。期限ヒープの登録は期限到来時に読み捨てる"""
+        relation.treaty_duration = 0
+        if relation.treaty_expires_at is None:
+            return
+        relation.treaty_expires_at = None
+        for daimyo_id in (relation.daimyo_a_id, relation.daimyo_b_id):
+            self.treaty_counts[daimyo_id] -= 1
+
+    def has_active_treaty(self, daimyo_id: int) -> bool:
+        """同盟・不可侵条約を1つ以上締結しているか"""
+        return self.treaty_counts.get(daimyo_id, 0) > 0
 
     def get_season_name(self) -> str:
         """現在の季節名を取得"""
@@ -237,11 +449,15 @@ class GameState:
 
     def check_victory_conditions(self) -> Optional[int]:
         """勝利条件をチェック（勝者のdaimyo_idを返す、なければNone）"""
-        alive_daimyo = [d for d in self.daimyo.values() if d.is_alive and len(d.controlled_provinces) > 0]
+        # 領地を持つ大名だけを所有者索引から調べる（領地数に依存しない）
+        alive_daimyo = [
+            self.daimyo[did] for did in self.provinces_by_owner
+            if did in self.daimyo and self.daimyo[did].is_alive
+        ]
 
         # すべての領地を支配
         for daimyo in alive_daimyo:
-            if len(daimyo.controlled_provinces) == len(self.provinces):
+            if len(self.provinces_by_owner[daimyo.id]) == len(self.provinces):
                 return daimyo.id
 
         # 他のすべてのライバルを排除
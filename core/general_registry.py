@@ -0,0 +1,121 @@
+"""
+GeneralRegistry - 将軍の索引
+将軍を「仕える大名」「配属先の領地」「空いているか（未配属）」で索引し、
+「大名Xの空いている将軍を能力値順に」のような問い合わせを全将軍の走査なしで返す
+"""
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class GeneralRegistry:
+    """将軍の索引クラス
+
+    - 将軍の状態（仕える大名・配属先・空いているか）の変更は General から通知される
+      （serving_daimyo_id の代入、assign_to_province / unassign）。
+      登用・浪人化（GeneralPool）もこの経路で反映される
+    - 将軍の追加・削除（討死）は GameState.add_general / remove_general で行う
+    - 空いている将軍は大名ごとに能力値の合計の高い順（同点はID順）に保持する。
+      能力値はゲーム中に変化しないため、並び順は追加時のまま使う
+
+    仕える大名のない将軍（浪人）は大名ID None で索引する。
+    """
+
+    def __init__(self, game_state):
+        self.game_state = game_state
+
+        # 大名ID → 仕える将軍ID
+        self.serving: Dict[Optional[int], Set[int]] = {}
+        # 大名ID → 空いている将軍の (-能力値の合計, 将軍ID) の昇順リスト
+        self.available: Dict[Optional[int], List[Tuple[int, int]]] = {}
+        # 領地ID → 配属されている将軍ID
+        self.assigned: Dict[int, Set[int]] = {}
+        # 将軍ID → 索引に登録した (大名ID, 空いているか, 配属先の領地ID)
+        self.states: Dict[int, Tuple[Optional[int], bool, Optional[int]]] = {}
+
+    def rebuild(self):
+        """全将軍の索引を作り直す"""
+        self.serving = {}
+        self.available = {}
+        self.assigned = {}
+        self.states = {}
+        for general in self.game_state.generals.values():
+            general._registry = self
+            self.update(general)
+
+    def clone(self, game_state) -> "GeneralRegistry":
+        """分岐したゲーム状態用のコピーを作成（GameState.fork用、分岐先の将軍から通知を受ける）"""
+        clone = GeneralRegistry(game_state)
+        clone.serving = {daimyo_id: set(ids) for daimyo_id, ids in self.serving.items()}
+        clone.available = {daimyo_id: list(keys) for daimyo_id, keys in self.available.items()}
+        clone.assigned = {province_id: set(ids) for province_id, ids in self.assigned.items()}
+        clone.states = dict(self.states)
+        for general in game_state.generals.values():
+            general._registry = clone
+        return clone
+
+    # ========================================
+    # 更新
+    # ========================================
+
+    def update(self, general):
+        """将軍の現在の状態を索引に反映（変化がなければ何もしない）"""
+        state = (general.serving_daimyo_id, general.is_available, general.current_province_id)
+        old_state = self.states.get(general.id)
+        if state == old_state:
+            return
+        if old_state is not None:
+            self._unindex(general.id, old_state, self._sort_key(general))
+        self._index(general.id, state, self._sort_key(general))
+
+    def remove(self, general):
+        """将軍を索引から削除（GameState.remove_general から呼ぶ）"""
+        state = self.states.get(general.id)
+        if state is not None:
+            self._unindex(general.id, state, self._sort_key(general))
+        general._registry = None
+
+    def _index(self, general_id: int, state: tuple, key: Tuple[int, int]):
+        daimyo_id, is_available, province_id = state
+        self.serving.setdefault(daimyo_id, set()).add(general_id)
+        if is_available:
+            insort(self.available.setdefault(daimyo_id, []), key)
+        if province_id is not None:
+            self.assigned.setdefault(province_id, set()).add(general_id)
+        self.states[general_id] = state
+
+    def _unindex(self, general_id: int, state: tuple, key: Tuple[int, int]):
+        daimyo_id, is_available, province_id = state
+        self.serving[daimyo_id].discard(general_id)
+        if is_available:
+            keys = self.available[daimyo_id]
+            del keys[bisect_left(keys, key)]
+        if province_id is not None:
+            self.assigned[province_id].discard(general_id)
+        del self.states[general_id]
+
+    @staticmethod
+    def _sort_key(general) -> Tuple[int, int]:
+        return (-(general.war_skill + general.leadership + general.politics + general.intelligence), general.id)
+
+    # ========================================
+    # 問い合わせ
+    # ========================================
+
+    def get_generals(self, daimyo_id: Optional[int]) -> List:
+        """大名に仕える将軍（ID順）"""
+        generals = self.game_state.generals
+        return [generals[general_id] for general_id in sorted(self.serving.get(daimyo_id, ()))]
+
+    def get_available(self, daimyo_id: Optional[int]) -> List:
+        """大名の空いている将軍（能力値の合計の高い順、同点はID順）"""
+        generals = self.game_state.generals
+        return [generals[general_id] for _, general_id in self.available.get(daimyo_id, ())]
+
+    def get_available_count(self, daimyo_id: Optional[int]) -> int:
+        """大名の空いている将軍の数"""
+        return len(self.available.get(daimyo_id, ()))
+
+    def get_assigned(self, province_id: int) -> List:
+        """領地に配属されている将軍（ID順）"""
+        generals = self.game_state.generals
+        return [generals[general_id] for general_id in sorted(self.assigned.get(province_id, ()))]
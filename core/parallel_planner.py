@@ -0,0 +1,217 @@
+"""
+ParallelPlanner - S3のAI大名の行動計画を並列に作成
+
+S3の開始時点のゲーム状態（スナップショット）を全AI大名に渡し、プロセスプールで
+それぞれの行動計画（領地ID → コマンド）を同時に作成する。
+計画は各大名の手番で検証してから使う。計画の入力（自領地と隣接領地の数値・守将、
+全領地の所有者、配置可能な武将、外交関係）が手番の時点で作成時と一致しない場合
+（先に行動した大名の占領・転送・徴兵など）は、その大名だけ従来通りその場で決め直す。
+
+従来AI（探索AIを使わない大名）の計画は入力が一致すれば逐次実行と同じコマンドになるため、
+並列化しても対局の結果は変わらない。計画の作成が重い探索AI（config.AI_USE_SEARCH）で効果がある。
+"""
+import multiprocessing
+import os
+import pickle
+import random
+from typing import Dict, List, Optional, Tuple
+
+import config
+from debug.log_channels import get_logger
+from models.province import ProvinceStore
+
+logger = get_logger("ai")
+
+# シグネチャに含める領地の数値（地形は変化しないため除く）
+SIGNATURE_FIELDS = tuple(column for column in ProvinceStore.COLUMNS if column != "terrain_code")
+
+# ワーカープロセスで使うイベントリスト（プールの初期化時に設定）
+_worker_events: List = []
+
+
+class ParallelPlanner:
+    """S3の行動計画を並列に作成するクラス"""
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Args:
+            workers: ワーカープロセス数（Noneの場合は config.AI_PLANNING_WORKERS、それもNoneならCPU数）
+        """
+        if workers is None:
+            workers = config.AI_PLANNING_WORKERS or os.cpu_count() or 1
+        self.workers = workers
+        self._pool = None
+
+        # 直前のターンの統計
+        self.reused = 0  # 計画をそのまま使った大名数
+        self.replanned = 0  # 入力が変わったため決め直した大名数
+
+    def plan_all(self, game_state, events: List, daimyo_ids: List[int]) -> Dict[int, Tuple[Dict, tuple]]:
+        """スナップショットに対して各大名の行動計画を作成
+
+        Args:
+            game_state: S3開始時点のゲーム状態（変更しない）
+            events: 読み込み済みのイベントリスト（探索AIの先読みに使う）
+            daimyo_ids: 計画を作るAI大名ID（S3の行動順）
+
+        Returns:
+            大名ID → (計画, 計画の入力のシグネチャ)
+        """
+        self.reused = 0
+        self.replanned = 0
+
+        # 探索AIの乱数は大名ごとに行動順で配る（並列でも同じシードなら同じ計画になる）
+        forecast_rng = game_state.get_rng("forecast")
+        seeds = [forecast_rng.getrandbits(32) for _ in daimyo_ids]
+
+        # 時間予算（config.AI_TURN_BUDGET_MS）がある場合は、同時に動くワーカー数を考慮して大名ごとに等分
+        budget_ms = None
+        if config.AI_TURN_BUDGET_MS is not None and daimyo_ids:
+            budget_ms = config.AI_TURN_BUDGET_MS * min(max(self.workers, 1), len(daimyo_ids)) / len(daimyo_ids)
+
+        snapshot = pickle.dumps(game_state, protocol=pickle.HIGHEST_PROTOCOL)
+        tasks = [(snapshot, daimyo_id, seed, budget_ms) for daimyo_id, seed in zip(daimyo_ids, seeds)]
+
+        # 1プロセスの場合・デーモンプロセス（トーナメントのワーカー）内では子プロセスを作れないため逐次
+        if self.workers <= 1 or len(tasks) <= 1 or multiprocessing.current_process().daemon:
+            global _worker_events
+            _worker_events = events
+            results = [_plan_task(task) for task in tasks]
+        else:
+            if self._pool is None:
+                self._pool = multiprocessing.Pool(
+                    processes=self.workers, initializer=_init_worker, initargs=(events, _config_values())
+                )
+            results = self._pool.map(_plan_task, tasks, chunksize=1)
+
+        logger.debug("[ParallelPlanner] %d大名の計画を作成（%dプロセス）", len(tasks), self.workers)
+        return dict(zip(daimyo_ids, results))
+
+    def record(self, reused: bool):
+        """計画を使ったか決め直したかを記録"""
+        if reused:
+            self.reused += 1
+        else:
+            self.replanned += 1
+
+    def close(self):
+        """ワーカープロセスを終了"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+
+def planning_signature(game_state, daimyo_id: int) -> tuple:
+    """行動計画の入力のシグネチャ（一致すれば従来AIは同じコマンドを選ぶ）
+
+    - 自領地と隣接領地の数値列・守将・治水・城
+    - 2つ先までの領地の所有者（転送先の「敵に隣接しているか」は隣接領地の隣接を参照するため）
+    - この大名の配置可能な武将
+    - この大名の外交関係
+    """
+    provinces = game_state.provinces
+    own_ids = game_state.provinces_by_owner.get(daimyo_id, ())
+    region = set(own_ids)
+    for province_id in own_ids:
+        region.update(provinces[province_id].adjacent_provinces)
+    outer = set(region)
+    for province_id in region:
+        if province_id in provinces:
+            outer.update(provinces[province_id].adjacent_provinces)
+
+    rows = []
+    for province_id in sorted(region):
+        province = provinces.get(province_id)
+        if province is None:
+            continue
+        rows.append((
+            province_id,
+            tuple(getattr(province, field) for field in SIGNATURE_FIELDS),
+            province.governor_general_id,
+            province.flood_control,
+            province.has_castle
+        ))
+    owners = tuple(
+        (province_id, provinces[province_id].owner_daimyo_id)
+        for province_id in sorted(outer - region) if province_id in provinces
+    )
+
+    generals = tuple(sorted(general.id for general in game_state.general_registry.get_available(daimyo_id)))
+    relations = tuple(sorted(
+        (relation.daimyo_a_id, relation.daimyo_b_id, relation.relation_type.value)
+        for relation in game_state.diplomatic_relations
+        if daimyo_id in (relation.daimyo_a_id, relation.daimyo_b_id)
+    ))
+
+    return tuple(rows), owners, generals, relations
+
+
+def plan_daimyo(game_state, events: List, daimyo_id: int, rng: random.Random,
+                budget_ms: Optional[float] = None) -> Tuple[Dict, tuple]:
+    """分岐した状態で1大名の手番（将軍配置・コマンド決定）を再現して計画を作成
+
+    budget_ms: 探索時間（Noneの場合は config.AI_SEARCH_BUDGET_MS）
+
+    Returns:
+        (領地ID → コマンド, 将軍配置後の計画の入力のシグネチャ)
+    """
+    from core.game_initializer import create_game_systems
+    from core.sequential_turn_manager import run_to_completion
+
+    state = game_state.fork()
+    systems = create_game_systems(state, events)
+    turn_manager = systems["turn_manager"]
+    ai_system = systems["ai_system"]
+    daimyo = state.get_daimyo(daimyo_id)
+    provinces = state.get_daimyo_provinces(daimyo_id)
+
+    run_to_completion(turn_manager._ai_assign_generals(daimyo, provinces))
+    signature = planning_signature(state, daimyo_id)
+    if config.AI_FLOW_LOGISTICS:
+        turn_manager._ai_plan_logistics(daimyo)
+
+    remaining = [p for p in provinces if not p.command_used_this_turn]
+    plan = {}
+    if ai_system.uses_search(daimyo_id):
+        plan = ai_system.plan_commands(daimyo_id, remaining, events, rng, budget_ms)
+    elif ai_system.uses_scoring(daimyo_id):
+        plan = ai_system.score_commands(daimyo_id, remaining)
+
+    # 探索・一括評価が決めなかった領地は従来AI（内政は適用して後続の領地の判断に反映する）
+    for province in remaining:
+        action = plan.get(province.id)
+        if action is None:
+            action = turn_manager._ai_decide_military_action(province, daimyo)
+            if action["type"] == "none":
+                action = turn_manager._ai_decide_internal_action(province, daimyo)
+            plan[province.id] = action
+        if action["type"] in turn_manager.MILITARY_COMMANDS:
+            province.command_used_this_turn = True
+        elif action["type"] != "none":
+            run_to_completion(turn_manager._execute_internal_command(province, daimyo, action))
+
+    return plan, signature
+
+
+def _plan_task(task: Tuple[bytes, int, int, Optional[float]]) -> Tuple[Dict, tuple]:
+    """ワーカーで1大名の計画を作成"""
+    snapshot, daimyo_id, seed, budget_ms = task
+    return plan_daimyo(pickle.loads(snapshot), _worker_events, daimyo_id, random.Random(seed), budget_ms)
+
+
+def _init_worker(events: List, config_values: Dict):
+    """ワーカープロセスの初期化（イベントリストと親プロセスのconfigを引き継ぐ）"""
+    global _worker_events
+    _worker_events = events
+    for name, value in config_values.items():
+        setattr(config, name, value)
+
+
+def _config_values() -> Dict:
+    """ワーカーへ引き継ぐconfigの値（実行中に上書きされた値を含む）"""
+    return {
+        name: value for name, value in vars(config).items()
+        if name.isupper() and not callable(value)
+    }
+
@@ -0,0 +1,129 @@
+"""
+RouteCache - 自領地間の経路キャッシュ
+大名ごとに自領地だけをたどる幅優先探索の木（転送元 → 各自領地への最短経路）を保持し、
+複数の自領地を経由する転送の転送先一覧・経路を探索なしで返す
+"""
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+# 幅優先探索の木: (領地ID → 1つ手前の領地ID, 領地ID → ホップ数, 到達順の領地IDリスト)
+RouteTree = Tuple[Dict[int, int], Dict[int, int], List[int]]
+
+
+class RouteCache:
+    """自領地間の経路キャッシュクラス
+
+    - 木は転送元ごとに初回の問い合わせ時に作る
+    - 所有者の変更時（GameState.set_province_owner）は旧所有者と新所有者の木だけを捨てる
+      （他の大名の領地の連結は変わらない）
+
+    作成済みの木は変更しないため、分岐したゲーム状態と共有できる。
+    """
+
+    def __init__(self, game_state):
+        self.game_state = game_state
+
+        # 大名ID → 転送元の領地ID → 幅優先探索の木
+        self.trees: Dict[int, Dict[int, RouteTree]] = {}
+
+    def clone(self, game_state) -> "RouteCache":
+        """分岐したゲーム状態用のコピーを作成（GameState.fork用）"""
+        clone = RouteCache(game_state)
+        clone.trees = {daimyo_id: dict(trees) for daimyo_id, trees in self.trees.items()}
+        return clone
+
+    # ========================================
+    # 更新
+    # ========================================
+
+    def on_owner_changed(self, province_id: int, old_owner_id: Optional[int], new_owner_id: Optional[int]):
+        """領地の所有者が変わった（GameState.set_province_owner から呼ばれる）"""
+        self.trees.pop(old_owner_id, None)
+        self.trees.pop(new_owner_id, None)
+
+    def clear(self):
+        """全大名の木を捨てる"""
+        self.trees = {}
+
+    # ========================================
+    # 問い合わせ
+    # ========================================
+
+    def get_reachable(self, from_province_id: int, max_hops: Optional[int] = None) -> List[int]:
+        """自領地だけを通って到達できる自領地のID（近い順、転送元を除く）
+
+        Args:
+            from_province_id: 転送元の領地ID
+            max_hops: 最大ホップ数（Noneの場合は無制限、1の場合は隣接のみ）
+        """
+        tree = self._get_tree(from_province_id)
+        if tree is None:
+            return []
+        _, hops, order = tree
+        if max_hops is None:
+            return order[1:]
+        return [province_id for province_id in order[1:] if hops[province_id] <= max_hops]
+
+    def get_hops(self, from_province_id: int, to_province_id: int) -> Optional[int]:
+        """自領地だけを通る最短経路のホップ数（到達できない場合はNone）"""
+        tree = self._get_tree(from_province_id)
+        if tree is None:
+            return None
+        return tree[1].get(to_province_id)
+
+    def get_route(self, from_province_id: int, to_province_id: int) -> Optional[List[int]]:
+        """自領地だけを通る最短経路（転送元・転送先を含む領地IDのリスト、到達できない場合はNone）"""
+        tree = self._get_tree(from_province_id)
+        if tree is None:
+            return None
+        parents = tree[0]
+        if to_province_id not in parents:
+            return None
+
+        route = [to_province_id]
+        while route[-1] != from_province_id:
+            route.append(parents[route[-1]])
+        route.reverse()
+        return route
+
+    # ========================================
+    # 計算
+    # ========================================
+
+    def _get_tree(self, from_province_id: int) -> Optional[RouteTree]:
+        """転送元の木を取得（未作成なら作る。無所属・存在しない領地はNone）"""
+        province = self.game_state.provinces.get(from_province_id)
+        if province is None or province.owner_daimyo_id is None:
+            return None
+
+        trees = self.trees.setdefault(province.owner_daimyo_id, {})
+        tree = trees.get(from_province_id)
+        if tree is None:
+            tree = self._build_tree(province)
+            trees[from_province_id] = tree
+        return tree
+
+    def _build_tree(self, source) -> RouteTree:
+        """自領地だけを通る幅優先探索"""
+        provinces = self.game_state.provinces
+        owner_id = source.owner_daimyo_id
+        parents = {source.id: source.id}
+        hops = {source.id: 0}
+        order = [source.id]
+
+        queue = deque([source])
+        while queue:
+            province = queue.popleft()
+            next_hops = hops[province.id] + 1
+            for adj_id in province.adjacent_provinces:
+                if adj_id in parents:
+                    continue
+                adj = provinces.get(adj_id)
+                if adj is None or adj.owner_daimyo_id != owner_id:
+                    continue
+                parents[adj_id] = province.id
+                hops[adj_id] = next_hops
+                order.append(adj_id)
+                queue.append(adj)
+
+        return parents, hops, order
@@ -7,10 +7,24 @@ S2. 全ての生きている大名・将軍について（健康・加齢・死
 S3. すべての生きている大名について（ランダム順序でコマンド実行）
 """
 from typing import List, Dict, Any, Generator, Tuple, Optional
-import random
+import logging
+import time
 import config
 from models.province import Province
 from models.daimyo import Daimyo
+from debug.log_channels import get_logger
+
+turn_logger = get_logger("turn")
+ai_logger = get_logger("ai")
+
+
+def run_to_completion(generator):
+    """UI向けのyieldを読み捨ててgeneratorを最後まで実行し、戻り値を返す（先読み・計画用）"""
+    try:
+        while True:
+            next(generator)
+    except StopIteration as e:
+        return e.value
 
 
 class SequentialTurnManager:
@@ -37,6 +51,31 @@ class SequentialTurnManager:
         self.pending_event_choices: List[Dict[str, Any]] = []
         self.current_daimyo_order: List[int] = []
 
+        # Trueの場合、戦闘のラウンド記録を省き、battle_animation には最小限の戦闘データを渡す
+        # （戦闘演出を表示しないヘッドレス対局用）
+        self.quiet_battles = False
+
+        # Trueの場合、S3の開始時に全AI大名の行動計画を並列に作成する（core/parallel_planner.py）
+        self.parallel_planning = config.AI_PARALLEL_PLANNING
+        self.parallel_planner = None
+
+        # 兵站計画（config.AI_FLOW_LOGISTICS、systems/logistics.py）: (大名ID, 転送元の領地ID → 転送コマンド)
+        self.logistics_plan: Optional[Tuple[int, Dict[int, Dict]]] = None
+
+        # AIの1ターンあたりの時間予算（config.AI_TURN_BUDGET_MS）:
+        # S3の探索の締め切り（perf_counter）と、探索時間を配るAI大名の残り数
+        self.ai_turn_deadline: Optional[float] = None
+        self.ai_budget_daimyo_left = 0
+
+        # 大名ID → AIのパラメータ（systems/ai_profile.py、最初の使用時に作成）
+        self.ai_params: Dict[int, Dict[str, float]] = {}
+
+        # AI判断のキャッシュ（config.AI_DECISION_CACHE、core/decision_cache.py）
+        self.decision_cache = None
+        if config.AI_DECISION_CACHE:
+            from core.decision_cache import DecisionCache
+            self.decision_cache = DecisionCache(game_state)
+
     def execute_turn(self) -> Generator[Tuple[str, Any], None, Optional[Dict]]:
         """
         メインのターン実行（generator）
@@ -46,6 +85,7 @@ class SequentialTurnManager:
         - ("message", text): AI大名のコマンド実行メッセージ
         - ("death_animation", character_data): 死亡演出
         - ("battle_animation", battle_data): 戦闘演出
+          （quiet_battles が True の場合は result・大名ID・領地IDのみの戦闘データ）
         - ("victory", None): 勝利
         - ("player_turn", daimyo_id): プレイヤーの番
         - ("game_over", None): ゲームオーバー
@@ -88,37 +128,13 @@ class SequentialTurnManager:
     def _section_1_provinces(self) -> Generator:
         """S1: 全領地の処理"""
         player_daimyo = self.game_state.get_player_daimyo()
-        total_rice = 0
-        total_gold = 0
-        total_rice_consumed = 0
 
-        # 忠誠度を事前記録（警告判定用）
-        loyalty_before = {}
-
-        for province in self.game_state.provinces.values():
-            if province.owner_daimyo_id is None:
-                continue
-
-            # 忠誠度を記録
-            loyalty_before[province.id] = province.peasant_loyalty
-
-            # Phase1: 税収・米生産
-            rice_income, gold_income = self._s1_phase1_income(province)
-
-            # Phase2: 維持費処理
-            rice_consumed = self._s1_phase2_upkeep(province)
-
-            # Phase3: ランダムイベント抽選
-            self._s1_phase3_random_events(province)
-
-            # Phase4: 状態反映（忠誠度減衰など）
-            self._s1_phase4_apply_state(province)
-
-            # プレイヤーの収支を集計
-            if player_daimyo and province.owner_daimyo_id == player_daimyo.id:
-                total_rice += rice_income
-                total_gold += gold_income
-                total_rice_consumed += rice_consumed
+        # Phase1（税収・米生産）・Phase2（維持費）・Phase4（忠誠度減衰）を一括処理
+        # Phase3（ランダムイベント）はS1の最後にまとめて行う
+        # 忠誠度は事前に記録しておく（警告判定用）
+        loyalty_before, total_rice, total_gold, total_rice_consumed = self._s1_economy_batch(
+            player_daimyo.id if player_daimyo else None
+        )
 
         # プレイヤーの収支を表示
         if player_daimyo:
@@ -144,46 +160,118 @@ class SequentialTurnManager:
                 msg = self._format_loyalty_warning(province, change)
                 yield ("message", msg)
 
-    def _s1_phase1_income(self, province: Province) -> Tuple[int, int]:
-        """Phase1: 税収・米生産"""
-        # 農民の自然増加（1%）
-        peasant_growth = int(province.peasants * 0.01)
-        if peasant_growth > 0:
-            province.add_peasants(peasant_growth)
-
-        # 米生産
-        rice_produced = province.calculate_rice_production()
-        province.add_rice(rice_produced)
-
-        # 税収
-        gold_income = province.calculate_tax_income()
-        province.add_gold(gold_income)
-
-        return rice_produced, gold_income
-
-    def _s1_phase2_upkeep(self, province: Province) -> int:
-        """Phase2: 維持費処理"""
-        # 兵士の米消費
-        rice_needed = province.calculate_soldier_rice_consumption()
-        province.add_rice(-rice_needed)
-
-        # 米不足の場合、士気低下
-        if province.rice < 0:
-            province.rice = 0
-            province.update_morale(config.MORALE_LOW_RICE_PENALTY)
-            self.turn_events.append(f"【警告】{province.name}: 米不足により士気低下")
-        else:
+    def _s1_economy_batch(self, player_daimyo_id: Optional[int]) -> Tuple[Dict[int, int], int, int, int]:
+        """Phase1・Phase2・Phase4 を全領地まとめて処理
+
+        Provinceを経由せずProvinceStoreの列を直接走査する。
+        計算式と丸めの順序はProvinceの各メソッド（calculate_rice_production,
+        calculate_tax_income, add_rice, update_morale, update_loyalty など）と同じ。
+
+        Args:
+            player_daimyo_id: 収支を集計するプレイヤー大名ID（いない場合はNone）
+
+        Returns:
+            (処理前の忠誠度 {province_id: loyalty}, 米収入, 金収入, 米消費)
+            収支はプレイヤー大名の領地のみの合計
+        """
+        store = self.game_state.province_store
+        columns = store.columns
+        province_ids = store.province_ids
+        owners = columns["owner_daimyo_id"]
+        peasants_col = columns["peasants"]
+        max_peasants_col = columns["max_peasants"]
+        loyalty_col = columns["peasant_loyalty"]
+        soldiers_col = columns["soldiers"]
+        morale_col = columns["soldier_morale"]
+        gold_col = columns["gold"]
+        rice_col = columns["rice"]
+        tax_rate_col = columns["tax_rate"]
+        development_col = columns["development_level"]
+        town_col = columns["town_level"]
+        terrain_col = columns["terrain_code"]
+
+        # 地形コード → 米生産倍率（地形ごとに1回だけ引く）
+        rice_multipliers = [
+            config.TERRAIN_EFFECTS.get(terrain, {}).get("rice_multiplier", 1.0)
+            for terrain in store.terrain_names
+        ]
+        base_rice = config.BASE_RICE_PRODUCTION
+        base_tax = config.BASE_TAX_INCOME
+        high_loyalty = config.HIGH_LOYALTY_THRESHOLD
+        high_loyalty_bonus = config.HIGH_LOYALTY_BONUS
+        rice_consumption = config.SOLDIER_RICE_CONSUMPTION
+        morale_recovery = config.MORALE_DECAY_RATE
+        loyalty_decay = config.LOYALTY_DECAY_RATE
+        loyalty_tax_penalty = config.LOYALTY_TAX_PENALTY
+
+        loyalty_before = {}
+        total_rice = 0
+        total_gold = 0
+        total_rice_consumed = 0
+
+        # 読み取りはzipでまとめて行い、書き込みだけ行番号で列に戻す
+        rows = zip(range(store.size), owners, peasants_col, max_peasants_col, loyalty_col,
+                   soldiers_col, morale_col, gold_col, rice_col, tax_rate_col,
+                   development_col, town_col, terrain_col)
+        for (row, owner_id, peasants, max_peasants, loyalty, soldiers, morale, gold, rice, tax_rate,
+             development, town, terrain) in rows:
+            if owner_id is None:
+                continue
+
+            loyalty_before[province_ids[row]] = loyalty
+
+            # ----- Phase1: 税収・米生産 -----
+            # 農民の自然増加（1%、0〜最大農民数に制限）
+            peasant_growth = int(peasants * 0.01)
+            if peasant_growth > 0:
+                peasants += peasant_growth
+                if peasants > max_peasants:
+                    peasants = max_peasants
+                if peasants < 0:
+                    peasants = 0
+                peasants_col[row] = peasants
+
+            # 米生産（地形効果・忠誠度ボーナス）
+            loyalty_mult = high_loyalty_bonus if loyalty >= high_loyalty else 1.0
+            rice_produced = int(base_rice * development * rice_multipliers[terrain] * loyalty_mult)
+            rice += rice_produced
+            if rice < 0:
+                rice = 0
+
+            # 税収（農民数に基づく補正）
+            gold_income = int(base_tax * town * (tax_rate / 100.0) * (peasants / max_peasants))
+            gold += gold_income
+            gold_col[row] = gold if gold > 0 else 0
+
+            # ----- Phase2: 維持費処理 -----
+            # 兵士の米消費（不足分は0に丸める）
+            rice_needed = soldiers * rice_consumption
+            rice -= rice_needed
+            if rice < 0:
+                rice = 0
+
             # 士気の自然回復
-            province.update_morale(config.MORALE_DECAY_RATE)
+            # 米不足の士気低下（MORALE_LOW_RICE_PENALTY）は従来の処理でも add_rice が先に0へ丸めるため
+            # 発生しなかった。結果を変えないよう、ここでも適用しない
+            morale += morale_recovery
+            morale_col[row] = 0 if morale < 0 else (100 if morale > 100 else morale)
+            rice_col[row] = rice
+
+            # ----- Phase4: 状態反映（忠誠度減衰など） -----
+            loyalty_change = loyalty_decay
+            # 税率が高い場合、追加ペナルティ
+            if tax_rate > 50:
+                loyalty_change += int((tax_rate - 50) * loyalty_tax_penalty)
+            loyalty += loyalty_change
+            loyalty_col[row] = 0 if loyalty < 0 else (100 if loyalty > 100 else loyalty)
 
-        return rice_needed
+            # プレイヤーの収支を集計
+            if owner_id == player_daimyo_id:
+                total_rice += rice_produced
+                total_gold += gold_income
+                total_rice_consumed += rice_needed
 
-    def _s1_phase3_random_events(self, province: Province):
-        """Phase3: ランダムイベント抽選"""
-        # V2では領地ごとにイベントチェックを行う必要があるが、
-        # EventSystemは全領地を一括チェックするため、ここでは何もしない
-        # イベント処理はS1の最後にまとめて行う
-        pass
+        return loyalty_before, total_rice, total_gold, total_rice_consumed
 
     def _s1_process_random_events(self):
         """S1の最後に全領地のランダムイベントをまとめて処理"""
@@ -195,7 +283,9 @@ class SequentialTurnManager:
 
         for event, province in triggered_events:
             # 選択肢があるイベントかつプレイヤーの領地の場合
-            if event.has_choices() and province.owner_daimyo_id == 1:
+            is_player_province = (self.game_state.player_daimyo_id is not None and
+                                  province.owner_daimyo_id == self.game_state.player_daimyo_id)
+            if event.has_choices() and is_player_province:
                 self.pending_event_choices.append({
                     "event": event,
                     "province": province
@@ -206,8 +296,8 @@ class SequentialTurnManager:
             else:
                 # 自動処理
                 choice_id = None
-                if event.has_choices() and province.owner_daimyo_id != 1:
-                    choice = random.choice(event.choices)
+                if event.has_choices() and not is_player_province:
+                    choice = self.game_state.get_rng("events").choice(event.choices)
                     choice_id = choice.choice_id
 
                 self.event_system.apply_event_effect(event, province, choice_id)
@@ -229,7 +319,9 @@ class SequentialTurnManager:
 
         for event, province in triggered_events:
             # 選択肢があるイベントかつプレイヤーの領地の場合
-            if event.has_choices() and province.owner_daimyo_id == 1:
+            is_player_province = (self.game_state.player_daimyo_id is not None and
+                                  province.owner_daimyo_id == self.game_state.player_daimyo_id)
+            if event.has_choices() and is_player_province:
                 self.pending_event_choices.append({
                     "event": event,
                     "province": province
@@ -240,8 +332,8 @@ class SequentialTurnManager:
             else:
                 # 自動処理
                 choice_id = None
-                if event.has_choices() and province.owner_daimyo_id != 1:
-                    choice = random.choice(event.choices)
+                if event.has_choices() and not is_player_province:
+                    choice = self.game_state.get_rng("events").choice(event.choices)
                     choice_id = choice.choice_id
 
                 self.event_system.apply_event_effect(event, province, choice_id)
@@ -256,15 +348,6 @@ class SequentialTurnManager:
                 yield ("message", msg)
                 self.turn_events.append(msg)
 
-    def _s1_phase4_apply_state(self, province: Province):
-        """Phase4: 領地の状態に反映（忠誠度減衰など）"""
-        # 忠誠度の自然減衰
-        loyalty_change = config.LOYALTY_DECAY_RATE
-        # 税率が高い場合、追加ペナルティ
-        if province.tax_rate > 50:
-            loyalty_change += int((province.tax_rate - 50) * config.LOYALTY_TAX_PENALTY)
-        province.update_loyalty(loyalty_change)
-
     # ========================================
     # S2: キャラクター処理
     # ========================================
@@ -287,7 +370,7 @@ class SequentialTurnManager:
             # Phase2: 年齢処理
             old_age = daimyo.age
             old_health = daimyo.health
-            daimyo.age_one_year()
+            daimyo.age_one_year(self.game_state.get_rng("characters"))
 
             # Phase3: 死亡判定
             if old_health > 0 and not daimyo.is_alive:
@@ -320,7 +403,7 @@ class SequentialTurnManager:
                 continue
 
             old_health = general.health
-            general.age_one_year()
+            general.age_one_year(self.game_state.get_rng("characters"))
 
             if old_health > 0 and not general.is_alive():
                 self.turn_events.append(f"武将 {general.name}が死去しました")
@@ -334,9 +417,8 @@ class SequentialTurnManager:
         self.turn_events.append(f"【訃報】{daimyo.clan_name}の{daimyo.name}が病死しました（享年{daimyo.age}歳）")
 
         # 領地を中立に
-        for province in self.game_state.provinces.values():
-            if province.owner_daimyo_id == daimyo.id:
-                province.owner_daimyo_id = None
+        for province in self.game_state.get_daimyo_provinces(daimyo.id):
+            self.game_state.set_province_owner(province.id, None)
 
     # ========================================
     # S3: 大名行動処理
@@ -348,16 +430,40 @@ class SequentialTurnManager:
         self.current_daimyo_order = self._get_randomized_daimyo_order()
 
         # デバッグログ: 大名の処理順序を出力
-        order_names = [self.game_state.get_daimyo(did).clan_name for did in self.current_daimyo_order
-                       if self.game_state.get_daimyo(did) and self.game_state.get_daimyo(did).is_alive]
-        print(f"[DEBUG-S3開始] 大名処理順序: {' → '.join(order_names)}")
+        if turn_logger.isEnabledFor(logging.DEBUG):
+            order_names = [self.game_state.get_daimyo(did).clan_name for did in self.current_daimyo_order
+                           if self.game_state.get_daimyo(did) and self.game_state.get_daimyo(did).is_alive]
+            turn_logger.debug("[DEBUG-S3開始] 大名処理順序: %s", ' → '.join(order_names))
+
+        ai_daimyo_ids = [
+            daimyo_id for daimyo_id in self.current_daimyo_order
+            if not self.game_state.daimyo[daimyo_id].is_player
+            and self.game_state.get_province_count(daimyo_id) > 0
+        ]
+
+        # 時間予算: 従来AIの判断は常に行い、探索による改善はS3の開始から予算の時間までに収める
+        self.ai_turn_deadline = None
+        if config.AI_TURN_BUDGET_MS is not None and self.ai_system:
+            self.ai_turn_deadline = time.perf_counter() + config.AI_TURN_BUDGET_MS / 1000
+            self.ai_budget_daimyo_left = sum(
+                1 for daimyo_id in ai_daimyo_ids if self.ai_system.uses_search(daimyo_id)
+            )
+
+        # 並列計画: S3開始時点の状態で全AI大名の行動計画を先に作る（各大名の手番で検証して使う）
+        snapshot_plans = {}
+        if self.parallel_planning and self.ai_system:
+            from core.parallel_planner import ParallelPlanner
+            if self.parallel_planner is None:
+                self.parallel_planner = ParallelPlanner()
+            events = self.event_system.events if self.event_system else []
+            snapshot_plans = self.parallel_planner.plan_all(self.game_state, events, ai_daimyo_ids)
 
         for daimyo_id in self.current_daimyo_order:
             daimyo = self.game_state.get_daimyo(daimyo_id)
             if not daimyo or not daimyo.is_alive:
                 continue
 
-            print(f"\n[DEBUG-S3] === {daimyo.clan_name}のターン開始 ===")
+            turn_logger.debug("\n[DEBUG-S3] === %sのターン開始 ===", daimyo.clan_name)
 
             # 軍事コマンドリスト（この大名の番で登録されたもの）
             military_commands = []
@@ -365,13 +471,13 @@ class SequentialTurnManager:
             if daimyo.is_player:
                 # Phase2: プレイヤー大名のコマンド選択
                 # UIへ制御を渡してプレイヤーの入力を待つ
-                print(f"[DEBUG-プレイヤーターン] プレイヤー入力待機中...")
+                turn_logger.debug("[DEBUG-プレイヤーターン] プレイヤー入力待機中...")
                 player_result = yield ("player_turn", daimyo_id)
-                print(f"[DEBUG-プレイヤーターン] プレイヤー入力受信: {player_result}")
+                turn_logger.debug("[DEBUG-プレイヤーターン] プレイヤー入力受信: %s", player_result)
 
                 # プレイヤーが登録した内政コマンドを実行
                 if player_result and "internal_commands" in player_result:
-                    print(f"[DEBUG-プレイヤーターン] 内政コマンド数: {len(player_result['internal_commands'])}")
+                    turn_logger.debug("[DEBUG-プレイヤーターン] 内政コマンド数: %d", len(player_result['internal_commands']))
                     for cmd in player_result["internal_commands"]:
                         province = self.game_state.get_province(cmd["province_id"])
                         if province:
@@ -380,11 +486,11 @@ class SequentialTurnManager:
                 # プレイヤーが登録した軍事コマンドを受け取る
                 if player_result and "military_commands" in player_result:
                     military_commands = player_result["military_commands"]
-                    print(f"[DEBUG-プレイヤーターン] 軍事コマンド数: {len(military_commands)}")
+                    turn_logger.debug("[DEBUG-プレイヤーターン] 軍事コマンド数: %d", len(military_commands))
             else:
                 # Phase1: AI大名のコマンド自動選択
                 # generatorを実行してメッセージをyield、最後に軍事コマンドリストを取得
-                ai_gen = self._execute_ai_commands(daimyo)
+                ai_gen = self._execute_ai_commands(daimyo, snapshot_plans.get(daimyo.id))
                 military_commands = None
                 try:
                     while True:
@@ -394,9 +500,9 @@ class SequentialTurnManager:
                     military_commands = e.value if e.value is not None else []
 
             # Phase3: 軍事コマンドリストの順次実行
-            print(f"[DEBUG-S3] {daimyo.clan_name}の軍事コマンド実行開始（コマンド数: {len(military_commands)}）")
+            turn_logger.debug("[DEBUG-S3] %sの軍事コマンド実行開始（コマンド数: %d）", daimyo.clan_name, len(military_commands))
             result = yield from self._execute_military_commands(daimyo, military_commands)
-            print(f"[DEBUG-S3] === {daimyo.clan_name}のターン終了 ===\n")
+            turn_logger.debug("[DEBUG-S3] === %sのターン終了 ===\n", daimyo.clan_name)
             if result:
                 return result
 
@@ -413,29 +519,31 @@ class SequentialTurnManager:
             d.id for d in self.game_state.daimyo.values()
             if d.is_alive
         ]
-        random.shuffle(living_daimyo_ids)
+        self.game_state.rng.shuffle(living_daimyo_ids)
         return living_daimyo_ids
 
-    def _execute_ai_commands(self, daimyo: Daimyo) -> Generator:
-        """AI大名のコマンドを実行し、軍事コマンドリストを返す（generator）"""
+    def _execute_ai_commands(self, daimyo: Daimyo, snapshot_plan: Optional[Tuple[Dict, tuple]] = None) -> Generator:
+        """AI大名のコマンドを実行し、軍事コマンドリストを返す（generator）
+
+        Args:
+            snapshot_plan: 並列計画で作成した (計画, 計画の入力のシグネチャ)。
+                入力が現在の状態と一致する場合のみ計画を使う
+        """
         military_commands = []
 
         if not self.ai_system:
             return military_commands
 
         # AI大名の領地を取得
-        ai_provinces = [
-            p for p in self.game_state.provinces.values()
-            if p.owner_daimyo_id == daimyo.id
-        ]
+        ai_provinces = self.game_state.get_daimyo_provinces(daimyo.id)
 
-        print(f"[DEBUG-AI実行] {daimyo.clan_name}の領地数: {len(ai_provinces)}")
-        if ai_provinces:
+        ai_logger.debug("[DEBUG-AI実行] %sの領地数: %d", daimyo.clan_name, len(ai_provinces))
+        if ai_provinces and ai_logger.isEnabledFor(logging.DEBUG):
             province_names = [p.name for p in ai_provinces]
-            print(f"[DEBUG-AI実行] {daimyo.clan_name}の領地: {', '.join(province_names)}")
+            ai_logger.debug("[DEBUG-AI実行] %sの領地: %s", daimyo.clan_name, ', '.join(province_names))
 
         if not ai_provinces:
-            print(f"[DEBUG-AI実行] {daimyo.clan_name}は領地なし、コマンド決定をスキップ")
+            ai_logger.debug("[DEBUG-AI実行] %sは領地なし、コマンド決定をスキップ", daimyo.clan_name)
             return military_commands
 
         # AI大名の行動開始ディレイ
@@ -445,11 +553,64 @@ class SequentialTurnManager:
         # 将軍配置（コマンド扱い）
         yield from self._ai_assign_generals(daimyo, ai_provinces)
 
+        # 並列計画の入力が変わっていなければその計画を使う
+        plan = {}
+        planned = False
+        if snapshot_plan is not None:
+            from core.parallel_planner import planning_signature
+            planned = snapshot_plan[1] == planning_signature(self.game_state, daimyo.id)
+            self.parallel_planner.record(planned)
+            if planned:
+                plan = snapshot_plan[0]
+
+        # 探索AIを使う場合は先に全領地のコマンドを決める（決まらなかった領地は従来AI）
+        uses_search = self.ai_system.uses_search(daimyo.id)
+        search_budget_ms = self._ai_take_search_budget() if uses_search else None
+        if not planned and uses_search:
+            events = self.event_system.events if self.event_system else []
+            plan = self.ai_system.plan_commands(
+                daimyo.id, [p for p in ai_provinces if not p.command_used_this_turn], events,
+                budget_ms=search_budget_ms
+            )
+        # 行動の一括評価を使う場合は全領地 × 全行動のスコアからまとめて決める
+        elif not planned and self.ai_system.uses_scoring(daimyo.id):
+            plan = self.ai_system.score_commands(
+                daimyo.id, [p for p in ai_provinces if not p.command_used_this_turn]
+            )
+
+        # 兵站計画（後方の余剰を前線へ配る転送を最小費用流でまとめて決める）
+        if config.AI_FLOW_LOGISTICS:
+            self._ai_plan_logistics(daimyo)
+
         # 各領地でコマンドを決定・実行（1領地につき1コマンド）
         for province in ai_provinces:
             if province.command_used_this_turn:
                 continue  # 既にコマンド使用済み
 
+            planned_action = plan.get(province.id)
+            if planned_action is not None:
+                if planned_action["type"] in self.MILITARY_COMMANDS:
+                    planned_action["province_id"] = province.id
+                    military_commands.append(planned_action)
+                    province.command_used_this_turn = True
+                elif planned_action["type"] != "none":
+                    yield from self._execute_internal_command(province, daimyo, planned_action)
+                continue
+
+            # 他勢力に隣接しない領地は軍事コマンドを出さないため内政判断だけを行い、
+            # 判断に使う値が前回と同じなら前回の判断を使う
+            if self.decision_cache is not None:
+                signature, internal_action = self.decision_cache.lookup(
+                    province, daimyo.id, self._ai_params(daimyo.id)
+                )
+                if signature is not None:
+                    if internal_action is None:
+                        internal_action = self._ai_decide_internal_action(province, daimyo)
+                        self.decision_cache.store(province.id, signature, internal_action)
+                    if internal_action["type"] != "none":
+                        yield from self._execute_internal_command(province, daimyo, internal_action)
+                    continue
+
             # 軍事コマンドを優先的に検討
             military_action = self._ai_decide_military_action(province, daimyo)
             if military_action["type"] != "none":
@@ -465,16 +626,27 @@ class SequentialTurnManager:
 
         return military_commands
 
+    def _ai_take_search_budget(self) -> Optional[float]:
+        """探索時間（ms）を1大名分取り出す
+
+        時間予算（config.AI_TURN_BUDGET_MS）がない場合はNone（config.AI_SEARCH_BUDGET_MS を使う）。
+        ある場合はS3の締め切りまでの残り時間を、まだ手番の来ていない探索する大名で等分する。
+        """
+        if self.ai_turn_deadline is None:
+            return None
+        remaining_ms = max((self.ai_turn_deadline - time.perf_counter()) * 1000, 0.0)
+        share = remaining_ms / max(self.ai_budget_daimyo_left, 1)
+        self.ai_budget_daimyo_left -= 1
+        return share
+
     def _ai_assign_generals(self, daimyo: Daimyo, provinces: List[Province]) -> Generator:
         """AI: 将軍を領地に配置（generator）"""
         if not self.internal_affairs:
             yield from []  # 空のgeneratorを返す
             return
 
-        available_generals = [
-            g for g in self.game_state.generals.values()
-            if g.serving_daimyo_id == daimyo.id and g.is_available
-        ]
+        # 空いている将軍（将軍の索引から、能力値の合計の高い順）
+        available_generals = self.game_state.general_registry.get_available(daimyo.id)
 
         if not available_generals:
             return
@@ -483,30 +655,30 @@ class SequentialTurnManager:
         if not unassigned:
             return
 
-        # 優先度でソート
+        # 優先度でソート（敵に面している隣接領地の数は国境索引から取得）
+        border_index = self.game_state.border_index
+
         def priority(p):
             score = p.soldiers
             if p.has_castle:
                 score += 1000
-            for adj_id in p.adjacent_provinces:
-                adj = self.game_state.get_province(adj_id)
-                if adj and adj.owner_daimyo_id != daimyo.id:
-                    score += 500
+            score += 500 * border_index.get_foreign_neighbor_count(p.id)
             return score
 
-        unassigned.sort(key=priority, reverse=True)
-        available_generals.sort(
-            key=lambda g: g.war_skill + g.leadership + g.politics + g.intelligence,
-            reverse=True
-        )
-
-        for i, province in enumerate(unassigned):
-            if i >= len(available_generals):
-                break
-            if province.command_used_this_turn:
-                continue
-
-            general = available_generals[i]
+        if config.AI_OPTIMAL_GENERAL_ASSIGNMENT:
+            # 割当問題: 将軍 × 領地の効用の合計が最大になる組み合わせ（行動済みの領地は除く）
+            from systems.general_assignment import GeneralAssignment
+            solver = GeneralAssignment(priority, lambda p: border_index.has_foreign_neighbor(p.id))
+            pairs = solver.assign([p for p in unassigned if not p.command_used_this_turn], available_generals)
+        else:
+            unassigned.sort(key=priority, reverse=True)
+            pairs = [
+                (province, available_generals[i])
+                for i, province in enumerate(unassigned[:len(available_generals)])
+                if not province.command_used_this_turn
+            ]
+
+        for province, general in pairs:
             result = self.internal_affairs.assign_governor(province, general)
             if result["success"]:
                 msg = f" 【{daimyo.clan_name}】{general.name}を{province.name}の守将に任命"
@@ -518,6 +690,15 @@ class SequentialTurnManager:
                 # AIは戦略的に将軍配置した領地を優先するため、この設計とする
                 province.command_used_this_turn = True
 
+    def _ai_params(self, daimyo_id: int) -> Dict[str, float]:
+        """大名のAIのパラメータ（systems/ai_profile.py、既定値にAIプロファイルを重ねた辞書）"""
+        params = self.ai_params.get(daimyo_id)
+        if params is None:
+            from systems.ai_profile import get_params
+            params = get_params(daimyo_id)
+            self.ai_params[daimyo_id] = params
+        return params
+
     def _ai_decide_internal_action(self, province: Province, daimyo: Daimyo) -> Dict:
         """AI: 内政行動を決定"""
         # 忠誠度が低い場合は米配布
@@ -543,30 +724,51 @@ class SequentialTurnManager:
 
         return {"type": "none"}
 
+    def _ai_plan_logistics(self, daimyo: Daimyo):
+        """AI: 兵站計画（最小費用流）を作成"""
+        from systems.logistics import LogisticsPlanner
+        self.logistics_plan = (daimyo.id, LogisticsPlanner(self.game_state).plan(daimyo.id))
+
+    def _ai_take_logistics_action(self, province: Province, daimyo: Daimyo) -> Dict:
+        """AI: 兵站計画からこの領地の転送コマンドを取り出す（計画後に資源が減っていれば量を減らす）"""
+        from systems.logistics import LogisticsPlanner
+        if self.logistics_plan is None or self.logistics_plan[0] != daimyo.id:
+            self._ai_plan_logistics(daimyo)
+
+        action = self.logistics_plan[1].pop(province.id, None)
+        if action is None:
+            return {"type": "none"}
+
+        attribute = action["type"][len("transfer_"):]
+        available = LogisticsPlanner.get_surplus(province, attribute)
+        amount = min(action["amount"], available)
+        if amount < LogisticsPlanner.MIN_TRANSFER_AMOUNT:
+            return {"type": "none"}
+        return {"type": action["type"], "target_id": action["target_id"], "amount": amount}
+
     def _ai_decide_transfer_action(self, province: Province, daimyo: Daimyo) -> Dict:
         """AI: 転送行動を決定"""
-        # 隣接する自領地で敵に面している領地を探す
-        transfer_targets = []
-        for adj_id in province.adjacent_provinces:
-            adj = self.game_state.get_province(adj_id)
-            if not adj or adj.owner_daimyo_id != daimyo.id:
-                continue
+        if config.AI_FLOW_LOGISTICS:
+            return self._ai_take_logistics_action(province, daimyo)
+
+        # 前線までの距離場から、前線へ向かう隣接自領地を転送先の候補にする
+        # （前線上・前線に隣接する領地では、隣接する前線上の自領地）
+        frontline_field = self.game_state.frontline_field
+        distance = frontline_field.get_distance(province.id)
+        if distance is None or (distance > 1 and not config.AI_FRONTLINE_LOGISTICS):
+            return {"type": "none"}
 
-            # 転送先が敵に隣接しているか
-            has_enemy = False
-            for adj2_id in adj.adjacent_provinces:
-                adj2 = self.game_state.get_province(adj2_id)
-                if adj2 and adj2.owner_daimyo_id != daimyo.id:
-                    has_enemy = True
-                    break
-
-            if has_enemy:
-                priority = 0
-                if adj.has_castle:
-                    priority += 1000
-                if adj.soldiers < 200:
-                    priority += 500
-                transfer_targets.append((adj, priority))
+        params = self._ai_params(daimyo.id)
+        provinces = self.game_state.provinces
+        transfer_targets = []
+        for target_id in frontline_field.get_next_hops(province.id):
+            adj = provinces[target_id]
+            priority = 0
+            if adj.has_castle:
+                priority += params["transfer_castle_priority"]
+            if adj.soldiers < params["transfer_weak_soldiers"]:
+                priority += params["transfer_weak_priority"]
+            transfer_targets.append((adj, priority))
 
         if not transfer_targets:
             return {"type": "none"}
@@ -575,7 +777,7 @@ class SequentialTurnManager:
         target = transfer_targets[0][0]
 
         # 兵士転送
-        if target.soldiers < 300 and province.soldiers > 100:
+        if target.soldiers < params["transfer_soldier_target"] and province.soldiers > 100:
             return {
                 "type": "transfer_soldiers",
                 "target_id": target.id,
@@ -602,12 +804,12 @@ class SequentialTurnManager:
 
     def _ai_decide_military_action(self, province: Province, daimyo: Daimyo) -> Dict:
         """AI: 軍事行動を決定"""
-        print(f"[DEBUG-決定チェック] {daimyo.clan_name}の{province.name}: 兵{province.soldiers}")
+        ai_logger.debug("[DEBUG-決定チェック] %sの%s: 兵%d", daimyo.clan_name, province.name, province.soldiers)
 
         # 攻撃可能な隣接敵領地があり、兵力が十分な場合は攻撃
         #if province.soldiers >= 150:
         target_id = self._find_attack_target(province, daimyo.id)
-        print(f"[DEBUG-決定チェック] {daimyo.clan_name}の{province.name}: 攻撃対象検索結果={target_id}")
+        ai_logger.debug("[DEBUG-決定チェック] %sの%s: 攻撃対象検索結果=%s", daimyo.clan_name, province.name, target_id)
         if target_id:
             target = self.game_state.get_province(target_id)
             # AIに兵力比率を決定させる
@@ -615,15 +817,18 @@ class SequentialTurnManager:
 
             # 攻撃中止判定（戦力比不足または守備兵力確保できない）
             if attack_ratio is None:
-                print(f"[DEBUG-決定] {daimyo.clan_name}の{province.name}から{target.name}への攻撃を中止（条件不足）")
+                ai_logger.debug("[DEBUG-決定] %sの%sから%sへの攻撃を中止（条件不足）", daimyo.clan_name, province.name, target.name)
                 return {"type": "none"}
 
             attack_force = int(province.soldiers * attack_ratio)
 
             # デバッグログ: 決定時の情報を記録
-            target_owner = self.game_state.get_daimyo(target.owner_daimyo_id)
-            target_owner_name = target_owner.clan_name if target_owner else "無所属"
-            print(f"[DEBUG-決定] {daimyo.clan_name}が{province.name}(兵{province.soldiers})から{target_owner_name}の{target.name}(兵{target.soldiers})への攻撃を決定（派遣比率{int(attack_ratio*100)}%、攻撃兵力{attack_force}）")
+            if ai_logger.isEnabledFor(logging.DEBUG):
+                target_owner = self.game_state.get_daimyo(target.owner_daimyo_id)
+                target_owner_name = target_owner.clan_name if target_owner else "無所属"
+                ai_logger.debug("[DEBUG-決定] %sが%s(兵%d)から%sの%s(兵%d)への攻撃を決定（派遣比率%d%%、攻撃兵力%d）",
+                                daimyo.clan_name, province.name, province.soldiers, target_owner_name,
+                                target.name, target.soldiers, int(attack_ratio * 100), attack_force)
 
             return {
                 "type": "attack",
@@ -637,57 +842,87 @@ class SequentialTurnManager:
         # 徴兵が必要かチェック
         max_enemy = self._get_max_adjacent_enemy_soldiers(province, daimyo.id)
         if max_enemy > 0:
-            required = int(max_enemy * 1.35)
+            required = int(max_enemy * self._ai_params(daimyo.id)["recruit_soldier_ratio"])
             if (province.soldiers < required and
                 province.peasants >= 100 and
                 province.gold >= config.RECRUIT_COST_PER_SOLDIER * 100):
-                print(f"[DEBUG-決定] {daimyo.clan_name}が{province.name}で徴兵を決定")
+                ai_logger.debug("[DEBUG-決定] %sが%sで徴兵を決定", daimyo.clan_name, province.name)
                 return {"type": "recruit", "amount": 100}
 
         return {"type": "none"}
 
     def _find_attack_target(self, province: Province, daimyo_id: int) -> Optional[int]:
         """攻撃対象を探す"""
-        daimyo = self.game_state.get_daimyo(daimyo_id)
-        print(f"[DEBUG-攻撃対象検索] {daimyo.clan_name}の{province.name}から攻撃可能な隣接領地を検索中...")
+        # 隣接領地ごとのログは引数の計算も省けるよう、先に判定しておく
+        debug = ai_logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            daimyo = self.game_state.get_daimyo(daimyo_id)
+            ai_logger.debug("[DEBUG-攻撃対象検索] %sの%sから攻撃可能な隣接領地を検索中...", daimyo.clan_name, province.name)
         candidates = []
+        attack_soldier_ratio = self._ai_params(daimyo_id)["attack_soldier_ratio"]
+        combat_system = None
+        if config.AI_USE_WIN_TABLE:
+            from systems.combat import CombatSystem
+            combat_system = CombatSystem(self.game_state)
 
         for adj_id in province.adjacent_provinces:
             adj = self.game_state.get_province(adj_id)
             if not adj:
                 continue
 
-            adj_owner = self.game_state.get_daimyo(adj.owner_daimyo_id) if adj.owner_daimyo_id else None
-            adj_owner_name = adj_owner.clan_name if adj_owner else "無所属"
+            if debug:
+                adj_owner = self.game_state.get_daimyo(adj.owner_daimyo_id) if adj.owner_daimyo_id else None
+                adj_owner_name = adj_owner.clan_name if adj_owner else "無所属"
 
             if adj.owner_daimyo_id == daimyo_id:
-                print(f"  {adj.name}({adj_owner_name}): 自領地のためスキップ")
+                if debug:
+                    ai_logger.debug("  %s(%s): 自領地のためスキップ", adj.name, adj_owner_name)
                 continue
 
             # 外交関係をチェック
             if self.diplomacy_system and not self.diplomacy_system.can_attack(daimyo_id, adj.owner_daimyo_id):
-                print(f"  {adj.name}({adj_owner_name}): 外交関係により攻撃不可")
+                if debug:
+                    ai_logger.debug("  %s(%s): 外交関係により攻撃不可", adj.name, adj_owner_name)
+                continue
+
+            # 戦力比較（勝率表を使う場合はAIの最大派遣率での勝率で判定）
+            if combat_system:
+                attack_force = int(province.soldiers * config.ATTACK_RATIO_OPTIONS[2])
+                win_probability = combat_system.estimate_attack(
+                    province, attack_force, adj, province.governor_general_id
+                )["win_probability"]
+                if win_probability >= config.AI_ATTACK_WIN_PROBABILITY:
+                    if debug:
+                        ai_logger.debug("  %s(%s): 攻撃可能（勝率%.2f）", adj.name, adj_owner_name, win_probability)
+                    candidates.append((adj_id, adj.soldiers))
+                elif debug:
+                    ai_logger.debug("  %s(%s): 勝率不足（勝率%.2f）", adj.name, adj_owner_name, win_probability)
                 continue
 
-            # 戦力比較
-            required = adj.soldiers * 1.35
+            required = adj.soldiers * attack_soldier_ratio
             if province.soldiers >= required:
-                print(f"  {adj.name}({adj_owner_name}): 攻撃可能（兵{province.soldiers} >= {required:.0f}）")
+                if debug:
+                    ai_logger.debug("  %s(%s): 攻撃可能（兵%d >= %.0f）", adj.name, adj_owner_name, province.soldiers, required)
                 candidates.append((adj_id, adj.soldiers))
-            else:
-                print(f"  {adj.name}({adj_owner_name}): 兵力不足（兵{province.soldiers} < {required:.0f}）")
+            elif debug:
+                ai_logger.debug("  %s(%s): 兵力不足（兵%d < %.0f）", adj.name, adj_owner_name, province.soldiers, required)
 
         if candidates:
             candidates.sort(key=lambda x: x[1])
-            target = self.game_state.get_province(candidates[0][0])
-            print(f"[DEBUG-攻撃対象検索] 攻撃対象決定: {target.name}")
+            if debug:
+                target = self.game_state.get_province(candidates[0][0])
+                ai_logger.debug("[DEBUG-攻撃対象検索] 攻撃対象決定: %s", target.name)
             return candidates[0][0]
 
-        print(f"[DEBUG-攻撃対象検索] 攻撃可能な対象なし")
+        ai_logger.debug("[DEBUG-攻撃対象検索] 攻撃可能な対象なし")
         return None
 
     def _get_max_adjacent_enemy_soldiers(self, province: Province, daimyo_id: int) -> int:
         """隣接する敵領地の最大兵力を取得"""
+        # 自領地で条約を結んでいなければ、隣接する他勢力はすべて攻撃可能なので国境索引の値と一致する
+        if province.owner_daimyo_id == daimyo_id and not self.game_state.has_active_treaty(daimyo_id):
+            return self.game_state.border_index.get_max_foreign_soldiers(province.id)
+
         max_soldiers = 0
 
         for adj_id in province.adjacent_provinces:
@@ -796,7 +1031,8 @@ class SequentialTurnManager:
                     continue
 
                 # デバッグログ: 実行時の情報を記録
-                print(f"[DEBUG-実行] {daimyo.clan_name}の軍事コマンド実行: {province.name}(現在兵{province.soldiers})から{target_province.name}へ攻撃（攻撃兵力{attack_force}）")
+                turn_logger.debug("[DEBUG-実行] %sの軍事コマンド実行: %s(現在兵%d)から%sへ攻撃（攻撃兵力%d）",
+                                  daimyo.clan_name, province.name, province.soldiers, target_province.name, attack_force)
 
                 # 出陣ログ
                 defender = self.game_state.get_daimyo(target_province.owner_daimyo_id)
@@ -814,42 +1050,31 @@ class SequentialTurnManager:
                         # 攻撃失敗のログを追加
                         fail_msg = f"【{daimyo.clan_name}】{province.name}からの出陣失敗: {result.get('message', '不明')}（必要兵力{attack_force}、現在{province.soldiers}）"
                         self.turn_events.append(fail_msg)
-                        print(f"[DEBUG] {fail_msg}")
+                        turn_logger.debug("[DEBUG] %s", fail_msg)
                         continue
 
                     army = result["army"]
 
                     # 戦闘計算
                     combat_system = CombatSystem(self.game_state)
-                    battle_result = combat_system.resolve_battle(army, target_province)
+                    battle_result = combat_system.resolve_battle(
+                        army, target_province, record_rounds=not self.quiet_battles
+                    )
 
                     # 戦闘データを作成
-                    attacker_general = self.game_state.get_general(army.general_id) if army.general_id else None
-                    defender_general = self.game_state.get_general(target_province.governor_general_id) if target_province.governor_general_id else None
-
-                    battle_data = {
-                        "attacker_name": daimyo.clan_name,
-                        "defender_name": defender_name,
-                        "attacker_province": province.name,
-                        "defender_province": target_province.name,
-                        "attacker_troops": army.total_troops,
-                        "defender_troops": target_province.soldiers,
-                        "attacker_general": attacker_general.name if attacker_general else None,
-                        "defender_general": defender_general.name if defender_general else None,
-                        "attacker_general_obj": attacker_general,
-                        "defender_general_obj": defender_general,
-                        "attacker_daimyo_obj": daimyo,
-                        "defender_daimyo_obj": defender,
-                        "attacker_general_id": army.general_id,
-                        "defender_general_id": target_province.governor_general_id,
-                        "attacker_daimyo_id": daimyo.id,
-                        "defender_daimyo_id": target_province.owner_daimyo_id,
-                        "result": battle_result,
-                        "army": army,
-                        "target_province_id": target_id,
-                        "origin_province_id": province.id,
-                        "combat_system": combat_system
-                    }
+                    if self.quiet_battles:
+                        battle_data = {
+                            "attacker_daimyo_id": daimyo.id,
+                            "defender_daimyo_id": target_province.owner_daimyo_id,
+                            "result": battle_result,
+                            "target_province_id": target_id,
+                            "origin_province_id": province.id
+                        }
+                    else:
+                        battle_data = self._build_battle_data(
+                            daimyo, defender, defender_name, province, target_province,
+                            army, battle_result, combat_system
+                        )
 
                     # 戦闘演出（UIへ制御を渡す）
                     yield ("battle_animation", battle_data)
@@ -891,11 +1116,53 @@ class SequentialTurnManager:
 
         return None
 
+    def _build_battle_data(self, daimyo, defender, defender_name, province, target_province,
+                           army, battle_result, combat_system) -> Dict[str, Any]:
+        """戦闘演出用の戦闘データを作成"""
+        attacker_general = self.game_state.get_general(army.general_id) if army.general_id else None
+        defender_general = self.game_state.get_general(target_province.governor_general_id) if target_province.governor_general_id else None
+
+        return {
+            "attacker_name": daimyo.clan_name,
+            "defender_name": defender_name,
+            "attacker_province": province.name,
+            "defender_province": target_province.name,
+            "attacker_troops": army.total_troops,
+            "defender_troops": target_province.soldiers,
+            "attacker_general": attacker_general.name if attacker_general else None,
+            "defender_general": defender_general.name if defender_general else None,
+            "attacker_general_obj": attacker_general,
+            "defender_general_obj": defender_general,
+            "attacker_daimyo_obj": daimyo,
+            "defender_daimyo_obj": defender,
+            "attacker_general_id": army.general_id,
+            "defender_general_id": target_province.governor_general_id,
+            "attacker_daimyo_id": daimyo.id,
+            "defender_daimyo_id": target_province.owner_daimyo_id,
+            "result": battle_result,
+            "army": army,
+            "target_province_id": target_province.id,
+            "origin_province_id": province.id,
+            "combat_system": combat_system
+        }
+
+    def close(self):
+        """並列計画のワーカープロセスを終了"""
+        if self.parallel_planner is not None:
+            self.parallel_planner.close()
+            self.parallel_planner = None
+
     def _turn_end(self):
         """ターン終了処理"""
         # 統計を更新
         self.game_state.update_all_statistics()
 
+        # AI判断のキャッシュのヒット率
+        if self.decision_cache is not None:
+            hits, lookups = self.decision_cache.end_turn()
+            ai_logger.debug("[AI判断キャッシュ] ターン%d: ヒット %d/%d（%.0f%%）",
+                            self.game_state.current_turn, hits, lookups, 100 * hits / max(lookups, 1))
+
         # 20ターンごとにコマンド統計を表示
         if self.game_state.current_turn > 0 and self.game_state.current_turn % 20 == 0:
             stats_report = self.game_state.get_command_statistics_report()
@@ -0,0 +1,103 @@
+"""
+チャンネル別ログ管理モジュール
+
+ai / combat / transfer / turn のチャンネルごとにログレベルを設定できる。
+レベルの既定値は config.LOG_LEVELS で指定する。
+
+使い方:
+    logger = get_logger("ai")
+    logger.debug("%sの%s: カテゴリ=%s", daimyo.clan_name, province.name, category)
+
+    # 引数の計算自体が重い場合は判定で囲む
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("領地: %s", ", ".join(p.name for p in provinces))
+
+メッセージは%書式で渡すため、無効なチャンネルでは文字列の組み立てを行わない。
+"""
+import logging
+import sys
+from typing import Dict, Optional
+
+import config
+
+# チャンネル一覧
+CHANNELS = ("ai", "combat", "transfer", "turn")
+
+# ロガー名の接頭辞（nobunaga.ai など）
+LOGGER_PREFIX = "nobunaga"
+
+# 全チャンネル無効化に使うレベル（CRITICALより上）
+DISABLED_LEVEL = logging.CRITICAL + 1
+
+_configured = False
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """出力時点のsys.stdoutへ書き出すハンドラ
+
+    redirect_stdout() でstdoutを差し替えた場合も追従する
+    """
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+    def flush(self):
+        # printと同じく1行ごとのflushはしない（出力が多いと大きな負担になる）
+        pass
+
+
+def get_logger(channel: str) -> logging.Logger:
+    """チャンネルのロガーを取得（初回呼び出し時にconfigのレベルを適用）"""
+    if channel not in CHANNELS:
+        raise ValueError(f"不明なログチャンネル: {channel}")
+    if not _configured:
+        configure_logging()
+    return logging.getLogger(f"{LOGGER_PREFIX}.{channel}")
+
+
+def configure_logging(levels: Optional[Dict[str, str]] = None):
+    """チャンネルごとのログレベルを設定
+
+    Args:
+        levels: チャンネル名 → レベル名（"DEBUG", "INFO", "WARNING" など）。
+            省略したチャンネルは config.LOG_LEVELS の値を使う
+    """
+    global _configured
+    _configured = True
+
+    parent = logging.getLogger(LOGGER_PREFIX)
+    if not parent.handlers:
+        # これまでのprint出力と同じく、メッセージだけを標準出力へ書く
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        parent.addHandler(handler)
+        parent.propagate = False
+
+    merged = dict(config.LOG_LEVELS)
+    merged.update(levels or {})
+    for channel in CHANNELS:
+        level = merged.get(channel, "WARNING")
+        if isinstance(level, str):
+            level = logging.getLevelName(level.upper())
+        logging.getLogger(f"{LOGGER_PREFIX}.{channel}").setLevel(level)
+
+
+def set_channel_level(channel: str, level):
+    """1チャンネルのログレベルを変更"""
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    get_logger(channel).setLevel(level)
+
+
+def disable_all():
+    """全チャンネルを無効化（ヘッドレス実行用）"""
+    for channel in CHANNELS:
+        get_logger(channel).setLevel(DISABLED_LEVEL)
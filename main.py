@@ -436,7 +436,8 @@ class Game:
             'total_provinces': len(self.game_state.provinces),
             # 攻撃選択画面用
             'selected_attack_target_id': self.selected_attack_target_id,
-            'selected_attack_ratio': self.selected_attack_ratio
+            'selected_attack_ratio': self.selected_attack_ratio,
+            'combat_system': self.combat_system
         }
 
         # ボタンを辞書にまとめる
@@ -101,6 +101,12 @@ class Army:
         """移動中か"""
         return self.destination_province_id is not None
 
+    def clone(self) -> "Army":
+        """高速コピー（GameState.fork用）"""
+        clone = Army.__new__(Army)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
     def to_dict(self) -> dict:
         """辞書形式に変換（セーブ用）"""
         return {
@@ -104,9 +104,14 @@ class Daimyo:
         """敵対的か（関係値 < 0）"""
         return self.get_relation(other_daimyo_id) < 0
 
-    def age_one_year(self):
-        """1年加齢"""
+    def age_one_year(self, rng=None):
+        """1年加齢
+
+        Args:
+            rng: 乱数生成器（random.Random）。省略時はrandomモジュールを使う
+        """
         import random
+        rng = rng or random
         self.age += 1
 
         # 年齢による健康減少（より速く）
@@ -114,16 +119,16 @@ class Daimyo:
 
         if self.age > 60:
             # 60歳以上：大きく減少
-            health_loss = random.randint(3, 8)
+            health_loss = rng.randint(3, 8)
         elif self.age > 50:
             # 50歳以上：中程度減少
-            health_loss = random.randint(2, 5)
+            health_loss = rng.randint(2, 5)
         elif self.age > 40:
             # 40歳以上：小さく減少
-            health_loss = random.randint(1, 3)
+            health_loss = rng.randint(1, 3)
         else:
             # 40歳以下：ごく稀に減少
-            if random.random() < 0.1:  # 10%の確率
+            if rng.random() < 0.1:  # 10%の確率
                 health_loss = 1
 
         self.health = max(0, self.health - health_loss)
@@ -156,6 +161,14 @@ class Daimyo:
                 self.total_rice += province.rice
                 self.total_military_strength += province.soldiers
 
+    def clone(self) -> "Daimyo":
+        """高速コピー（GameState.fork用）"""
+        clone = Daimyo.__new__(Daimyo)
+        clone.__dict__.update(self.__dict__)
+        clone.controlled_provinces = list(self.controlled_provinces)
+        clone.relations = dict(self.relations)
+        return clone
+
     def to_dict(self) -> dict:
         """辞書形式に変換（セーブ用）"""
         return {
@@ -35,7 +35,10 @@ class DiplomaticRelation:
         # 関係タイプと条約期間
         # ========================================
         self.relation_type = RelationType.NEUTRAL
-        self.treaty_duration = 0  # 条約残り期間（ターン数）
+        self.treaty_duration = 0  # 条約期間（締結時のターン数、条約なし・終了後は0）
+        # 条約が切れる条約クロック（GameState.treaty_clock、条約なしの場合はNone）
+        # 残り期間は DiplomacySystem.get_treaty_remaining() で取得する
+        self.treaty_expires_at: Optional[int] = None
 
         # ========================================
         # 条約（旧形式、後方互換性のため残す）
@@ -147,6 +150,12 @@ class DiplomaticRelation:
                 self.has_alliance = False
                 self.alliance_expires_turn = None
 
+    def clone(self) -> "DiplomaticRelation":
+        """高速コピー（GameState.fork用）"""
+        clone = DiplomaticRelation.__new__(DiplomaticRelation)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
     def to_dict(self) -> dict:
         """辞書形式に変換（セーブ用）"""
         return {
@@ -51,6 +51,9 @@ class GameEvent:
         # 選択肢（10%のイベントのみ）
         self.choices = []  # List[EventChoice]
 
+        # コンパイル済み効果（systems.event_compiler.compile_event の結果）
+        self.compiled = None
+
     def has_choices(self) -> bool:
         """選択肢があるか"""
         return len(self.choices) > 0
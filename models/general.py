@@ -21,6 +21,9 @@ class General:
         self.name = name
         self.portrait = f"general_{general_id}.png"
 
+        # 状態の変更を通知する索引（core/general_registry.py、GameStateへの登録時に設定）
+        self._registry = None
+
         # ========================================
         # 忠誠
         # ========================================
@@ -58,15 +61,30 @@ class General:
         # ========================================
         self.special_traits: List[str] = []
 
+    @property
+    def serving_daimyo_id(self) -> Optional[int]:
+        """仕える大名ID（Noneは浪人）"""
+        return self._serving_daimyo_id
+
+    @serving_daimyo_id.setter
+    def serving_daimyo_id(self, value: Optional[int]):
+        self._serving_daimyo_id = value
+        if self._registry is not None:
+            self._registry.update(self)
+
     def assign_to_province(self, province_id: int):
         """領地に配属"""
         self.current_province_id = province_id
         self.is_available = False
+        if self._registry is not None:
+            self._registry.update(self)
 
     def unassign(self):
         """配属解除"""
         self.current_province_id = None
         self.is_available = True
+        if self._registry is not None:
+            self._registry.update(self)
 
     def change_loyalty(self, amount: int):
         """忠誠度を変更（0-100に制限）"""
@@ -103,22 +121,27 @@ class General:
         """諜報ボーナス（知力に基づく）"""
         return 1.0 + (self.intelligence / 100.0) * 0.5  # 最大1.5倍
 
-    def age_one_year(self):
-        """1年加齢"""
+    def age_one_year(self, rng=None):
+        """1年加齢
+
+        Args:
+            rng: 乱数生成器（random.Random）。省略時はrandomモジュールを使う
+        """
         import random
+        rng = rng or random
         self.age += 1
 
         # 年齢による健康減少（大名と同じロジック）
         health_loss = 0
 
         if self.age > 60:
-            health_loss = random.randint(3, 8)
+            health_loss = rng.randint(3, 8)
         elif self.age > 50:
-            health_loss = random.randint(2, 5)
+            health_loss = rng.randint(2, 5)
         elif self.age > 40:
-            health_loss = random.randint(1, 3)
+            health_loss = rng.randint(1, 3)
         else:
-            if random.random() < 0.1:
+            if rng.random() < 0.1:
                 health_loss = 1
 
         self.health = max(0, self.health - health_loss)
@@ -127,6 +150,14 @@ class General:
         """生存しているか"""
         return self.health > 0
 
+    def clone(self) -> "General":
+        """高速コピー（GameState.fork用）"""
+        clone = General.__new__(General)
+        clone.__dict__.update(self.__dict__)
+        clone._registry = None  # 分岐先の索引（GeneralRegistry.clone）が設定する
+        clone.special_traits = list(self.special_traits)
+        return clone
+
     def to_dict(self) -> dict:
         """辞書形式に変換（セーブ用）"""
         return {
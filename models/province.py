@@ -2,12 +2,141 @@
 Province（領地）モデル
 各領地はローカルリソース（金、米、農民、兵士）を管理
 """
-from typing import Optional, List
+from typing import Optional, List, Dict, Set
 import config
 
 
+class ProvinceStore:
+    """領地の数値フィールドを列ごとのリストで保持するストア（struct-of-arrays）
+
+    Provinceはこのストアの1行を参照するビューで、数値フィールドの読み書きは
+    対応する列へ転送される。全領地を一括処理する場合（S1の経済処理など）は
+    Provinceを経由せずに列を直接走査する。
+    """
+
+    # 列として保持するフィールド（Provinceの同名属性がビューになる）
+    COLUMNS = (
+        "owner_daimyo_id",
+        "peasants",
+        "max_peasants",
+        "peasant_loyalty",
+        "soldiers",
+        "soldier_morale",
+        "gold",
+        "rice",
+        "tax_rate",
+        "development_level",
+        "town_level",
+        "castle_defense",
+        "terrain_code"
+    )
+
+    def __init__(self):
+        self.size = 0
+        self.province_ids: List[int] = []  # 行 → 領地ID
+        self.rows: Dict[int, int] = {}  # 領地ID → 行
+        # 列名 → 値のリスト（行番号でアクセス）
+        self.columns: Dict[str, list] = {column: [] for column in self.COLUMNS}
+
+        # 地形コード ⇔ 地形名
+        self.terrain_names: List[str] = []
+        self.terrain_codes: Dict[str, int] = {}
+
+        # Province経由で兵力が変更された領地ID（BorderIndexが読み出してクリアする）
+        self.soldiers_changed: Set[int] = set()
+
+    def add_row(self, province_id: int) -> int:
+        """空の行を追加し、行番号を返す"""
+        row = self.size
+        self.size += 1
+        self.province_ids.append(province_id)
+        self.rows[province_id] = row
+        for values in self.columns.values():
+            values.append(None)
+        return row
+
+    def get_terrain_code(self, terrain_type: str) -> int:
+        """地形名を地形コードに変換（未登録の地形は追加する）"""
+        code = self.terrain_codes.get(terrain_type)
+        if code is None:
+            code = len(self.terrain_names)
+            self.terrain_names.append(terrain_type)
+            self.terrain_codes[terrain_type] = code
+        return code
+
+    def copy_row(self, source: "ProvinceStore", source_row: int) -> int:
+        """別のストアの1行をコピーして追加し、行番号を返す"""
+        row = self.add_row(source.province_ids[source_row])
+        for column, values in self.columns.items():
+            values[row] = source.columns[column][source_row]
+        terrain_type = source.terrain_names[source.columns["terrain_code"][source_row]]
+        self.columns["terrain_code"][row] = self.get_terrain_code(terrain_type)
+        return row
+
+    def clone(self) -> "ProvinceStore":
+        """全列をコピーした新しいストアを作成（GameState.fork用）"""
+        clone = ProvinceStore.__new__(ProvinceStore)
+        clone.size = self.size
+        clone.province_ids = list(self.province_ids)
+        clone.rows = dict(self.rows)
+        clone.columns = {column: list(values) for column, values in self.columns.items()}
+        clone.terrain_names = list(self.terrain_names)
+        clone.terrain_codes = dict(self.terrain_codes)
+        clone.soldiers_changed = set(self.soldiers_changed)
+        return clone
+
+
+def _column_property(column: str) -> property:
+    """ProvinceStoreの列を読み書きするプロパティを作成"""
+    def fget(self):
+        return self._columns[column][self._row]
+
+    def fset(self, value):
+        self._columns[column][self._row] = value
+
+    return property(fget, fset)
+
+
 class Province:
-    """領地クラス - ゲームの基本単位"""
+    """領地クラス - ゲームの基本単位
+
+    数値フィールドはProvinceStoreの列に保持される（ProvinceStore.COLUMNS参照）。
+    ストアを省略した場合は、この領地専用のストアを作成する。
+    """
+
+    # ========================================
+    # ストアの列へのビュー
+    # ========================================
+    owner_daimyo_id = _column_property("owner_daimyo_id")
+    peasants = _column_property("peasants")
+    max_peasants = _column_property("max_peasants")
+    peasant_loyalty = _column_property("peasant_loyalty")
+    @property
+    def soldiers(self) -> int:
+        return self._columns["soldiers"][self._row]
+
+    @soldiers.setter
+    def soldiers(self, value: int):
+        # 兵力の変更は隣接領地の国境索引（最大兵力）に影響するため記録する
+        self._columns["soldiers"][self._row] = value
+        self._store.soldiers_changed.add(self.id)
+
+    soldier_morale = _column_property("soldier_morale")
+    gold = _column_property("gold")
+    rice = _column_property("rice")
+    tax_rate = _column_property("tax_rate")
+    development_level = _column_property("development_level")
+    town_level = _column_property("town_level")
+    castle_defense = _column_property("castle_defense")
+
+    @property
+    def terrain_type(self) -> str:
+        """地形名（ストアには地形コードで保持）"""
+        return self._store.terrain_names[self._columns["terrain_code"][self._row]]
+
+    @terrain_type.setter
+    def terrain_type(self, value: str):
+        self._columns["terrain_code"][self._row] = self._store.get_terrain_code(value)
 
     def __init__(
         self,
@@ -15,8 +144,16 @@ class Province:
         name: str,
         position: tuple[int, int],
         terrain_type: str = config.TERRAIN_PLAINS,
-        max_peasants: int = 8000
+        max_peasants: int = 8000,
+        store: Optional[ProvinceStore] = None
     ):
+        # ========================================
+        # 数値フィールドの格納先
+        # ========================================
+        self._store = store if store is not None else ProvinceStore()
+        self._columns = self._store.columns
+        self._row = self._store.add_row(province_id)
+
         # ========================================
         # アイデンティティ
         # ========================================
@@ -181,6 +318,24 @@ class Province:
         """ターン開始時にコマンドフラグをリセット"""
         self.command_used_this_turn = False
 
+    def clone(self, store: Optional[ProvinceStore] = None) -> "Province":
+        """高速コピー（GameState.fork用）
+
+        隣接リストと座標はゲーム中に変化しないため共有する
+
+        Args:
+            store: コピー先のストア（ProvinceStore.clone()で列ごとコピー済みのもの）。
+                省略した場合は、この領地の行だけを新しいストアにコピーする
+        """
+        clone = Province.__new__(Province)
+        clone.__dict__.update(self.__dict__)
+        if store is None:
+            store = ProvinceStore()
+            clone._row = store.copy_row(self._store, self._row)
+        clone._store = store
+        clone._columns = store.columns
+        return clone
+
     def to_dict(self) -> dict:
         """辞書形式に変換（セーブ用）"""
         return {
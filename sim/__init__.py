@@ -0,0 +1 @@
+"""ヘッドレスシミュレーション（pygameを使わない対局実行）"""
@@ -0,0 +1,35 @@
+"""
+ヘッドレスシミュレーションのエントリーポイント
+
+使い方:
+    python -m sim --games 100 --max-turns 100
+    python -m sim --games 1 --seed 12345 --verbose   # 対局の再現
+"""
+import argparse
+import time
+
+import config
+from sim.headless import run_games, summarize
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pygameなしで全AI対局を実行する")
+    parser.add_argument("--games", type=int, default=10, help="対局数")
+    parser.add_argument("--max-turns", type=int, default=config.VICTORY_TURN_LIMIT, help="1対局の最大ターン数")
+    parser.add_argument("--seed", type=int, default=None, help="最初の対局のシード（i局目はSEED+i、既定: ランダム）")
+    parser.add_argument("--verbose", action="store_true", help="ゲーム内部のデバッグ出力を表示する")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    records = run_games(args.games, args.max_turns, verbose=args.verbose, base_seed=args.seed)
+    wall_time = time.perf_counter() - start
+
+    for line in summarize(records, wall_time):
+        print(line)
+    if args.verbose or args.games <= 10:
+        for record in records:
+            print(f"  {record}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+ヘッドレスシミュレーション
+
+pygame・ImageManager・ミキサーを一切使わずに、
+SequentialTurnManager.execute_turn() を最後まで回す。
+全大名をAI操作にし、UI向けのyield（プレイヤー入力・演出・AIディレイ）は即座に応答する。
+"""
+import contextlib
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import config
+from core.game_initializer import initialize_game_systems
+from debug import log_channels
+
+
+class GameRecord:
+    """1対局の結果"""
+
+    def __init__(self):
+        self.seed: Optional[int] = None  # 乱数シード（同じシードで対局を再現できる）
+        self.winner_id: Optional[int] = None  # 勝者の大名ID（時間切れの場合はNone）
+        self.turns = 0  # 実行したターン数
+        self.battles = 0  # 発生した戦闘数
+        self.elapsed = 0.0  # 実行時間（秒）
+        # ターンごとの大名別領地数 province_history[turn][daimyo_id] = 領地数
+        self.province_history: List[Dict[int, int]] = []
+
+    def __repr__(self) -> str:
+        return f"GameRecord(Seed: {self.seed}, Winner: {self.winner_id}, Turns: {self.turns}, Battles: {self.battles})"
+
+
+class HeadlessGame:
+    """1対局をヘッドレスで実行するクラス"""
+
+    # プレイヤー入力待ちに返す空のコマンド（全AI操作では通常発生しない）
+    EMPTY_PLAYER_COMMANDS = {"internal_commands": [], "military_commands": []}
+
+    def __init__(self, max_turns: int = config.VICTORY_TURN_LIMIT, seed: Optional[int] = None,
+                 independent_rng_streams: bool = False):
+        """
+        Args:
+            max_turns: 最大ターン数
+            seed: 乱数シード（Noneの場合はランダム、record.seedに記録される）
+            independent_rng_streams: Trueの場合、戦闘・イベント・AI・加齢で独立した乱数列を使う
+        """
+        systems = initialize_game_systems(all_ai=True, seed=seed,
+                                          independent_rng_streams=independent_rng_streams)
+        self.game_state = systems['game_state']
+        self.turn_manager = systems['turn_manager']
+        self.turn_manager.quiet_battles = True  # 戦闘演出は表示しない
+        self.systems = systems
+        self.max_turns = max_turns
+        self.record = GameRecord()
+        self.record.seed = self.game_state.seed
+
+    def run(self) -> GameRecord:
+        """勝者が決まるか最大ターン数に達するまで対局を進める"""
+        start = time.perf_counter()
+
+        try:
+            while self.record.turns < self.max_turns:
+                winner = self.run_turn()
+                if winner is not None:
+                    self.record.winner_id = winner
+                    break
+        finally:
+            self.turn_manager.close()
+
+        self.record.elapsed = time.perf_counter() - start
+        return self.record
+
+    def run_turn(self) -> Optional[int]:
+        """1ターンを実行し、勝者がいればその大名IDを返す"""
+        turn_gen = self.turn_manager.execute_turn()
+        reply = None
+        result = None
+
+        try:
+            while True:
+                event = turn_gen.send(reply)
+                reply = self._answer(event)
+        except StopIteration as e:
+            result = e.value
+
+        self.record.turns += 1
+        self.record.province_history.append(self._count_provinces())
+
+        # 選択待ちイベントは応答する者がいないため破棄
+        self.turn_manager.pending_event_choices.clear()
+
+        if result and result.get("winner"):
+            return result["winner"]
+        return self.game_state.check_victory_conditions()
+
+    def _count_provinces(self) -> Dict[int, int]:
+        """大名別の支配領地数を集計"""
+        counts = {daimyo_id: 0 for daimyo_id in self.game_state.daimyo}
+        for province in self.game_state.provinces.values():
+            if province.owner_daimyo_id is not None:
+                counts[province.owner_daimyo_id] += 1
+        return counts
+
+    def _answer(self, event: Tuple[str, Any]) -> Optional[Dict]:
+        """UI向けのyieldに即座に応答する"""
+        event_type = event[0]
+
+        if event_type == "player_turn":
+            return self.EMPTY_PLAYER_COMMANDS
+        if event_type == "battle_animation":
+            self.record.battles += 1
+
+        # turn_start / message / ai_action_delay / death_animation / victory / game_over
+        return None
+
+
+def run_games(num_games: int, max_turns: int = config.VICTORY_TURN_LIMIT,
+              verbose: bool = False, base_seed: Optional[int] = None) -> List[GameRecord]:
+    """複数の対局を順番に実行する
+
+    Args:
+        num_games: 対局数
+        max_turns: 1対局の最大ターン数
+        verbose: Falseの場合、ログチャンネルを無効化しゲーム内部のデバッグ出力を破棄する
+        base_seed: 指定した場合、i局目をシード base_seed + i で実行する（Noneの場合はランダム）
+    """
+    if verbose:
+        log_channels.configure_logging()
+    else:
+        log_channels.disable_all()
+
+    records = []
+    for i in range(num_games):
+        seed = base_seed + i if base_seed is not None else None
+        if verbose:
+            records.append(HeadlessGame(max_turns, seed).run())
+        else:
+            with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+                records.append(HeadlessGame(max_turns, seed).run())
+    return records
+
+
+def summarize(records: List[GameRecord], wall_time: float) -> List[str]:
+    """対局結果のサマリーを生成（games/sec・turns/sec）"""
+    total_turns = sum(r.turns for r in records)
+    total_battles = sum(r.battles for r in records)
+    wall_time = max(wall_time, 1e-9)
+
+    lines = []
+    lines.append(f"対局数: {len(records)}  総ターン数: {total_turns}  総戦闘数: {total_battles}")
+    lines.append(f"実行時間: {wall_time:.2f}秒")
+    lines.append(f"games/sec: {len(records) / wall_time:.2f}  turns/sec: {total_turns / wall_time:.1f}")
+
+    wins: Dict[Optional[int], int] = {}
+    for r in records:
+        wins[r.winner_id] = wins.get(r.winner_id, 0) + 1
+    for winner_id in sorted(wins, key=lambda w: (w is None, w)):
+        label = f"大名{winner_id}" if winner_id is not None else "決着なし"
+        unit = "勝" if winner_id is not None else "局"
+        lines.append(f"  {label}: {wins[winner_id]}{unit}")
+
+    return lines
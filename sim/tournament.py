@@ -0,0 +1,314 @@
+"""
+トーナメント実行
+
+シード × シナリオ × config上書き の組み合わせで多数のヘッドレス対局を
+multiprocessingのプロセスプールに分散し、勝率を信頼区間付きで集計する。
+
+使い方:
+    python -m sim.tournament --games 1000 --workers 16
+    python -m sim.tournament --games 200 --set MIN_GARRISON_TROOPS=150
+    python -m sim.tournament --games 200 --matrix matrix.json --output results.jsonl
+
+matrix.json の形式:
+    [
+        {"label": "default"},
+        {"label": "garrison150", "overrides": {"MIN_GARRISON_TROOPS": 150}},
+        {"label": "small_map", "scenario": {"provinces": "path/to/provinces.json"}}
+    ]
+    --set を併用すると全エントリに共通の上書きになる（エントリの overrides に同じキーがあればそちらを使う）
+"""
+import argparse
+import ast
+import contextlib
+import json
+import math
+import multiprocessing
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import config
+from debug import log_channels
+from sim.headless import HeadlessGame
+
+# シナリオで差し替え可能なデータファイル（シナリオキー → configの定数名）
+SCENARIO_FILES = {
+    "provinces": "PROVINCES_DATA",
+    "daimyo": "DAIMYO_DATA",
+    "generals": "GENERALS_DATA",
+    "events": "EVENTS_DATA"
+}
+
+
+class GameJob:
+    """1対局分のジョブ（ワーカープロセスへ渡す）"""
+
+    def __init__(
+        self,
+        job_id: int,
+        seed: int,
+        label: str = "default",
+        scenario: Optional[Dict[str, str]] = None,
+        overrides: Optional[Dict[str, Any]] = None,
+        max_turns: int = config.VICTORY_TURN_LIMIT
+    ):
+        self.job_id = job_id
+        self.seed = seed
+        self.label = label
+        self.scenario = scenario or {}  # {"provinces": path, "daimyo": path, ...}
+        self.overrides = overrides or {}  # {"MIN_GARRISON_TROOPS": 150, ...}
+        self.max_turns = max_turns
+
+    def __repr__(self) -> str:
+        return f"GameJob({self.job_id}: {self.label}, Seed: {self.seed})"
+
+
+class TournamentStats:
+    """ラベル（設定の組み合わせ）ごとの集計"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.games = 0
+        self.wins: Dict[Optional[int], int] = {}  # 勝者ID（None=決着なし） → 勝利数
+        self.victory_turns: List[int] = []
+        self.total_turns = 0
+        self.total_elapsed = 0.0
+
+    def add(self, result: Dict[str, Any]):
+        """1対局の結果を追加"""
+        self.games += 1
+        winner = result["winner"]
+        self.wins[winner] = self.wins.get(winner, 0) + 1
+        if winner is not None:
+            self.victory_turns.append(result["turns"])
+        self.total_turns += result["turns"]
+        self.total_elapsed += result["elapsed"]
+
+    def win_rate(self, daimyo_id: Optional[int]) -> Tuple[float, float, float]:
+        """勝率と95%信頼区間（Wilson）を返す: (rate, low, high)"""
+        wins = self.wins.get(daimyo_id, 0)
+        rate = wins / self.games if self.games else 0.0
+        low, high = wilson_interval(wins, self.games)
+        return rate, low, high
+
+    def report(self, daimyo_names: Optional[Dict[int, str]] = None) -> List[str]:
+        """集計レポートを生成"""
+        lines = []
+        lines.append(f"■ {self.label}  対局数: {self.games}")
+
+        for winner in sorted(self.wins, key=lambda w: (w is None, w)):
+            rate, low, high = self.win_rate(winner)
+            interval = f"(95%CI {low * 100:.1f}-{high * 100:.1f}%)"
+            if winner is None:
+                lines.append(f"  決着なし: {self.wins[winner]}局 {rate * 100:.1f}% {interval}")
+            else:
+                name = (daimyo_names or {}).get(winner, f"大名{winner}")
+                lines.append(f"  {name}: {self.wins[winner]}勝 勝率{rate * 100:.1f}% {interval}")
+
+        if self.victory_turns:
+            mean_turn = sum(self.victory_turns) / len(self.victory_turns)
+            lines.append(f"  平均決着ターン: {mean_turn:.1f}")
+
+        return lines
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> Tuple[float, float]:
+    """二項比率のWilsonスコア信頼区間"""
+    if trials == 0:
+        return 0.0, 1.0
+
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def run_job(job: GameJob) -> Dict[str, Any]:
+    """ワーカープロセスで1対局を実行し、コンパクトな結果を返す"""
+    log_channels.disable_all()
+    saved = _apply_job_config(job)
+    try:
+        with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+            game = HeadlessGame(job.max_turns, job.seed)
+            record = game.run()
+    finally:
+        _restore_config(saved)
+
+    # 大名ID順に並べた領地数の推移（リストのリスト）
+    daimyo_ids = sorted(game.game_state.daimyo.keys())
+    provinces = [[counts.get(did, 0) for did in daimyo_ids] for counts in record.province_history]
+
+    return {
+        "job_id": job.job_id,
+        "label": job.label,
+        "seed": job.seed,
+        "winner": record.winner_id,
+        "turns": record.turns,
+        "battles": record.battles,
+        "elapsed": record.elapsed,
+        "daimyo_ids": daimyo_ids,
+        "provinces": provinces
+    }
+
+
+def _apply_job_config(job: GameJob) -> Dict[str, Any]:
+    """ジョブのシナリオとconfig上書きを適用し、元の値を返す"""
+    changes = dict(job.overrides)
+    for key, path in job.scenario.items():
+        if key not in SCENARIO_FILES:
+            raise ValueError(f"不明なシナリオキー: {key}")
+        changes[SCENARIO_FILES[key]] = path
+
+    saved = {}
+    for name, value in changes.items():
+        if not hasattr(config, name):
+            raise ValueError(f"config.{name} は存在しません")
+        saved[name] = getattr(config, name)
+        setattr(config, name, value)
+    return saved
+
+
+def _restore_config(saved: Dict[str, Any]):
+    """上書きしたconfigを元に戻す（ワーカーは複数ジョブで再利用されるため）"""
+    for name, value in saved.items():
+        setattr(config, name, value)
+
+
+def build_jobs(
+    games: int,
+    base_seed: int = 0,
+    matrix: Optional[List[Dict[str, Any]]] = None,
+    max_turns: int = config.VICTORY_TURN_LIMIT
+) -> List[GameJob]:
+    """設定行列 × シードのジョブを作成
+
+    各設定に同じシード列を使うため、設定間の比較は対応のある比較になる
+    """
+    matrix = matrix or [{"label": "default"}]
+    jobs = []
+    for entry in matrix:
+        for i in range(games):
+            jobs.append(GameJob(
+                job_id=len(jobs),
+                seed=base_seed + i,
+                label=entry.get("label", "default"),
+                scenario=entry.get("scenario"),
+                overrides=entry.get("overrides"),
+                max_turns=max_turns
+            ))
+    return jobs
+
+
+def run_tournament(
+    jobs: List[GameJob],
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, TournamentStats]:
+    """ジョブをプロセスプールで実行し、ラベルごとに集計する
+
+    Args:
+        jobs: 実行するジョブ
+        workers: ワーカープロセス数（Noneの場合はCPUコア数、1の場合は同一プロセスで実行）
+        on_result: 1対局終わるごとに結果を受け取るコールバック
+    """
+    workers = workers or os.cpu_count() or 1
+    stats: Dict[str, TournamentStats] = {}
+
+    def collect(result):
+        label = result["label"]
+        if label not in stats:
+            stats[label] = TournamentStats(label)
+        stats[label].add(result)
+        if on_result:
+            on_result(result)
+
+    if workers == 1:
+        for job in jobs:
+            collect(run_job(job))
+        return stats
+
+    with multiprocessing.Pool(processes=workers) as pool:
+        # 終わった対局から順に親プロセスへ流す
+        for result in pool.imap_unordered(run_job, jobs, chunksize=1):
+            collect(result)
+
+    return stats
+
+
+def _parse_override(text: str) -> Tuple[str, Any]:
+    """KEY=VALUE 形式の上書き指定を解析（値はPythonリテラル、解析できなければ文字列）"""
+    if "=" not in text:
+        raise argparse.ArgumentTypeError(f"KEY=VALUE 形式で指定してください: {text}")
+    key, raw = text.split("=", 1)
+    try:
+        value = ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        value = raw
+    return key.strip(), value
+
+
+def _load_daimyo_names(path: str) -> Dict[int, str]:
+    """レポート表示用に大名名を読み込む"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {d["id"]: f"{d['clan']}{d['name']}" for d in data["daimyo"]}
+    except (OSError, KeyError, json.JSONDecodeError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ヘッドレス対局をプロセスプールで並列実行し勝率を集計する")
+    parser.add_argument("--games", type=int, default=100, help="設定ごとの対局数")
+    parser.add_argument("--workers", type=int, default=None, help="ワーカープロセス数（既定: CPUコア数）")
+    parser.add_argument("--seed", type=int, default=0, help="最初のシード")
+    parser.add_argument("--max-turns", type=int, default=config.VICTORY_TURN_LIMIT, help="1対局の最大ターン数")
+    parser.add_argument("--set", dest="overrides", action="append", type=_parse_override, default=[],
+                        metavar="KEY=VALUE", help="configの上書き（複数指定可、--matrix と併用時は全エントリ共通）")
+    parser.add_argument("--matrix", help="設定行列のJSONファイル")
+    parser.add_argument("--output", help="1対局ごとの結果を書き出すJSONLファイル")
+    args = parser.parse_args()
+
+    if args.matrix:
+        with open(args.matrix, 'r', encoding='utf-8') as f:
+            matrix = json.load(f)
+        # --set は全エントリ共通の上書き（エントリの overrides が優先）
+        matrix = [
+            dict(entry, overrides={**dict(args.overrides), **(entry.get("overrides") or {})})
+            for entry in matrix
+        ]
+    else:
+        matrix = [{"label": "default", "overrides": dict(args.overrides)}]
+
+    jobs = build_jobs(args.games, args.seed, matrix, args.max_turns)
+    output = open(args.output, "w", encoding="utf-8") if args.output else None
+
+    finished = [0]
+
+    def on_result(result):
+        finished[0] += 1
+        if output:
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+        if finished[0] % 100 == 0:
+            print(f"  {finished[0]}/{len(jobs)} 対局完了")
+
+    start = time.perf_counter()
+    try:
+        stats = run_tournament(jobs, args.workers, on_result)
+    finally:
+        if output:
+            output.close()
+    wall_time = max(time.perf_counter() - start, 1e-9)
+
+    daimyo_names = _load_daimyo_names(config.DAIMYO_DATA)
+    for label_stats in stats.values():
+        for line in label_stats.report(daimyo_names):
+            print(line)
+
+    total_turns = sum(s.total_turns for s in stats.values())
+    print(f"実行時間: {wall_time:.2f}秒  games/sec: {len(jobs) / wall_time:.2f}  turns/sec: {total_turns / wall_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
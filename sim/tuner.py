@@ -0,0 +1,237 @@
+"""
+AIパラメータの調整（遺伝的アルゴリズム）
+
+AIの判断のパラメータ（systems/ai_profile.py の PARAMETERS）を [0, 1] に正規化したベクトルとして扱い、
+世代ごとに候補を1大名に割り当てたヘッドレス対局（他の大名は既定値のAI）をプロセスプールで実行して評価する。
+評価値は候補の大名の最終的な領地の占有率（全領地を取れば1.0）の平均。
+シードごとに候補を割り当てる大名を替え、同じ世代の候補と既定値は同じシード・大名の組で比較する。
+
+- 対局は --stages 段階に分けて実行し、途中の評価値の上限（平均 + 2×標準誤差）が
+  その時点の最良の候補の平均に届かない候補は残りの対局を打ち切る
+- 上位 --elite 個の候補は次の世代へ残し（新しいシードで再評価）、残りは上位半分からの
+  トーナメント選択・一様交叉・ガウス突然変異で作る
+- 最終世代で最も評価値の高い候補を名前付きのAIプロファイルとして保存する（config.AI_PROFILES_DATA）
+
+使い方:
+    python -m sim.tuner --generations 10 --population 16 --games 24 --workers 8 --name tuned
+    python -m sim.tournament --games 200 --set AI_DAIMYO_PROFILES="{1: 'tuned'}"
+"""
+import argparse
+import math
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+import config
+from sim.tournament import GameJob, _load_daimyo_names, run_tournament
+from systems.ai_profile import ATTACK_THRESHOLDS, INTEGER_PARAMETERS, PARAMETERS, get_defaults, save_profile
+
+# 既定では調整しないパラメータ（ターン処理のAI（SequentialTurnManager）が使わない、
+# AISystem だけが読む行動カテゴリの重みと金が少ない転送先の優先度）
+UNUSED_PARAMETERS = tuple(name for name in PARAMETERS if name.startswith("category_")) + ("transfer_poor_priority",)
+
+# 評価値の上限に使う標準誤差の倍率と、打ち切りを判定する最小の対局数（早期打ち切り）
+EARLY_STOP_Z = 2.0
+MIN_GAMES_TO_STOP = 6
+
+
+class Candidate:
+    """候補（正規化したパラメータベクトルと評価の集計）"""
+
+    def __init__(self, genes: List[float]):
+        self.genes = genes
+        self.scores: List[float] = []  # 対局ごとの評価値
+        self.stopped = False  # 早期打ち切りしたか
+
+    @property
+    def fitness(self) -> float:
+        return sum(self.scores) / len(self.scores) if self.scores else 0.0
+
+    def upper_bound(self) -> float:
+        """評価値の上限の目安（平均 + EARLY_STOP_Z × 標準誤差）"""
+        n = len(self.scores)
+        if n < MIN_GAMES_TO_STOP:
+            return math.inf
+        mean = self.fitness
+        variance = sum((s - mean) ** 2 for s in self.scores) / (n - 1)
+        return mean + EARLY_STOP_Z * math.sqrt(variance / n)
+
+
+class Tuner:
+    """AIパラメータの遺伝的アルゴリズムによる調整"""
+
+    def __init__(self, names: List[str], daimyo_ids: List[int], args):
+        """
+        Args:
+            names: 調整するパラメータ名
+            daimyo_ids: 候補を割り当てる大名ID（シードごとに順に替える）
+            args: コマンドライン引数（population, games, stages, elite, sigma, max_turns, workers, seed）
+        """
+        self.names = names
+        self.daimyo_ids = daimyo_ids
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.defaults = get_defaults()
+
+    # ========================================
+    # パラメータベクトル
+    # ========================================
+
+    def encode(self, params: Dict[str, float]) -> List[float]:
+        """パラメータ → 正規化したベクトル"""
+        genes = []
+        for name in self.names:
+            low, high = PARAMETERS[name]
+            genes.append(min(max((params[name] - low) / (high - low), 0.0), 1.0))
+        return genes
+
+    def decode(self, genes: List[float]) -> Dict[str, float]:
+        """正規化したベクトル → パラメータ（調整しないパラメータは含めない）
+
+        派遣率の戦力比閾値は、調整しない閾値（既定値）と合わせて高い段階から順に並べ直す。
+        並べ直しで既定値の閾値が変わる場合は、その閾値も含める。
+        """
+        params = {}
+        for name, gene in zip(self.names, genes):
+            low, high = PARAMETERS[name]
+            value = low + gene * (high - low)
+            params[name] = int(round(value)) if name in INTEGER_PARAMETERS else round(value, 3)
+
+        if any(name in params for name in ATTACK_THRESHOLDS):
+            values = sorted((params.get(name, self.defaults[name]) for name in ATTACK_THRESHOLDS), reverse=True)
+            for name, value in zip(ATTACK_THRESHOLDS, values):
+                if name in params or value != self.defaults[name]:
+                    params[name] = value
+        return params
+
+    # ========================================
+    # 評価
+    # ========================================
+
+    def evaluate(self, candidates: List[Candidate], generation: int) -> float:
+        """候補を対局で評価し（早期打ち切りあり）、同じシードでの既定値の評価値を返す"""
+        args = self.args
+        base_seed = args.base_seed + generation * args.games
+        baseline = Candidate(self.encode(self.defaults))
+        entries = [baseline] + candidates
+        for entry in entries:
+            entry.scores = []
+            entry.stopped = False
+
+        stage_size = max(1, math.ceil(args.games / args.stages))
+        for stage_start in range(0, args.games, stage_size):
+            games = range(stage_start, min(stage_start + stage_size, args.games))
+            active = [i for i, entry in enumerate(entries) if not entry.stopped]
+            jobs = []
+            for i in active:
+                for game in games:
+                    seat = self.daimyo_ids[(base_seed + game) % len(self.daimyo_ids)]
+                    overrides = {} if i == 0 else {"AI_DAIMYO_PROFILES": {seat: self.decode(entries[i].genes)}}
+                    jobs.append(GameJob(len(jobs), base_seed + game, label=f"{i}:{seat}",
+                                        overrides=overrides, max_turns=args.max_turns))
+
+            def on_result(result):
+                index, seat = (int(x) for x in result["label"].split(":"))
+                final = result["provinces"][-1] if result["provinces"] else []
+                share = final[result["daimyo_ids"].index(seat)] / max(sum(final), 1) if final else 0.0
+                entries[index].scores.append(share)
+
+            run_tournament(jobs, args.workers, on_result)
+
+            # 最良の候補の平均に上限が届かない候補は打ち切る（既定値は最後まで評価する）
+            best = max(entry.fitness for entry in candidates if not entry.stopped)
+            for entry in candidates:
+                if not entry.stopped and entry.upper_bound() < best:
+                    entry.stopped = True
+
+        return baseline.fitness
+
+    # ========================================
+    # 世代交代
+    # ========================================
+
+    def initial_population(self) -> List[Candidate]:
+        """既定値と、既定値の周りの乱数の候補"""
+        center = self.encode(self.defaults)
+        population = [Candidate(list(center))]
+        while len(population) < self.args.population:
+            population.append(Candidate(self._mutate(center)))
+        return population
+
+    def next_population(self, ranked: List[Candidate]) -> List[Candidate]:
+        """上位の候補を残し、残りを選択・交叉・突然変異で作る"""
+        args = self.args
+        population = [Candidate(list(c.genes)) for c in ranked[:args.elite]]
+        parents = ranked[:max(2, len(ranked) // 2)]
+        while len(population) < args.population:
+            a = min(self.rng.sample(parents, 2), key=ranked.index)
+            b = min(self.rng.sample(parents, 2), key=ranked.index)
+            child = [x if self.rng.random() < 0.5 else y for x, y in zip(a.genes, b.genes)]
+            population.append(Candidate(self._mutate(child)))
+        return population
+
+    def _mutate(self, genes: List[float]) -> List[float]:
+        return [min(max(g + self.rng.gauss(0.0, self.args.sigma), 0.0), 1.0) for g in genes]
+
+    def run(self) -> Tuple[Dict[str, float], float, float]:
+        """調整を実行し、(最良のパラメータ, その評価値, 同じシードでの既定値の評価値) を返す"""
+        args = self.args
+        population = self.initial_population()
+        best: Optional[Candidate] = None
+        baseline = 0.0
+
+        for generation in range(args.generations):
+            start = time.perf_counter()
+            baseline = self.evaluate(population, generation)
+            ranked = sorted(population, key=lambda c: (c.stopped, -c.fitness))
+            best = ranked[0]
+            stopped = sum(1 for c in population if c.stopped)
+            print(f"世代{generation + 1}: 最良 {best.fitness:.3f} / 既定値 {baseline:.3f} / "
+                  f"平均 {sum(c.fitness for c in population) / len(population):.3f}  "
+                  f"打ち切り {stopped}/{len(population)}  ({time.perf_counter() - start:.1f}秒)")
+            if generation + 1 < args.generations:
+                population = self.next_population(ranked)
+
+        return self.decode(best.genes), best.fitness, baseline
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AIの判断のパラメータを対局の結果から遺伝的アルゴリズムで調整する")
+    parser.add_argument("--name", default="tuned", help="保存するAIプロファイル名")
+    parser.add_argument("--params", nargs="+", default=None,
+                        help=f"調整するパラメータ（既定: {', '.join(UNUSED_PARAMETERS)} 以外のすべて）")
+    parser.add_argument("--generations", type=int, default=10, help="世代数")
+    parser.add_argument("--population", type=int, default=16, help="1世代の候補数")
+    parser.add_argument("--elite", type=int, default=2, help="次の世代へ残す上位の候補数")
+    parser.add_argument("--sigma", type=float, default=0.1, help="突然変異の標準偏差（正規化した値に対して）")
+    parser.add_argument("--games", type=int, default=24, help="候補ごとの1世代の対局数")
+    parser.add_argument("--stages", type=int, default=3, help="早期打ち切りを判定する段階数")
+    parser.add_argument("--max-turns", type=int, default=50, help="1対局の最大ターン数")
+    parser.add_argument("--workers", type=int, default=None, help="ワーカープロセス数（既定: CPUコア数）")
+    parser.add_argument("--base-seed", type=int, default=0, help="対局の最初のシード（世代ごとに --games ずつ進める）")
+    parser.add_argument("--seed", type=int, default=0, help="遺伝的アルゴリズムの乱数シード")
+    parser.add_argument("--dry-run", action="store_true", help="AIプロファイルを保存しない")
+    args = parser.parse_args()
+
+    names = args.params or [name for name in PARAMETERS if name not in UNUSED_PARAMETERS]
+    unknown = [name for name in names if name not in PARAMETERS]
+    if unknown:
+        parser.error(f"不明なパラメータ: {', '.join(unknown)}")
+
+    daimyo_ids = sorted(_load_daimyo_names(config.DAIMYO_DATA))
+    if not daimyo_ids:
+        parser.error(f"大名データを読み込めません: {config.DAIMYO_DATA}")
+
+    start = time.perf_counter()
+    params, fitness, baseline = Tuner(names, daimyo_ids, args).run()
+    print(f"最良の候補: 評価値 {fitness:.3f}（既定値 {baseline:.3f}）  実行時間: {time.perf_counter() - start:.1f}秒")
+    for name, value in params.items():
+        print(f"  {name}: {value}")
+
+    if not args.dry_run:
+        save_profile(args.name, params)
+        print(f"AIプロファイル {args.name} を {config.AI_PROFILES_DATA} に保存しました")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+ActionScorer - AIの行動の一括評価
+大名の全領地の特徴量を列（特徴量ごとの値のリスト）にまとめ、行動ごとの重みベクトルとの
+内積で全領地 × 全行動のスコアを一度に求める。領地ごとに実行可能な行動のうちスコアが
+最も高いもの（0以下なら何もしない）を選ぶ。
+
+重みは config.AI_SCORING_WEIGHTS（行動 → {特徴量: 重み}）で調整する。
+特徴量はおおよそ0～数の範囲になるよう正規化している（FEATURES参照）。
+"""
+from typing import Dict, List, Optional
+
+import config
+from debug.log_channels import get_logger
+
+logger = get_logger("ai")
+
+# 特徴量（値の正規化）
+FEATURES = (
+    "bias",             # 常に1
+    "gold",             # 金 / 1000
+    "rice",             # 米 / 1000
+    "soldiers",         # 兵士 / 1000
+    "loyalty",          # 農民忠誠度 / 100
+    "development",      # 開発レベル / 10
+    "town",             # 町レベル / 10
+    "flood_control",    # 治水 / 100
+    "border_pressure",  # 他勢力の隣接領地数
+    "enemy_soldiers",   # 攻撃可能な隣接領地の最大兵力 / 1000
+    "strength_ratio",   # 兵士 / 攻撃可能な隣接領地の最小兵力（最大5）
+    "front_distance",   # 前線までのホップ数（最大5、前線に到達できない場合は5）
+)
+
+# 行動（スコアが同じ場合は先の行動を選ぶ）
+ACTIONS = (
+    "attack", "recruit", "give_rice", "cultivate", "develop_town", "flood_control",
+    "transfer_soldiers", "transfer_gold", "transfer_rice",
+)
+
+# 転送量（領地ごとの転送判断と同じ）
+TRANSFER_AMOUNTS = {"transfer_soldiers": 60, "transfer_gold": 300, "transfer_rice": 300}
+RECRUIT_AMOUNT = 100
+
+
+class ActionScorer:
+    """行動の一括評価クラス"""
+
+    def __init__(self, game_state, ai_system, diplomacy_system=None, weights: Optional[Dict] = None):
+        """
+        Args:
+            ai_system: 攻撃の派遣率を決める AISystem（decide_attack_ratio）
+            weights: 行動 → {特徴量: 重み}（Noneの場合は config.AI_SCORING_WEIGHTS）
+        """
+        self.game_state = game_state
+        self.ai_system = ai_system
+        self.diplomacy_system = diplomacy_system
+        self.weights = weights
+
+    def decide(self, daimyo_id: int, provinces: List) -> Dict[int, Dict]:
+        """領地ごとのコマンドを決める
+
+        Returns:
+            領地ID → コマンド（何もしない領地は {"type": "none"}）
+        """
+        if not provinces:
+            return {}
+
+        features, values, targets, next_hops = self.build_features(daimyo_id, provinces)
+        scores = self.score(features)
+        feasible = self.feasible(values, targets, next_hops)
+        rows = list(zip(*(scores[action] for action in ACTIONS)))
+        feasible_rows = list(zip(*(feasible[action] for action in ACTIONS)))
+
+        plan = {}
+        for i, province in enumerate(provinces):
+            ranked = sorted(
+                (-score, k) for k, (score, ok) in enumerate(zip(rows[i], feasible_rows[i]))
+                if ok and score > 0
+            )
+            command = {"type": "none"}
+            for _, k in ranked:
+                command = self._make_command(province, ACTIONS[k], targets[i], next_hops[i])
+                if command is not None:
+                    break
+                command = {"type": "none"}
+            plan[province.id] = command
+
+        logger.debug("[ActionScorer] %d領地の行動を評価", len(provinces))
+        return plan
+
+    # ========================================
+    # 特徴量・スコア
+    # ========================================
+
+    def build_features(self, daimyo_id: int, provinces: List):
+        """特徴量の列を作成（数値は領地ストアの列から直接読む）
+
+        Returns:
+            (特徴量 → 値のリスト, 列名 → 正規化前の値のリスト,
+             攻撃対象の領地（なければNone）のリスト, 転送先の領地IDのリスト)
+        """
+        game_state = self.game_state
+        all_provinces = game_state.provinces
+        border_index = game_state.border_index
+        diplomacy_system = self.diplomacy_system
+        # 条約がなければ隣接する他勢力はすべて攻撃可能
+        has_treaty = game_state.has_active_treaty(daimyo_id)
+
+        store = game_state.province_store
+        columns = store.columns
+        row_of = store.rows
+        owners = columns["owner_daimyo_id"]
+        soldiers_col = columns["soldiers"]
+        rows = [row_of[province.id] for province in provinces]
+        values = {
+            column: [columns[column][row] for row in rows]
+            for column in ("gold", "rice", "soldiers", "peasants", "peasant_loyalty",
+                           "development_level", "town_level")
+        }
+        values["flood_control"] = [province.flood_control for province in provinces]
+
+        distances, hops_by_id = game_state.frontline_field.get_field(daimyo_id)
+
+        targets = []
+        max_enemies = []
+        ratios = []
+        front_distances = []
+        next_hops = []
+        for province, soldiers in zip(provinces, values["soldiers"]):
+            # 攻撃可能な隣接領地（最も兵力の少ない領地を攻撃対象とする）
+            target_id = None
+            min_enemy = max_enemy = 0
+            for adj_id in province.adjacent_provinces:
+                row = row_of.get(adj_id)
+                if row is None:
+                    continue
+                owner_id = owners[row]
+                if owner_id == daimyo_id:
+                    continue
+                if has_treaty and diplomacy_system and not diplomacy_system.can_attack(daimyo_id, owner_id):
+                    continue
+                enemy = soldiers_col[row]
+                if target_id is None or enemy < min_enemy:
+                    target_id = adj_id
+                    min_enemy = enemy
+                if enemy > max_enemy:
+                    max_enemy = enemy
+            targets.append(all_provinces[target_id] if target_id is not None else None)
+            max_enemies.append(max_enemy / 1000)
+            ratios.append(min(soldiers / max(min_enemy, 1), 5.0) if target_id is not None else 0.0)
+
+            distance = distances.get(province.id)
+            front_distances.append(min(distance, 5) if distance is not None else 5)
+            hops = hops_by_id.get(province.id) if distance else None
+            next_hops.append(hops[0] if hops else None)
+
+        features = {
+            "bias": [1.0] * len(provinces),
+            "gold": [x / 1000 for x in values["gold"]],
+            "rice": [x / 1000 for x in values["rice"]],
+            "soldiers": [x / 1000 for x in values["soldiers"]],
+            "loyalty": [x / 100 for x in values["peasant_loyalty"]],
+            "development": [x / 10 for x in values["development_level"]],
+            "town": [x / 10 for x in values["town_level"]],
+            "flood_control": [x / 100 for x in values["flood_control"]],
+            "border_pressure": [border_index.get_foreign_neighbor_count(province.id) for province in provinces],
+            "enemy_soldiers": max_enemies,
+            "strength_ratio": ratios,
+            "front_distance": front_distances,
+        }
+        return features, values, targets, next_hops
+
+    def score(self, features: Dict[str, List[float]]) -> Dict[str, List[float]]:
+        """行動ごとのスコアの列（特徴量の列と重みベクトルの内積）"""
+        weights = self.weights if self.weights is not None else config.AI_SCORING_WEIGHTS
+        size = len(features["bias"])
+        scores = {}
+        for action in ACTIONS:
+            column = [0.0] * size
+            for feature, weight in weights.get(action, {}).items():
+                if weight:
+                    column = [s + weight * x for s, x in zip(column, features[feature])]
+            scores[action] = column
+        return scores
+
+    def feasible(self, values: Dict[str, list], targets: List, next_hops: List) -> Dict[str, List[bool]]:
+        """行動ごとの実行可能か（コスト・上限・対象の有無）の列"""
+        recruit_cost = config.RECRUIT_COST_PER_SOLDIER * RECRUIT_AMOUNT
+        gold = values["gold"]
+        rice = values["rice"]
+        soldiers = values["soldiers"]
+        return {
+            "attack": [t is not None for t in targets],
+            "recruit": [g >= recruit_cost and p >= RECRUIT_AMOUNT for g, p in zip(gold, values["peasants"])],
+            "give_rice": [r >= config.GIVE_RICE_AMOUNT for r in rice],
+            "cultivate": [g >= config.CULTIVATION_COST and d < 10 for g, d in zip(gold, values["development_level"])],
+            "develop_town": [g >= config.TOWN_DEVELOPMENT_COST and t < 10 for g, t in zip(gold, values["town_level"])],
+            "flood_control": [g >= config.FLOOD_CONTROL_COST and f < 100 for g, f in zip(gold, values["flood_control"])],
+            "transfer_soldiers": [h is not None and s > 100 for h, s in zip(next_hops, soldiers)],
+            "transfer_gold": [h is not None and g > 380 for h, g in zip(next_hops, gold)],
+            "transfer_rice": [h is not None and r > 500 for h, r in zip(next_hops, rice)],
+        }
+
+    # ========================================
+    # コマンド
+    # ========================================
+
+    def _make_command(self, province, action: str, target, next_hop: Optional[int]) -> Optional[Dict]:
+        """選んだ行動のコマンドを作成（攻撃の派遣率が決まらない場合はNone）"""
+        if action == "attack":
+            attack_ratio = self.ai_system.decide_attack_ratio(province, target)
+            if attack_ratio is None:
+                return None
+            return {
+                "type": "attack",
+                "target_id": target.id,
+                "attack_force": int(province.soldiers * attack_ratio),
+                "general_id": province.governor_general_id
+            }
+        if action == "recruit":
+            return {"type": "recruit", "amount": RECRUIT_AMOUNT}
+        if action in TRANSFER_AMOUNTS:
+            return {"type": action, "target_id": next_hop, "amount": TRANSFER_AMOUNTS[action]}
+        return {"type": action}
@@ -1,9 +1,14 @@
 """
 AIシステム - コンピュータ制御の大名の意思決定
 """
-import random
+import logging
 import config
 from models.diplomacy import RelationType
+from systems.combat import CombatSystem
+from debug.log_channels import get_logger
+
+logger = get_logger("ai")
+transfer_logger = get_logger("transfer")
 
 
 class AISystem:
@@ -16,6 +21,15 @@ class AISystem:
         self.diplomacy_system = diplomacy_system
         self.transfer_system = transfer_system
 
+        # 探索AI（config.AI_USE_SEARCH が True の場合に最初の使用時に作成）
+        self.search_ai = None
+        # 行動の一括評価（config.AI_USE_SCORING、必要になった時点で作成）
+        self.action_scorer = None
+        # 大名ID → AIのパラメータ（systems/ai_profile.py、最初の使用時に作成）
+        self.params = {}
+        # 探索のプレイアウト中のシステムではFalse（探索を入れ子にしない）
+        self.allow_search = True
+
     def execute_ai_turn(self, daimyo_id):
         """AI大名のターンを実行"""
         daimyo = self.game_state.get_daimyo(daimyo_id)
@@ -25,7 +39,7 @@ class AISystem:
         events = []
 
         # AI大名の領地を取得
-        ai_provinces = [p for p in self.game_state.provinces.values() if p.owner_daimyo_id == daimyo_id]
+        ai_provinces = self.game_state.get_daimyo_provinces(daimyo_id)
 
         if not ai_provinces:
             return events
@@ -91,14 +105,14 @@ class AISystem:
                 amount = action["amount"]
                 target_province = self.game_state.get_province(target_province_id)
 
-                # デバッグログ
-                debug = self.game_state.get_player_daimyo() is None
+                # デバッグログ（全AI操作モードのみ、transferチャンネル無効時はメッセージを組み立てない）
+                debug = transfer_logger.isEnabledFor(logging.DEBUG) and self.game_state.get_player_daimyo() is None
                 if debug:
-                    print(f"[TRANSFER EXECUTE] {daimyo.clan_name} {province.name} → {target_province.name if target_province else 'None'}")
-                    print(f"[TRANSFER EXECUTE]   resource={resource_type}, amount={amount}")
-                    print(f"[TRANSFER EXECUTE]   転送元兵力={province.soldiers}")
+                    transfer_logger.debug("[TRANSFER EXECUTE] %s %s → %s", daimyo.clan_name, province.name, target_province.name if target_province else 'None')
+                    transfer_logger.debug("[TRANSFER EXECUTE]   resource=%s, amount=%s", resource_type, amount)
+                    transfer_logger.debug("[TRANSFER EXECUTE]   転送元兵力=%s", province.soldiers)
                     if target_province:
-                        print(f"[TRANSFER EXECUTE]   転送先兵力={target_province.soldiers}")
+                        transfer_logger.debug("[TRANSFER EXECUTE]   転送先兵力=%s", target_province.soldiers)
 
                 if target_province and self.transfer_system:
                     # resource_typeに応じて適切なメソッドを呼び出す
@@ -110,15 +124,15 @@ class AISystem:
                         result = self.transfer_system.transfer_rice(province.id, target_province.id, amount)
                     else:
                         if debug:
-                            print(f"[TRANSFER EXECUTE]   ✗ 不明なリソースタイプ")
+                            transfer_logger.debug("[TRANSFER EXECUTE]   ✗ 不明なリソースタイプ")
                         continue
 
                     if debug:
-                        print(f"[TRANSFER EXECUTE]   result.success={result.success}")
+                        transfer_logger.debug("[TRANSFER EXECUTE]   result.success=%s", result.success)
                         if not result.success:
-                            print(f"[TRANSFER EXECUTE]   ✗ 失敗理由: {result.message}")
+                            transfer_logger.debug("[TRANSFER EXECUTE]   ✗ 失敗理由: %s", result.message)
                         else:
-                            print(f"[TRANSFER EXECUTE]   ✓ 成功: {result.message}")
+                            transfer_logger.debug("[TRANSFER EXECUTE]   ✓ 成功: %s", result.message)
 
                     if result.success:
                         events.append(f"【{daimyo.clan_name}】{result.message}")
@@ -131,7 +145,7 @@ class AISystem:
                             self.game_state.record_command(daimyo_id, province.id, "transfer_rice")
                 else:
                     if debug:
-                        print(f"[TRANSFER EXECUTE]   ✗ target_province={target_province is not None}, transfer_system={self.transfer_system is not None}")
+                        transfer_logger.debug("[TRANSFER EXECUTE]   ✗ target_province=%s, transfer_system=%s", target_province is not None, self.transfer_system is not None)
 
         return events
 
@@ -158,34 +172,35 @@ class AISystem:
         has_enemy_neighbor = self._has_enemy_neighbor(province, daimyo.id)
 
         # 状況に応じた重み付け
+        params = self.get_params(daimyo.id)
         weights = {"internal": 1.0, "military": 1.0, "transfer": 1.0}
 
         # 国境の領地は軍事重視
         if has_enemy_neighbor:
-            weights["military"] = 2.0
-            weights["transfer"] = 0.3  # 国境では転送出しにくい
+            weights["military"] = params["category_border_military"]
+            weights["transfer"] = params["category_border_transfer"]  # 国境では転送出しにくい
         else:
             # 後方の領地は転送重視
-            weights["transfer"] = 2.0
-            weights["military"] = 0.5  # 後方では攻撃しにくい
+            weights["transfer"] = params["category_rear_transfer"]
+            weights["military"] = params["category_rear_military"]  # 後方では攻撃しにくい
 
         # 兵力状況
         if province.soldiers >= 200:
-            weights["military"] += 1.0
+            weights["military"] += params["category_strong_military_bonus"]
         elif province.soldiers < 100:
-            weights["internal"] += 1.0  # 徴兵のため
+            weights["internal"] += params["category_weak_internal_bonus"]  # 徴兵のため
 
         # 重み付きランダム選択
         total = sum(weights.values())
-        rand = random.random() * total
+        rand = self.game_state.get_rng("ai").random() * total
 
         cumulative = 0
         for category, weight in weights.items():
             cumulative += weight
             if rand < cumulative:
-                # デバッグログ
-                if self.game_state.get_player_daimyo() is None:  # 全AI操作モード
-                    print(f"[AI DEBUG] {daimyo.clan_name} {province.name}: カテゴリ={category} (重み={weights})")
+                # デバッグログ（全AI操作モードのみ）
+                if self.game_state.get_player_daimyo() is None:
+                    logger.debug("[AI DEBUG] %s %s: カテゴリ=%s (重み=%s)", daimyo.clan_name, province.name, category, weights)
                 return category
 
         return "internal"
@@ -239,7 +254,7 @@ class AISystem:
         # 2. 隣接敵領地への攻撃に必要な兵力が不足している場合は徴兵
         max_enemy_soldiers = self._get_max_adjacent_enemy_soldiers(province, daimyo.id)
         if max_enemy_soldiers > 0:
-            required_soldiers = int(max_enemy_soldiers * 1.35)
+            required_soldiers = int(max_enemy_soldiers * self.get_params(daimyo.id)["recruit_soldier_ratio"])
             if province.soldiers < required_soldiers and province.peasants >= 100 and province.gold >= config.RECRUIT_COST_PER_SOLDIER * 100:
                 return {"type": "recruit"}
 
@@ -248,41 +263,35 @@ class AISystem:
     def _decide_transfer_action(self, province, daimyo):
         """転送コマンドの具体的内容を決定"""
 
-        # デバッグログ
-        debug = self.game_state.get_player_daimyo() is None
+        # デバッグログ（全AI操作モードのみ、transferチャンネル無効時はメッセージを組み立てない）
+        debug = transfer_logger.isEnabledFor(logging.DEBUG) and self.game_state.get_player_daimyo() is None
 
-        # 転送先候補を探す（隣接している敵に隣接している自領地）
+        # 転送先候補を探す（前線までの距離場で前線へ向かう隣接自領地）
+        # 前線上・前線に隣接する領地では、隣接する前線上の自領地（TransferSystemの制約に従い隣接のみ）
+        params = self.get_params(daimyo.id)
         transfer_targets = []
-        for other_province in self.game_state.provinces.values():
-            if other_province.owner_daimyo_id != daimyo.id:
-                continue
-
-            if other_province.id == province.id:
-                continue
-
-            # 【重要】隣接チェック - TransferSystemの制約に従う
-            if other_province.id not in province.adjacent_provinces:
-                continue
-
-            # 敵に隣接しているか
-            if self._has_enemy_neighbor(other_province, daimyo.id):
+        frontline_field = self.game_state.frontline_field
+        distance = frontline_field.get_distance(province.id)
+        if distance is not None and (distance <= 1 or config.AI_FRONTLINE_LOGISTICS):
+            for target_id in frontline_field.get_next_hops(province.id):
+                other_province = self.game_state.provinces[target_id]
                 # 優先度を計算
                 priority = 0
                 if other_province.has_castle:
-                    priority += 1000
-                if other_province.soldiers < 200:
-                    priority += 500
+                    priority += params["transfer_castle_priority"]
+                if other_province.soldiers < params["transfer_weak_soldiers"]:
+                    priority += params["transfer_weak_priority"]
                 if other_province.gold < 500:
-                    priority += 300
+                    priority += params["transfer_poor_priority"]
 
                 transfer_targets.append((other_province, priority))
 
         if debug:
-            print(f"[TRANSFER DEBUG] {daimyo.clan_name} {province.name}: 転送先候補={len(transfer_targets)}件 (隣接のみ)")
+            transfer_logger.debug("[TRANSFER DEBUG] %s %s: 転送先候補=%s件 (前線までの距離=%s)", daimyo.clan_name, province.name, len(transfer_targets), distance)
 
         if not transfer_targets:
             if debug:
-                print(f"[TRANSFER DEBUG] → 転送先なし（国境領地なし）")
+                transfer_logger.debug("[TRANSFER DEBUG] → 転送先なし（国境領地なし）")
             return {"type": "none"}
 
         # 最優先の転送先を選択
@@ -290,14 +299,14 @@ class AISystem:
         target = transfer_targets[0][0]
 
         if debug:
-            print(f"[TRANSFER DEBUG] → 転送先={target.name} (兵{target.soldiers}, 金{target.gold})")
-            print(f"[TRANSFER DEBUG] → 転送元リソース: 兵{province.soldiers}, 金{province.gold}, 米{province.rice}")
+            transfer_logger.debug("[TRANSFER DEBUG] → 転送先=%s (兵%s, 金%s)", target.name, target.soldiers, target.gold)
+            transfer_logger.debug("[TRANSFER DEBUG] → 転送元リソース: 兵%s, 金%s, 米%s", province.soldiers, province.gold, province.rice)
 
         # 転送可能な資源の候補リストを作成
         transfer_options = []
 
         # 兵士転送の条件チェック
-        if target.soldiers < 300 and province.soldiers > 100:
+        if target.soldiers < params["transfer_soldier_target"] and province.soldiers > 100:
             transfer_options.append({
                 "resource": "soldiers",
                 "amount": 60,
@@ -323,19 +332,19 @@ class AISystem:
         # 候補がない場合
         if not transfer_options:
             if debug:
-                print(f"[TRANSFER DEBUG] → 転送条件を満たさず")
+                transfer_logger.debug("[TRANSFER DEBUG] → 転送条件を満たさず")
             return {"type": "none"}
 
         # 重み付きランダムで資源を選択
         if debug:
-            print(f"[TRANSFER DEBUG] → 転送候補: {[opt['resource'] for opt in transfer_options]}")
+            transfer_logger.debug("[TRANSFER DEBUG] → 転送候補: %s", [opt['resource'] for opt in transfer_options])
 
         choices = [opt for opt in transfer_options]
         weights = [opt["weight"] for opt in transfer_options]
-        selected_option = random.choices(choices, weights=weights, k=1)[0]
+        selected_option = self.game_state.get_rng("ai").choices(choices, weights=weights, k=1)[0]
 
         if debug:
-            print(f"[TRANSFER DEBUG] → {selected_option['resource']}転送決定 (weight={selected_option['weight']})")
+            transfer_logger.debug("[TRANSFER DEBUG] → %s転送決定 (weight=%s)", selected_option['resource'], selected_option['weight'])
 
         return {
             "type": "transfer",
@@ -346,32 +355,40 @@ class AISystem:
 
     def _has_enemy_neighbor(self, province, daimyo_id):
         """領地が敵に隣接しているかチェック"""
-        debug = self.game_state.get_player_daimyo() is None
+        # デバッグログ（全AI操作モードのみ）
+        debug = logger.isEnabledFor(logging.DEBUG) and self.game_state.get_player_daimyo() is None
         if debug:
             daimyo = self.game_state.get_daimyo(daimyo_id)
             daimyo_name = daimyo.clan_name if daimyo else "Unknown"
-            print(f"[NEIGHBOR DEBUG] Checking {province.name} (owner_id={province.owner_daimyo_id}, check_id={daimyo_id}, clan={daimyo_name})")
+            logger.debug("[NEIGHBOR DEBUG] Checking %s (owner_id=%s, check_id=%s, clan=%s)", province.name, province.owner_daimyo_id, daimyo_id, daimyo_name)
+        elif province.owner_daimyo_id == daimyo_id:
+            # 自領地なら国境索引で判定（デバッグ時は隣接領地ごとのログを出すため走査する）
+            return self.game_state.border_index.has_foreign_neighbor(province.id)
 
         for adj_id in province.adjacent_provinces:
             adj_province = self.game_state.get_province(adj_id)
             if adj_province:
-                adj_daimyo = self.game_state.get_daimyo(adj_province.owner_daimyo_id) if adj_province.owner_daimyo_id else None
-                adj_name = adj_daimyo.clan_name if adj_daimyo else "無所属"
                 is_enemy = adj_province.owner_daimyo_id != daimyo_id
                 if debug:
-                    print(f"[NEIGHBOR DEBUG]   → {adj_province.name}: owner_id={adj_province.owner_daimyo_id} ({adj_name}), is_enemy={is_enemy}")
+                    adj_daimyo = self.game_state.get_daimyo(adj_province.owner_daimyo_id) if adj_province.owner_daimyo_id else None
+                    adj_name = adj_daimyo.clan_name if adj_daimyo else "無所属"
+                    logger.debug("[NEIGHBOR DEBUG]   → %s: owner_id=%s (%s), is_enemy=%s", adj_province.name, adj_province.owner_daimyo_id, adj_name, is_enemy)
                 if is_enemy:
                     if debug:
-                        print(f"[NEIGHBOR DEBUG]   ✓ Enemy found! Returning True")
+                        logger.debug("[NEIGHBOR DEBUG]   ✓ Enemy found! Returning True")
                     return True
 
         if debug:
-            print(f"[NEIGHBOR DEBUG]   ✗ No enemies found. Returning False")
+            logger.debug("[NEIGHBOR DEBUG]   ✗ No enemies found. Returning False")
         return False
 
 
     def _get_max_adjacent_enemy_soldiers(self, province, daimyo_id):
         """隣接する敵領地の最大兵力を取得"""
+        # 自領地で条約を結んでいなければ、隣接する他勢力はすべて攻撃可能なので国境索引の値と一致する
+        if province.owner_daimyo_id == daimyo_id and not self.game_state.has_active_treaty(daimyo_id):
+            return self.game_state.border_index.get_max_foreign_soldiers(province.id)
+
         max_soldiers = 0
 
         for adj_id in province.adjacent_provinces:
@@ -422,7 +439,7 @@ class AISystem:
             # 例: 防御1.5倍の山岳 → 1.5 * 1.5 = 2.25倍の兵力が必要
             #required_ratio = 1.5 * defense_bonus
             #
-            required_ratio = 1.35
+            required_ratio = self.get_params(daimyo_id)["attack_soldier_ratio"]
 
             # 攻撃側の兵力が必要比率以上なら攻撃を検討
             if province.soldiers >= defender_force * required_ratio:
@@ -451,8 +468,65 @@ class AISystem:
         # ========================================
         # ステップ1: 戦力比による派遣率決定
         # ========================================
+        if config.AI_USE_WIN_TABLE:
+            desired_ratio = self._decide_attack_ratio_by_win_table(attacker_province, defender_province)
+            if desired_ratio is None:
+                return None
+        else:
+            desired_ratio = self._decide_attack_ratio_by_power(attacker_province, defender_province)
+            if desired_ratio is None:
+                return None
+
+        # ========================================
+        # ステップ2: 守備兵力の確認
+        # ========================================
+        min_garrison = self.get_params(attacker_province.owner_daimyo_id)["min_garrison"]
+        attack_force = int(attacker_province.soldiers * desired_ratio)
+        remaining_garrison = attacker_province.soldiers - attack_force
+
+        if remaining_garrison < min_garrison:
+            # 1段階下げる
+            desired_ratio = desired_ratio * 0.9 # 0.9倍で下げる
+
+
+            # 再計算
+            attack_force = int(attacker_province.soldiers * desired_ratio)
+            remaining_garrison = attacker_province.soldiers - attack_force
+
+            # まだ不足している場合は攻撃中止
+            if remaining_garrison < min_garrison:
+                return None
+
+        # 派遣率を返す
+        return desired_ratio
+
+    def _decide_attack_ratio_by_win_table(self, attacker_province, defender_province):
+        """勝率表で派遣率を決定（AI_ATTACK_WIN_PROBABILITY以上の勝率が見込める最小の派遣率）
+
+        Returns:
+            float or None: 派遣率、どの派遣率でも勝率が足りない場合はNone
+        """
+        combat_system = CombatSystem(self.game_state)
+        # 全軍（最後の選択肢）はAIでは使わない
+        for ratio in config.ATTACK_RATIO_OPTIONS[:3]:
+            estimate = combat_system.estimate_attack(
+                attacker_province, int(attacker_province.soldiers * ratio),
+                defender_province, attacker_province.governor_general_id
+            )
+            if estimate["win_probability"] >= config.AI_ATTACK_WIN_PROBABILITY:
+                logger.debug("[NEIGHBOR decide_attack_ratio]   %s vs %s: 派遣率%s 勝率%.2f",
+                             attacker_province.name, defender_province.name, ratio, estimate["win_probability"])
+                return ratio
+        return None
+
+    def _decide_attack_ratio_by_power(self, attacker_province, defender_province):
+        """戦力比と戦力比閾値（config.AI_ATTACK_RATIO_THRESHOLDS、AIプロファイルで上書き可）で派遣率を決定
+
+        Returns:
+            float or None: 派遣率、戦力比が不足する場合はNone
+        """
         # MUST USE: config.AI_ATTACK_RATIO_THRESHOLDS と config.ATTACK_RATIO_OPTIONS
-        thresholds = config.AI_ATTACK_RATIO_THRESHOLDS
+        params = self.get_params(attacker_province.owner_daimyo_id)
         ratio_options = config.ATTACK_RATIO_OPTIONS
 
         # 戦力比を計算
@@ -469,40 +543,62 @@ class AISystem:
         else:
             power_ratio = 10.0  # 無防備
 
-        print(f"[NEIGHBOR decide_attack_ratio]   {attacker_province.name} vs {defender_province.name}: {power_ratio}")
+        logger.debug("[NEIGHBOR decide_attack_ratio]   %s vs %s: %s", attacker_province.name, defender_province.name, power_ratio)
 
         # 戦力比に基づく派遣率の決定
-        if power_ratio >= thresholds["overwhelming"]:
+        if power_ratio >= params["attack_threshold_overwhelming"]:
             desired_ratio = ratio_options[0]  # 0.33 (33%)
-        elif power_ratio >= thresholds["superior"]:
+        elif power_ratio >= params["attack_threshold_superior"]:
             desired_ratio = ratio_options[1]  # 0.5 (50%)
-        elif power_ratio >= thresholds["advantage"]:
+        elif power_ratio >= params["attack_threshold_advantage"]:
             desired_ratio = ratio_options[2]  # 0.75 (75%)
         else:
             # 戦力比が不足（1.5未満）→ 攻撃中止
             return None
 
-        # ========================================
-        # ステップ2: 守備兵力の確認
-        # ========================================
-        attack_force = int(attacker_province.soldiers * desired_ratio)
-        remaining_garrison = attacker_province.soldiers - attack_force
-
-        if remaining_garrison < config.MIN_GARRISON_TROOPS:
-            # 1段階下げる
-            desired_ratio = desired_ratio * 0.9 # 0.9倍で下げる
+        return desired_ratio
 
+    def get_params(self, daimyo_id):
+        """大名のAIのパラメータ（systems/ai_profile.py、既定値にAIプロファイルを重ねた辞書）"""
+        params = self.params.get(daimyo_id)
+        if params is None:
+            from systems.ai_profile import get_params
+            params = get_params(daimyo_id)
+            self.params[daimyo_id] = params
+        return params
 
-            # 再計算
-            attack_force = int(attacker_province.soldiers * desired_ratio)
-            remaining_garrison = attacker_province.soldiers - attack_force
+    def uses_search(self, daimyo_id):
+        """この大名のコマンドを探索AIで決めるか（ターンの時間予算を設定した場合も探索で改善する）"""
+        if not (config.AI_USE_SEARCH or config.AI_TURN_BUDGET_MS is not None) or not self.allow_search:
+            return False
+        return config.AI_SEARCH_DAIMYO_IDS is None or daimyo_id in config.AI_SEARCH_DAIMYO_IDS
 
-            # まだ不足している場合は攻撃中止
-            if remaining_garrison < config.MIN_GARRISON_TROOPS:
-                return None
+    def plan_commands(self, daimyo_id, provinces, events, rng=None, budget_ms=None):
+        """探索AIで領地ごとのコマンドを決める（領地ID → コマンド）
 
-        # 派遣率を返す
-        return desired_ratio
+        Args:
+            provinces: コマンドを決める領地のリスト（この順で決める）
+            events: 読み込み済みのイベントリスト（先読みのイベント発生に使う）
+            rng: 探索の乱数（Noneの場合は forecast ストリーム）
+            budget_ms: 探索時間（Noneの場合は config.AI_SEARCH_BUDGET_MS）
+        """
+        if self.search_ai is None:
+            from systems.search_ai import SearchAI
+            self.search_ai = SearchAI(self.game_state, events)
+        return self.search_ai.plan(daimyo_id, [p.id for p in provinces], rng, budget_ms)
+
+    def uses_scoring(self, daimyo_id):
+        """この大名のコマンドを行動の一括評価で決めるか"""
+        if not config.AI_USE_SCORING:
+            return False
+        return config.AI_SCORING_DAIMYO_IDS is None or daimyo_id in config.AI_SCORING_DAIMYO_IDS
+
+    def score_commands(self, daimyo_id, provinces):
+        """行動の一括評価で領地ごとのコマンドを決める（領地ID → コマンド）"""
+        if self.action_scorer is None:
+            from systems.action_scoring import ActionScorer
+            self.action_scorer = ActionScorer(self.game_state, self, self.diplomacy_system)
+        return self.action_scorer.decide(daimyo_id, provinces)
 
     def execute_ai_diplomacy(self, daimyo_id):
         """AI大名の外交行動を実行"""
@@ -512,8 +608,10 @@ class AISystem:
 
         events = []
 
+        rng = self.game_state.get_rng("ai")
+
         # 外交行動は確率的に実行（毎ターンではない）
-        if random.random() > 0.3:  # 30%の確率で外交行動
+        if rng.random() > 0.3:  # 30%の確率で外交行動
             return events
 
         # 他の大名との関係を評価
@@ -525,7 +623,7 @@ class AISystem:
 
             # 関係値が非常に低く、まだ戦争していない場合は宣戦布告を検討
             if relation.relation_value < -30 and relation.relation_type != RelationType.WAR:
-                if random.random() < 0.5:  # 50%の確率
+                if rng.random() < 0.5:  # 50%の確率
                     result = self.diplomacy_system.declare_war(daimyo_id, other_daimyo.id)
                     if result["success"]:
                         events.append(f"【外交】{daimyo.clan_name}が{other_daimyo.clan_name}に宣戦布告！")
@@ -534,7 +632,7 @@ class AISystem:
             # 関係値が良好で、まだ条約がない場合は不可侵条約を提案
             elif relation.relation_value >= config.NON_AGGRESSION_RELATION_THRESHOLD and \
                  relation.relation_type == RelationType.NEUTRAL:
-                if random.random() < 0.3:  # 30%の確率
+                if rng.random() < 0.3:  # 30%の確率
                     result = self.diplomacy_system.propose_non_aggression(daimyo_id, other_daimyo.id)
                     if result["success"]:
                         events.append(f"【外交】{daimyo.clan_name}と{other_daimyo.clan_name}が不可侵条約を締結")
@@ -543,7 +641,7 @@ class AISystem:
             # 関係値が非常に良好な場合は同盟を提案
             elif relation.relation_value >= config.ALLIANCE_RELATION_THRESHOLD and \
                  relation.relation_type != RelationType.ALLIANCE:
-                if random.random() < 0.2:  # 20%の確率
+                if rng.random() < 0.2:  # 20%の確率
                     result = self.diplomacy_system.propose_alliance(daimyo_id, other_daimyo.id)
                     if result["success"]:
                         events.append(f"【外交】{daimyo.clan_name}と{other_daimyo.clan_name}が同盟を締結")
@@ -555,11 +653,8 @@ class AISystem:
         """将軍を領地に配置"""
         events = []
 
-        # 利用可能な将軍を取得
-        available_generals = [
-            general for general in self.game_state.generals.values()
-            if general.serving_daimyo_id == daimyo_id and general.is_available
-        ]
+        # 利用可能な将軍を取得（将軍の索引から、能力値の合計の高い順）
+        available_generals = self.game_state.general_registry.get_available(daimyo_id)
 
         if not available_generals:
             return events
@@ -583,20 +678,20 @@ class AISystem:
                     priority += 500
             return priority
 
-        unassigned_provinces.sort(key=province_priority, reverse=True)
+        if config.AI_OPTIMAL_GENERAL_ASSIGNMENT:
+            # 割当問題: 将軍 × 領地の効用の合計が最大になる組み合わせ
+            from systems.general_assignment import GeneralAssignment
+            border_index = self.game_state.border_index
+            solver = GeneralAssignment(province_priority, lambda p: border_index.has_foreign_neighbor(p.id))
+            pairs = solver.assign(unassigned_provinces, available_generals)
+        else:
+            unassigned_provinces.sort(key=province_priority, reverse=True)
 
-        # 能力値の高い将軍から配置
-        available_generals.sort(
-            key=lambda g: g.war_skill + g.leadership + g.politics + g.intelligence,
-            reverse=True
-        )
+            # 能力値の高い将軍から配置
+            pairs = list(zip(unassigned_provinces, available_generals))
 
         # 将軍を配置
-        for i, province in enumerate(unassigned_provinces):
-            if i >= len(available_generals):
-                break
-
-            general = available_generals[i]
+        for province, general in pairs:
             result = self.internal_affairs.assign_governor(province, general)
             if result["success"]:
                 daimyo = self.game_state.get_daimyo(daimyo_id)
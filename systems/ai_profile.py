@@ -0,0 +1,156 @@
+"""
+AIプロファイル - AIの判断のパラメータの名前付きの組
+
+AIの判断に使う数値（攻撃・徴兵の兵力比、転送の優先度、派遣率の戦力比閾値、最低守備兵力、
+行動カテゴリの重み）をパラメータ名 → 値の辞書（パラメータベクトル）として扱う。
+プロファイルは data/ai_profiles.json（config.AI_PROFILES_DATA）に名前付きで保存し、
+config.AI_PROFILE（全AI大名）・config.AI_DAIMYO_PROFILES（大名ごと）で選ぶ。
+プロファイルにないパラメータは既定値（config の定数と各判断の従来の値）を使う。
+
+パラメータは sim/tuner.py で対局の結果から調整できる。
+"""
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+import config
+
+# パラメータ名 → (調整範囲の下限, 上限)（既定値は get_defaults）
+PARAMETERS: Dict[str, Tuple[float, float]] = {
+    # 攻撃対象: 自兵力 >= 相手の兵力 × この値
+    "attack_soldier_ratio": (1.0, 2.5),
+    # 徴兵: 自兵力 < 隣接する敵の最大兵力 × この値
+    "recruit_soldier_ratio": (0.8, 2.5),
+    # 派遣率の戦力比閾値（config.AI_ATTACK_RATIO_THRESHOLDS）
+    "attack_threshold_overwhelming": (1.5, 4.0),
+    "attack_threshold_superior": (1.2, 3.0),
+    "attack_threshold_advantage": (1.0, 2.5),
+    # 攻撃時に残す最低守備兵力（config.MIN_GARRISON_TROOPS）
+    "min_garrison": (0, 400),
+    # 転送先の優先度（城あり・兵士が少ない・金が少ない）と、兵士を送る転送先の兵士の上限
+    # （金が少ない転送先の優先度は AISystem._decide_transfer_action だけが使う）
+    "transfer_castle_priority": (0, 2000),
+    "transfer_weak_priority": (0, 2000),
+    "transfer_poor_priority": (0, 2000),
+    "transfer_weak_soldiers": (50, 600),
+    "transfer_soldier_target": (100, 1000),
+    # 行動カテゴリの重み（AISystem._decide_action_category）
+    "category_border_military": (0.0, 4.0),
+    "category_border_transfer": (0.0, 4.0),
+    "category_rear_military": (0.0, 4.0),
+    "category_rear_transfer": (0.0, 4.0),
+    "category_strong_military_bonus": (0.0, 3.0),
+    "category_weak_internal_bonus": (0.0, 3.0),
+}
+
+# 派遣率の戦力比閾値（高い段階から順。この順に値が大きい（等しい）必要がある）
+ATTACK_THRESHOLDS = ("attack_threshold_overwhelming", "attack_threshold_superior", "attack_threshold_advantage")
+
+# 整数のパラメータ（調整後に丸める）
+INTEGER_PARAMETERS = frozenset({
+    "min_garrison", "transfer_castle_priority", "transfer_weak_priority", "transfer_poor_priority",
+    "transfer_weak_soldiers", "transfer_soldier_target",
+})
+
+
+def get_defaults() -> Dict[str, float]:
+    """パラメータの既定値（configの現在の値を含む）"""
+    thresholds = config.AI_ATTACK_RATIO_THRESHOLDS
+    return {
+        "attack_soldier_ratio": 1.35,
+        "recruit_soldier_ratio": 1.35,
+        "attack_threshold_overwhelming": thresholds["overwhelming"],
+        "attack_threshold_superior": thresholds["superior"],
+        "attack_threshold_advantage": thresholds["advantage"],
+        "min_garrison": config.MIN_GARRISON_TROOPS,
+        "transfer_castle_priority": 1000,
+        "transfer_weak_priority": 500,
+        "transfer_poor_priority": 300,
+        "transfer_weak_soldiers": 200,
+        "transfer_soldier_target": 300,
+        "category_border_military": 2.0,
+        "category_border_transfer": 0.3,
+        "category_rear_military": 0.5,
+        "category_rear_transfer": 2.0,
+        "category_strong_military_bonus": 1.0,
+        "category_weak_internal_bonus": 1.0,
+    }
+
+
+def get_params(daimyo_id: Optional[int]) -> Dict[str, float]:
+    """大名のAIのパラメータ（既定値にプロファイルを重ねた辞書）
+
+    config.AI_DAIMYO_PROFILES の値（プロファイル名、またはパラメータの辞書）、
+    なければ config.AI_PROFILE のプロファイルを使う。
+    """
+    params = get_defaults()
+    profile = config.AI_DAIMYO_PROFILES.get(daimyo_id, config.AI_PROFILE)
+    if profile is not None:
+        if isinstance(profile, str):
+            profile = get_profile(profile)
+        unknown = set(profile) - set(PARAMETERS)
+        if unknown:
+            raise ValueError(f"不明なAIパラメータ: {', '.join(sorted(unknown))}")
+        params.update(profile)
+
+    # 閾値の段階が逆転していると、_decide_attack_ratio_by_power で届かない段階ができる
+    thresholds = [params[name] for name in ATTACK_THRESHOLDS]
+    if thresholds != sorted(thresholds, reverse=True):
+        raise ValueError("派遣率の戦力比閾値は " + " >= ".join(ATTACK_THRESHOLDS) + " の順である必要があります"
+                         f"（{', '.join(str(value) for value in thresholds)}）")
+    return params
+
+
+# ========================================
+# 保存・読み込み
+# ========================================
+
+_cached_profiles: Optional[Dict[str, Dict[str, float]]] = None
+_cached_key: Optional[tuple] = None
+
+
+def load_profiles(path: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """プロファイル名 → パラメータの辞書を読み込む（ファイルがない場合は空、更新されるまでキャッシュ）"""
+    global _cached_profiles, _cached_key
+
+    path = path or config.AI_PROFILES_DATA
+    try:
+        key = (path, os.path.getmtime(path))
+    except OSError:
+        return {}
+    if _cached_profiles is not None and key == _cached_key:
+        return _cached_profiles
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    _cached_profiles = data.get("profiles", {})
+    _cached_key = key
+    return _cached_profiles
+
+
+def get_profile(name: str, path: Optional[str] = None) -> Dict[str, float]:
+    """名前を指定してプロファイルを取得"""
+    profiles = load_profiles(path)
+    if name not in profiles:
+        raise ValueError(f"AIプロファイル {name} がありません（{path or config.AI_PROFILES_DATA}）")
+    return profiles[name]
+
+
+def save_profile(name: str, params: Dict[str, float], path: Optional[str] = None):
+    """プロファイルを保存（同じ名前は上書き、他のプロファイルは残す）"""
+    global _cached_profiles, _cached_key
+
+    path = path or config.AI_PROFILES_DATA
+    data = {"profiles": {}}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    data.setdefault("profiles", {})[name] = params
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    os.replace(temp_path, path)
+    _cached_profiles = None
+    _cached_key = None
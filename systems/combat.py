@@ -2,16 +2,37 @@
 CombatSystem - 戦闘システム
 戦闘解決とダメージ計算
 """
+import math
 import random
+from array import array
 from typing import Optional, Dict, List
 from models.province import Province
 from models.army import Army
 from models.general import General
 import config
+from debug.log_channels import get_logger
+from systems.win_table import get_win_table
+
+logger = get_logger("combat")
 
 
 class BattleResult:
-    """戦闘結果クラス"""
+    """戦闘結果クラス
+
+    ラウンド別の記録は整数の配列に保持し、rounds_detail（演出用の辞書リスト）と
+    battle_log（表示用の文字列）は最初に参照されたときに作る。
+    戦闘演出を表示しない場合は CombatSystem.resolve_battle(record_rounds=False) で記録自体を省ける。
+    """
+
+    __slots__ = (
+        "attacker_won", "attacker_casualties", "defender_casualties",
+        "attacker_remaining", "defender_remaining", "province_captured",
+        "attacker_initial_troops", "defender_initial_troops", "duration_rounds",
+        "defender_province_name", "_rounds", "_rounds_detail", "_battle_log"
+    )
+
+    # ラウンド記録1件あたりの値: 攻撃側の与ダメージ, 守備側の与ダメージ, 攻撃側残存, 守備側残存
+    ROUND_FIELDS = 4
 
     def __init__(self):
         self.attacker_won = False
@@ -20,13 +41,51 @@ class BattleResult:
         self.attacker_remaining = 0
         self.defender_remaining = 0
         self.province_captured = False
-        self.battle_log: List[str] = []
+        self.defender_province_name = ""
 
         # ラウンド別演出用の追加フィールド
         self.attacker_initial_troops = 0
         self.defender_initial_troops = 0
         self.duration_rounds = 0
-        self.rounds_detail: List[Dict] = []
+        self._rounds: Optional[array] = None  # ROUND_FIELDS個ずつの整数配列（記録しない場合はNone）
+        self._rounds_detail: Optional[List[Dict]] = None
+        self._battle_log: Optional[List[str]] = None
+
+    @property
+    def rounds_detail(self) -> List[Dict]:
+        """ラウンド別の記録（演出用）"""
+        if self._rounds_detail is None:
+            self._rounds_detail = []
+            rounds = self._rounds
+            if rounds is not None:
+                for i in range(self.duration_rounds):
+                    offset = i * self.ROUND_FIELDS
+                    self._rounds_detail.append({
+                        "round": i + 1,
+                        "attacker_damage": rounds[offset],
+                        "defender_damage": rounds[offset + 1],
+                        "attacker_remaining": rounds[offset + 2],
+                        "defender_remaining": rounds[offset + 3]
+                    })
+        return self._rounds_detail
+
+    @property
+    def battle_log(self) -> List[str]:
+        """戦闘結果サマリー（表示用）"""
+        if self._battle_log is None:
+            log = []
+            if self.attacker_won:
+                log.append(f"⚔ 攻撃軍が勝利！（損失{self.attacker_casualties}人、残存{self.attacker_remaining}人）")
+                log.append(f"   守備軍は壊滅（損失{self.defender_casualties}人）")
+            else:
+                log.append(f"🛡 守備軍が勝利！（損失{self.defender_casualties}人、残存{self.defender_remaining}人）")
+                log.append(f"   攻撃軍は撤退（損失{self.attacker_casualties}人）")
+
+            # 領地占領
+            if self.province_captured:
+                log.append(f"★ {self.defender_province_name}を占領！")
+            self._battle_log = log
+        return self._battle_log
 
 
 class CombatSystem:
@@ -38,10 +97,16 @@ class CombatSystem:
     def resolve_battle(
         self,
         attacker_army: Army,
-        defender_province: Province
+        defender_province: Province,
+        record_rounds: bool = True
     ) -> BattleResult:
-        """戦闘を解決（自動戦闘）"""
+        """戦闘を解決（自動戦闘）
+
+        Args:
+            record_rounds: Falseの場合、ラウンド別の記録（戦闘演出用）を残さない
+        """
         result = BattleResult()
+        rng = self.game_state.get_rng("combat")
 
         # 攻撃側の戦力計算
         attacker_general = None
@@ -57,23 +122,35 @@ class CombatSystem:
 
         defender_power = self._calculate_defender_power(defender_province, defender_general)
 
+        # 城防御ボーナス（守備側の攻撃力が増加）
+        defense_bonus = defender_province.get_defense_bonus()
+
         # 戦闘ラウンド数（最大10ラウンド）
-        max_rounds = 10
-        attacker_troops = attacker_army.total_troops
-        defender_troops = defender_province.soldiers
+        max_rounds = config.BATTLE_MAX_ROUNDS
+        attacker_start = attacker_army.total_troops
+        defender_start = defender_province.soldiers
+        attacker_troops = attacker_start
+        defender_troops = defender_start
+        retreat_below = attacker_start * config.RETREAT_TROOP_RATIO
 
         # 初期兵力を記録
-        result.attacker_initial_troops = attacker_troops
-        result.defender_initial_troops = defender_troops
+        result.attacker_initial_troops = attacker_start
+        result.defender_initial_troops = defender_start
 
-        for round_num in range(1, max_rounds + 1):
+        # ラウンド別の記録（最大ラウンド数分を確保）
+        rounds = None
+        if record_rounds:
+            rounds = array("l", bytes(array("l").itemsize * BattleResult.ROUND_FIELDS * max_rounds))
+            result._rounds = rounds
+
+        round_num = 0
+        while round_num < max_rounds:
             # 双方のダメージ計算
             # damage_to_XXX = XXXが受けるダメージ
             damage_to_attacker = self._calculate_damage(defender_power, defender_troops, is_attacker=False)  # 守備側→攻撃側
             damage_to_defender = self._calculate_damage(attacker_power, attacker_troops, is_attacker=True)   # 攻撃側→守備側
 
-            # 城防御ボーナス（守備側の攻撃力が増加）
-            damage_to_attacker = int(damage_to_attacker * defender_province.get_defense_bonus())
+            damage_to_attacker = int(damage_to_attacker * defense_bonus)
 
             # ダメージ適用
             defender_casualties = min(damage_to_defender, defender_troops)
@@ -83,13 +160,13 @@ class CombatSystem:
             attacker_troops -= attacker_casualties
 
             # ラウンドデータを記録
-            result.rounds_detail.append({
-                "round": round_num,
-                "attacker_damage": defender_casualties,
-                "defender_damage": attacker_casualties,
-                "attacker_remaining": max(0, attacker_troops),
-                "defender_remaining": max(0, defender_troops)
-            })
+            if rounds is not None:
+                offset = round_num * BattleResult.ROUND_FIELDS
+                rounds[offset] = defender_casualties
+                rounds[offset + 1] = attacker_casualties
+                rounds[offset + 2] = max(0, attacker_troops)
+                rounds[offset + 3] = max(0, defender_troops)
+            round_num += 1
 
             # 勝敗判定
             if defender_troops <= 0:
@@ -100,32 +177,24 @@ class CombatSystem:
                 break
 
             # 士気による撤退判定
-            if attacker_troops < attacker_army.total_troops * 0.3:
-                if random.random() < 0.3:  # 30%の確率で撤退
+            if attacker_troops < retreat_below:
+                if rng.random() < config.RETREAT_PROBABILITY:  # 30%の確率で撤退
                     result.attacker_won = False
                     break
 
         # ラウンド数を記録
-        result.duration_rounds = len(result.rounds_detail)
+        result.duration_rounds = round_num
 
-        # 結果を記録
-        result.attacker_casualties = attacker_army.total_troops - attacker_troops
-        result.defender_casualties = defender_province.soldiers - defender_troops
+        # 結果を記録（戦闘結果サマリーは battle_log の参照時に作る）
+        result.attacker_casualties = attacker_start - attacker_troops
+        result.defender_casualties = defender_start - defender_troops
         result.attacker_remaining = max(0, attacker_troops)
         result.defender_remaining = max(0, defender_troops)
-
-        # 戦闘結果サマリー
-        if result.attacker_won:
-            result.battle_log.append(f"⚔ 攻撃軍が勝利！（損失{result.attacker_casualties}人、残存{result.attacker_remaining}人）")
-            result.battle_log.append(f"   守備軍は壊滅（損失{result.defender_casualties}人）")
-        else:
-            result.battle_log.append(f"🛡 守備軍が勝利！（損失{result.defender_casualties}人、残存{result.defender_remaining}人）")
-            result.battle_log.append(f"   攻撃軍は撤退（損失{result.attacker_casualties}人）")
+        result.defender_province_name = defender_province.name
 
         # 領地占領
         if result.attacker_won and defender_troops <= 0:
             result.province_captured = True
-            result.battle_log.append(f"★ {defender_province.name}を占領！")
 
         return result
 
@@ -189,35 +258,25 @@ class CombatSystem:
                 if daimyo:
                     daimyo.is_alive = False
                     defeated_daimyo_id = general_id
-                    print(f"[Combat] 大名 {daimyo.clan_name} {daimyo.name} が討死")
+                    logger.info("[Combat] 大名 %s %s が討死", daimyo.clan_name, daimyo.name)
             elif config.GENERAL_ID_MIN <= general_id <= config.GENERAL_ID_MAX:
                 # 将軍を討ち取る（敗北した将軍は殺される）
-                if general_id in self.game_state.generals:
-                    del self.game_state.generals[general_id]
+                self.game_state.remove_general(general_id)
             else:
-                print(f"[Combat] Warning: Invalid general_id {general_id} found in governor_general_id")
+                logger.warning("[Combat] Warning: Invalid general_id %s found in governor_general_id", general_id)
 
             province.governor_general_id = None
 
-        # 旧所有者から削除
+        # 領地の所有者を変更（旧所有者から削除し、新所有者に追加）
+        self.game_state.set_province_owner(province.id, new_owner)
+
+        # 全ての領地を失った場合は滅亡
         if old_owner:
             old_daimyo = self.game_state.get_daimyo(old_owner)
-            if old_daimyo:
-                old_daimyo.remove_province(province.id)
-
-                # 全ての領地を失った場合は滅亡
-                if len(old_daimyo.controlled_provinces) == 0:
-                    old_daimyo.is_alive = False
-                    defeated_daimyo_id = old_owner
-                    print(f"[Combat] 大名 {old_daimyo.clan_name} {old_daimyo.name} が滅亡（全領地喪失）")
-
-        # 新所有者に追加
-        new_daimyo = self.game_state.get_daimyo(new_owner)
-        if new_daimyo:
-            new_daimyo.add_province(province.id)
-
-        # 領地の所有者を変更
-        province.owner_daimyo_id = new_owner
+            if old_daimyo and self.game_state.get_province_count(old_owner) == 0:
+                old_daimyo.is_alive = False
+                defeated_daimyo_id = old_owner
+                logger.info("[Combat] 大名 %s %s が滅亡（全領地喪失）", old_daimyo.clan_name, old_daimyo.name)
 
         # 占領軍を駐留
         province.soldiers = attacker_army.total_troops
@@ -320,8 +379,7 @@ class CombatSystem:
 
         # 攻撃側ペナルティ（遠征による士気低下）
         # 攻撃側は城壁がなく、補給線が伸びているため戦力が0.8倍になる
-        expedition_penalty = 0.8
-        base_power = int(base_power * expedition_penalty)
+        base_power = int(base_power * config.EXPEDITION_PENALTY)
 
         return base_power
 
@@ -343,51 +401,205 @@ class CombatSystem:
             troop_count: 相手の兵力
             is_attacker: 攻撃側かどうか（True=攻撃側、False=防御側）
         """
+        rng = self.game_state.get_rng("combat")
+
         # 攻撃側と防御側でダメージ範囲を変える
         if is_attacker:
-            # 攻撃側: 13-21%
-            #damage_ratio = 0.13 + random.random() * 0.09
-            damage_ratio = 0.5*(0.13 + random.random() * 0.09)
+            # 攻撃側: 13-22% × 倍率
+            base, spread = config.ATTACKER_DAMAGE_RATIO
         else:
-            # 防御側: 10-17%
-            #damage_ratio = 0.10 + random.random() * 0.07
-            damage_ratio = 0.5*(0.10 + random.random() * 0.07)
+            # 防御側: 10-17% × 倍率
+            base, spread = config.DEFENDER_DAMAGE_RATIO
+        damage_ratio = config.BATTLE_DAMAGE_SCALE * (base + rng.random() * spread)
 
         damage = int(power * damage_ratio)
 
         # 最低1、最大でも相手の兵力まで
         return max(1, min(damage, troop_count))
 
-    def predict_battle_outcome(
+    def simulate_batch(
         self,
         attacker_army: Army,
-        defender_province: Province
+        defender_province: Province,
+        n: int,
+        rng: Optional[random.Random] = None
     ) -> dict:
-        """戦闘の予測結果を返す（実際には実行しない）"""
+        """resolve_battle と同じラウンド処理で戦闘をn回試行する（ゲーム状態は変更しない）
+
+        Args:
+            rng: 使用する乱数生成器（省略時は対局の進行に影響しない forecast ストリーム）
+
+        Returns:
+            dict: simulate_rounds() の結果
+        """
+        if rng is None:
+            rng = self.game_state.get_rng("forecast")
+
+        attacker_power, defender_power = self.get_battle_powers(attacker_army, defender_province)
+        return simulate_rounds(
+            attacker_power, defender_power, defender_province.get_defense_bonus(),
+            attacker_army.total_troops, defender_province.soldiers, n, rng
+        )
+
+    def get_battle_powers(self, attacker_army: Army, defender_province: Province):
+        """resolve_battle が使う (攻撃側戦力, 守備側戦力) を計算（防御ボーナスは含まない）"""
         attacker_general = None
         if attacker_army.general_id:
             attacker_general = self.game_state.get_general(attacker_army.general_id)
-
         defender_general = None
         if defender_province.governor_general_id:
             defender_general = self.game_state.get_general(defender_province.governor_general_id)
 
-        attacker_power = self._calculate_army_power(attacker_army, attacker_general)
-        defender_power = self._calculate_defender_power(defender_province, defender_general)
+        return (
+            self._calculate_army_power(attacker_army, attacker_general),
+            self._calculate_defender_power(defender_province, defender_general)
+        )
+
+    def predict_battle_outcome(
+        self,
+        attacker_army: Army,
+        defender_province: Province,
+        trials: int = config.BATTLE_PREDICTION_TRIALS
+    ) -> dict:
+        """戦闘の予測結果を返す（simulate_batch で試行、実際には実行しない）"""
+        attacker_power, defender_power = self.get_battle_powers(attacker_army, defender_province)
 
         # 防御ボーナスを考慮
         defender_power = int(defender_power * defender_province.get_defense_bonus())
 
-        # 勝率計算（簡易版）
-        total_power = attacker_power + defender_power
-        if total_power > 0:
-            win_probability = attacker_power / total_power
-        else:
-            win_probability = 0.5
+        # 勝率はラウンド処理の試行から求める
+        simulation = self.simulate_batch(attacker_army, defender_province, trials)
+        win_probability = simulation["win_probability"]
 
         return {
             "attacker_power": attacker_power,
             "defender_power": defender_power,
             "win_probability": win_probability,
+            "expected_attacker_casualties": simulation["expected_attacker_casualties"],
+            "expected_defender_casualties": simulation["expected_defender_casualties"],
+            "expected_rounds": simulation["expected_rounds"],
             "recommendation": "攻撃推奨" if win_probability > 0.6 else "慎重に" if win_probability > 0.4 else "撤退推奨"
         }
+
+    def estimate_attack(self, from_province: Province, soldier_count: int, target_province: Province,
+                        general_id: Optional[int] = None) -> dict:
+        """勝率表から攻撃の勝率と期待損失を求める（試行しないためAIの判断で毎回使える）"""
+        army = self.create_preview_army(from_province, soldier_count, general_id)
+        attacker_power, defender_power = self.get_battle_powers(army, target_province)
+        win_probability, attacker_casualties, defender_casualties = get_win_table().lookup(
+            attacker_power, army.total_troops, defender_power,
+            target_province.get_defense_bonus(), target_province.soldiers
+        )
+        return {
+            "win_probability": win_probability,
+            "expected_attacker_casualties": attacker_casualties,
+            "expected_defender_casualties": defender_casualties
+        }
+
+    def create_preview_army(self, from_province: Province, soldier_count: int,
+                            general_id: Optional[int] = None) -> Army:
+        """戦闘予測用の仮の軍を作成（MilitarySystem.create_attack_army と同じ編成、ゲーム状態は変更しない）"""
+        army = Army(
+            army_id=0,
+            daimyo_id=from_province.owner_daimyo_id,
+            general_id=general_id,
+            current_province_id=from_province.id
+        )
+        army.set_troops(infantry=soldier_count)
+        army.morale = from_province.soldier_morale
+
+        # 米不足で出陣する場合は士気低下
+        if from_province.rice < soldier_count * config.SOLDIER_RICE_CONSUMPTION * 10:
+            army.morale = max(30, army.morale - 20)
+
+        return army
+
+
+def simulate_rounds(attacker_power: int, defender_power: int, defense_bonus: float,
+                    attacker_start: int, defender_start: int, n: int, rng: random.Random) -> dict:
+    """戦力・防御ボーナス・兵力を指定して、resolve_battle と同じラウンド処理をn回試行する
+
+    Returns:
+        dict: {
+            "trials": 試行回数,
+            "win_probability": 攻撃側の勝率（占領率）,
+            "win_probability_stderr": 勝率の標準誤差,
+            "attacker_casualties": 試行ごとの攻撃側損失 (List[int]),
+            "defender_casualties": 試行ごとの守備側損失 (List[int]),
+            "rounds": 試行ごとのラウンド数 (List[int]),
+            "expected_attacker_casualties": 攻撃側損失の平均,
+            "expected_defender_casualties": 守備側損失の平均,
+            "expected_rounds": ラウンド数の平均
+        }
+    """
+    rand = rng.random
+    retreat_below = attacker_start * config.RETREAT_TROOP_RATIO
+    retreat_probability = config.RETREAT_PROBABILITY
+    max_rounds = config.BATTLE_MAX_ROUNDS
+    scale = config.BATTLE_DAMAGE_SCALE
+    attacker_base, attacker_spread = config.ATTACKER_DAMAGE_RATIO
+    defender_base, defender_spread = config.DEFENDER_DAMAGE_RATIO
+
+    wins = 0
+    attacker_casualties = [0] * n
+    defender_casualties = [0] * n
+    rounds = [0] * n
+
+    for trial in range(n):
+        attacker_troops = attacker_start
+        defender_troops = defender_start
+        round_num = 0
+        while round_num < max_rounds:
+            round_num += 1
+
+            # _calculate_damage と同じ計算・同じ順序で乱数を引く（守備側→攻撃側）
+            # max(1, min(damage, troops)) は組み込み関数の呼び出しを避けて条件式で書く
+            damage_to_attacker = int(defender_power * (scale * (defender_base + rand() * defender_spread)))
+            if damage_to_attacker > defender_troops:
+                damage_to_attacker = defender_troops
+            if damage_to_attacker < 1:
+                damage_to_attacker = 1
+            damage_to_defender = int(attacker_power * (scale * (attacker_base + rand() * attacker_spread)))
+            if damage_to_defender > attacker_troops:
+                damage_to_defender = attacker_troops
+            if damage_to_defender < 1:
+                damage_to_defender = 1
+
+            # 城防御ボーナス
+            damage_to_attacker = int(damage_to_attacker * defense_bonus)
+
+            if damage_to_defender < defender_troops:
+                defender_troops -= damage_to_defender
+            else:
+                defender_troops = 0
+            if damage_to_attacker < attacker_troops:
+                attacker_troops -= damage_to_attacker
+            else:
+                attacker_troops = 0
+
+            if defender_troops <= 0:
+                wins += 1
+                break
+            if attacker_troops <= 0:
+                break
+            if attacker_troops < retreat_below and rand() < retreat_probability:
+                break
+
+        attacker_casualties[trial] = attacker_start - attacker_troops
+        defender_casualties[trial] = defender_start - defender_troops
+        rounds[trial] = round_num
+
+    trials = max(n, 1)
+    win_probability = wins / trials
+    return {
+        "trials": n,
+        "win_probability": win_probability,
+        "win_probability_stderr": math.sqrt(win_probability * (1.0 - win_probability) / trials),
+        "attacker_casualties": attacker_casualties,
+        "defender_casualties": defender_casualties,
+        "rounds": rounds,
+        "expected_attacker_casualties": sum(attacker_casualties) / trials,
+        "expected_defender_casualties": sum(defender_casualties) / trials,
+        "expected_rounds": sum(rounds) / trials
+    }
+
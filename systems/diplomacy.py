@@ -1,6 +1,7 @@
 """
 外交システム - 大名間の外交関係を管理
 """
+import heapq
 import config
 from models.diplomacy import DiplomaticRelation, RelationType
 
@@ -41,6 +42,7 @@ class DiplomacySystem:
         # 同盟成立
         relation.relation_type = RelationType.ALLIANCE
         relation.treaty_duration = config.TREATY_DURATION_TURNS
+        self.game_state.schedule_treaty_expiry(relation, config.TREATY_DURATION_TURNS)
 
         return {
             "success": True,
@@ -79,6 +81,7 @@ class DiplomacySystem:
         # 条約成立
         relation.relation_type = RelationType.NON_AGGRESSION
         relation.treaty_duration = config.TREATY_DURATION_TURNS
+        self.game_state.schedule_treaty_expiry(relation, config.TREATY_DURATION_TURNS)
 
         return {
             "success": True,
@@ -111,7 +114,7 @@ class DiplomacySystem:
         # 宣戦布告
         relation.relation_type = RelationType.WAR
         relation.relation_value += config.WAR_RELATION_PENALTY
-        relation.treaty_duration = 0
+        self.game_state.end_treaty(relation)
 
         return {
             "success": True,
@@ -130,7 +133,8 @@ class DiplomacySystem:
             return {"success": False, "message": "自分自身には贈り物できません"}
 
         # 金をチェック（全領地の合計）
-        total_gold = sum(p.gold for p in self.game_state.provinces.values() if p.owner_daimyo_id == sender_id)
+        sender_provinces = self.game_state.get_daimyo_provinces(sender_id)
+        total_gold = sum(p.gold for p in sender_provinces)
 
         if total_gold < config.GIFT_GOLD_AMOUNT:
             return {
@@ -139,16 +143,12 @@ class DiplomacySystem:
             }
 
         # 金を差し引く（最初の領地から）
-        for province in self.game_state.provinces.values():
-            if province.owner_daimyo_id == sender_id:
-                province.add_gold(-config.GIFT_GOLD_AMOUNT)
-                break
+        sender_provinces[0].add_gold(-config.GIFT_GOLD_AMOUNT)
 
         # 相手の最初の領地に金を追加
-        for province in self.game_state.provinces.values():
-            if province.owner_daimyo_id == receiver_id:
-                province.add_gold(config.GIFT_GOLD_AMOUNT)
-                break
+        receiver_provinces = self.game_state.get_daimyo_provinces(receiver_id)
+        if receiver_provinces:
+            receiver_provinces[0].add_gold(config.GIFT_GOLD_AMOUNT)
 
         # 関係値を向上
         relation = self.game_state.get_diplomatic_relation(sender_id, receiver_id)
@@ -172,27 +172,44 @@ class DiplomacySystem:
         return relations
 
     def update_treaties(self):
-        """条約期間を更新（ターン終了時に呼ばれる）"""
+        """条約期間を更新（ターン終了時に呼ばれる）
+
+        条約クロックを1進め、期限ヒープから今回期限切れになる条約だけを取り出す
+        """
         events = []
+        game_state = self.game_state
+        game_state.treaty_clock += 1
+        heap = game_state.treaty_expiry_heap
+
+        while heap and heap[0][0] <= game_state.treaty_clock:
+            expires_at, daimyo_a_id, daimyo_b_id = heapq.heappop(heap)
+            relation = game_state.get_diplomatic_relation(daimyo_a_id, daimyo_b_id)
 
-        for relation in self.game_state.diplomatic_relations:
-            if relation.treaty_duration > 0:
-                relation.treaty_duration -= 1
+            # 宣戦布告や再締結で無効になった登録は読み捨てる
+            if not relation or relation.treaty_expires_at != expires_at:
+                continue
 
-                # 条約期間終了
-                if relation.treaty_duration == 0:
-                    daimyo1 = self.game_state.get_daimyo(relation.daimyo1_id)
-                    daimyo2 = self.game_state.get_daimyo(relation.daimyo2_id)
+            # 条約期間終了
+            game_state.end_treaty(relation)
+            daimyo1 = game_state.get_daimyo(relation.daimyo1_id)
+            daimyo2 = game_state.get_daimyo(relation.daimyo2_id)
 
-                    if daimyo1 and daimyo2:
-                        relation_name = "同盟" if relation.relation_type == RelationType.ALLIANCE else "不可侵条約"
-                        events.append(f"{daimyo1.clan_name}と{daimyo2.clan_name}の{relation_name}が期限切れになりました")
+            if daimyo1 and daimyo2:
+                relation_name = "同盟" if relation.relation_type == RelationType.ALLIANCE else "不可侵条約"
+                events.append(f"{daimyo1.clan_name}と{daimyo2.clan_name}の{relation_name}が期限切れになりました")
 
-                        # 条約終了後は中立に
-                        relation.relation_type = RelationType.NEUTRAL
+                # 条約終了後は中立に
+                relation.relation_type = RelationType.NEUTRAL
 
         return events
 
+    def get_treaty_remaining(self, daimyo_a_id, daimyo_b_id) -> int:
+        """条約の残り期間（ターン数、条約なしの場合は0）"""
+        relation = self.game_state.get_diplomatic_relation(daimyo_a_id, daimyo_b_id)
+        if not relation or relation.treaty_expires_at is None:
+            return 0
+        return relation.treaty_expires_at - self.game_state.treaty_clock
+
     def can_attack(self, attacker_id, target_id):
         """攻撃可能かチェック（外交関係を考慮）"""
         if attacker_id == target_id:
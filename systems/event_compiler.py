@@ -0,0 +1,197 @@
+"""
+イベント効果のコンパイラ
+events.json の効果（effects・mitigation・choices）を読み込み時に
+「(適用関数, 値)」の命令リストへ変換し、発生時は辞書のコピーやキーの探索なしで適用する
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# ========================================
+# 効果ごとの適用関数
+# ========================================
+
+def _apply_rice_multiplier(province, multiplier):
+    rice_production = province.calculate_rice_production()
+    province.rice = max(0, province.rice + int(rice_production * (multiplier - 1.0)))
+
+
+def _apply_rice(province, amount):
+    province.rice = max(0, province.rice + amount)  # Province.add_rice と同じ
+
+
+def _apply_gold(province, amount):
+    province.gold = max(0, province.gold + amount)  # Province.add_gold と同じ
+
+
+def _apply_peasants(province, amount):
+    province.peasants = max(0, province.peasants + amount)
+
+
+def _apply_soldiers(province, amount):
+    province.soldiers = max(0, province.soldiers + amount)
+
+
+def _apply_soldier_loss_percent(province, percent):
+    loss_count = int(province.soldiers * abs(percent))
+    province.soldiers = max(0, province.soldiers - loss_count)
+
+
+def _apply_loyalty_change(province, amount):
+    province.peasant_loyalty = max(0, min(100, province.peasant_loyalty + amount))
+
+
+def _apply_development_level(province, amount):
+    province.development_level = max(0, province.development_level + amount)
+
+
+def _apply_town_level(province, amount):
+    province.town_level = max(0, province.town_level + amount)
+
+
+# 効果キー → 適用関数（この順で適用する）
+EFFECT_OPS: List[Tuple[str, Callable]] = [
+    ("rice_multiplier", _apply_rice_multiplier),
+    ("rice", _apply_rice),
+    ("gold", _apply_gold),
+    ("peasant_loss", _apply_peasants),
+    ("peasants", _apply_peasants),
+    ("soldier_loss", _apply_soldiers),
+    ("soldiers", _apply_soldiers),
+    ("soldier_loss_percent", _apply_soldier_loss_percent),
+    ("loyalty_change", _apply_loyalty_change),
+    ("development_level", _apply_development_level),
+    ("town_level", _apply_town_level),
+]
+EFFECT_KEYS = {key for key, _ in EFFECT_OPS}
+
+# 選択肢の効果にのみ書ける特殊キー（将軍登用）
+CHOICE_SPECIAL_KEYS = {"recruit_general", "assign_to_province"}
+
+# 選択肢のコスト（キー → 適用関数、この順で差し引く）
+COST_OPS: List[Tuple[str, Callable]] = [
+    ("gold", _apply_gold),
+    ("rice", _apply_rice),
+]
+COST_KEYS = {key for key, _ in COST_OPS}
+
+# 被害軽減に使える領地の属性（CompiledEvent.select は治水レベルのみ参照する）
+MITIGATION_ATTRIBUTES = {"flood_control"}
+
+
+class CompiledVariant:
+    """選択肢1つ分（選択肢なしを含む）のコンパイル済み効果"""
+
+    def __init__(self, effects: Dict, ops: List, mitigated_effects: Dict, mitigated_ops: List,
+                 recruit_general_id=None, assign_to_province: bool = False):
+        self.effects = effects  # 履歴に記録する効果（軽減なし）
+        self.ops = ops  # [(適用関数, 値)]（コストを含む）
+        self.mitigated_effects = mitigated_effects  # 履歴に記録する効果（軽減あり）
+        self.mitigated_ops = mitigated_ops
+        self.recruit_general_id = recruit_general_id
+        self.assign_to_province = assign_to_province
+
+
+class CompiledEvent:
+    """イベント1件分のコンパイル済み効果"""
+
+    def __init__(self, variants: Dict[Optional[str], CompiledVariant],
+                 mitigation_attribute: Optional[str], mitigation_threshold):
+        self.variants = variants  # 選択肢ID（選択肢なしはNone） → CompiledVariant
+        self.mitigation_attribute = mitigation_attribute
+        self.mitigation_threshold = mitigation_threshold
+
+    def select(self, province, choice_id: Optional[str]) -> Tuple[CompiledVariant, List, Dict]:
+        """選択肢と軽減条件から適用する命令リストと履歴用の効果を選ぶ
+
+        Returns:
+            (CompiledVariant, 命令リスト, 履歴用の効果)
+        """
+        # 存在しない選択肢IDは選択肢なしとして扱う
+        variant = self.variants.get(choice_id) or self.variants[None]
+        if self.mitigation_attribute and province.flood_control >= self.mitigation_threshold:
+            return variant, variant.mitigated_ops, variant.mitigated_effects
+        return variant, variant.ops, variant.effects
+
+
+# ========================================
+# コンパイル
+# ========================================
+
+def compile_event(event) -> CompiledEvent:
+    """GameEventの効果・軽減条件・選択肢をコンパイル
+
+    Raises:
+        ValueError: 未知の効果キー・コストキー・軽減属性がある場合
+    """
+    _validate_keys(event.effects, EFFECT_KEYS, f"{event.event_id}: 未知の効果キー")
+
+    mitigation = event.mitigation or {}
+    mitigation_attribute = mitigation.get("attribute")
+    if mitigation and mitigation_attribute not in MITIGATION_ATTRIBUTES:
+        raise ValueError(f"{event.event_id}: 未知の軽減属性: {mitigation_attribute}")
+    threshold = mitigation.get("threshold", 0)
+    reduction = mitigation.get("reduction_factor", 1.0)
+
+    variants = {None: _compile_variant(event.effects, {}, {}, mitigation_attribute, reduction)}
+    for choice in event.choices:
+        _validate_keys(choice.effect, EFFECT_KEYS | CHOICE_SPECIAL_KEYS,
+                       f"{event.event_id}/{choice.choice_id}: 未知の効果キー")
+        _validate_keys(choice.cost, COST_KEYS, f"{event.event_id}/{choice.choice_id}: 未知のコストキー")
+        variants[choice.choice_id] = _compile_variant(
+            event.effects, choice.effect, choice.cost, mitigation_attribute, reduction
+        )
+
+    return CompiledEvent(variants, mitigation_attribute, threshold)
+
+
+def _validate_keys(values: Dict, allowed, message: str):
+    unknown = sorted(set(values) - allowed)
+    if unknown:
+        raise ValueError(f"{message}: {', '.join(unknown)}")
+
+
+def _compile_variant(base_effects: Dict, choice_effect: Dict, cost: Dict,
+                     mitigation_attribute: Optional[str], reduction: float) -> CompiledVariant:
+    """選択肢1つ分の効果を、軽減なし・軽減ありの命令リストに変換"""
+    effects = dict(base_effects)
+    effects.update(choice_effect)
+
+    mitigated_effects = effects
+    if mitigation_attribute:
+        mitigated_effects = _mitigate(effects, reduction)
+
+    cost_ops = [(func, -cost[key]) for key, func in COST_OPS if key in cost]
+    return CompiledVariant(
+        effects=effects,
+        ops=cost_ops + _effect_ops(effects),
+        mitigated_effects=mitigated_effects,
+        mitigated_ops=cost_ops + _effect_ops(mitigated_effects),
+        recruit_general_id=choice_effect.get("recruit_general"),
+        assign_to_province="assign_to_province" in choice_effect
+    )
+
+
+def _effect_ops(effects: Dict) -> List:
+    return [(func, effects[key]) for key, func in EFFECT_OPS if key in effects]
+
+
+def _mitigate(effects: Dict, reduction: float) -> Dict:
+    """被害を軽減した効果を作成（治水レベルが閾値以上の場合に使う）"""
+    mitigated = dict(effects)
+
+    # rice_multiplierの軽減（例: 0.7 → 0.85、被害を半減）
+    if "rice_multiplier" in mitigated:
+        diff = 1.0 - mitigated["rice_multiplier"]
+        mitigated["rice_multiplier"] = 1.0 - (diff * reduction)
+
+    # 損失系の軽減
+    for key in list(mitigated.keys()):
+        if "loss" in key or key in ["peasants", "soldiers", "gold", "rice"]:
+            if mitigated[key] < 0:  # マイナス値（損失）の場合
+                mitigated[key] = int(mitigated[key] * reduction)
+
+    # loyalty_changeの軽減（マイナスの場合）
+    if "loyalty_change" in mitigated and mitigated["loyalty_change"] < 0:
+        mitigated["loyalty_change"] = int(mitigated["loyalty_change"] * reduction)
+
+    return mitigated
@@ -1,10 +1,99 @@
 """
 イベントシステム - ランダムイベントとトリガーイベントの管理
 """
-import random
+import bisect
 import json
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from models.event import GameEvent, EventType, EventChoice
+from systems.event_compiler import compile_event
+
+
+# トリガー条件 → (領地の属性名, 下限, 上限)
+TRIGGER_CONDITION_BOUNDS = {
+    "peasant_loyalty_max": ("peasant_loyalty", None, "value"),
+    "peasant_loyalty_min": ("peasant_loyalty", "value", None),
+    "town_level_min": ("town_level", "value", None),
+    "soldiers_max": ("soldiers", None, "value"),
+}
+
+
+class EventTriggerTable:
+    """季節・地形ごとに絞り込んだ発生判定表
+
+    発生候補のイベントを定義順に並べ、「i番目より前のイベントがすべて発生しない確率」
+    survival[i] = Π_{j<i}(1 - p_j) を前計算しておく。
+    各イベントを独立に判定して最初に発生したものを採用する従来の方式と同じ分布を、
+    乱数1回と二分探索で引ける（発生したイベントがトリガー条件を満たさない場合だけ、
+    その次のイベントから引き直す）。
+    """
+
+    def __init__(self, events: List[GameEvent]):
+        self.events = events
+        # 各イベントのトリガー条件（[(属性名, 下限, 上限)]、条件なしは空リスト）
+        self.conditions = [compile_trigger_conditions(event.trigger_conditions) for event in events]
+
+        # bisectで探索するため、生存確率を符号反転して昇順にしておく
+        survival = 1.0
+        self.neg_survival = [-survival]
+        for event in events:
+            survival *= (1.0 - event.probability)
+            self.neg_survival.append(-survival)
+
+    def draw(self, province, rng) -> Optional[GameEvent]:
+        """領地で発生するイベントを1つ引く（発生しない場合はNone）"""
+        neg_survival = self.neg_survival
+        count = len(self.events)
+        start = 0
+        while start < count:
+            if neg_survival[start] == 0:
+                # 確率1のイベントが条件を満たさなかった後は、残りを1つずつ判定する
+                for index in range(start, count):
+                    event = self.events[index]
+                    if rng.random() < event.probability and check_trigger_conditions(self.conditions[index], province):
+                        return event
+                return None
+
+            # start番目以降で最初に発生するイベント:
+            #   survival[i+1] < survival[start] * (1 - u) となる最小のi
+            threshold = neg_survival[start] * (1.0 - rng.random())
+            index = bisect.bisect_right(neg_survival, threshold, start + 1) - 1
+            if index >= count:
+                return None
+
+            if check_trigger_conditions(self.conditions[index], province):
+                return self.events[index]
+
+            # 条件を満たさないイベントは発生しなかったものとして、次のイベントから引き直す
+            start = index + 1
+
+        return None
+
+
+def compile_trigger_conditions(conditions: Dict) -> List[Tuple[str, Optional[float], Optional[float]]]:
+    """トリガー条件の辞書を (属性名, 下限, 上限) のリストに変換（未対応の条件は無視）"""
+    compiled = []
+    for key, value in conditions.items():
+        bounds = TRIGGER_CONDITION_BOUNDS.get(key)
+        if not bounds:
+            continue  # その他の条件は将来実装
+        attribute, low, high = bounds
+        compiled.append((
+            attribute,
+            value if low == "value" else None,
+            value if high == "value" else None
+        ))
+    return compiled
+
+
+def check_trigger_conditions(compiled, province) -> bool:
+    """compile_trigger_conditions() で変換した条件を領地が満たすか"""
+    for attribute, low, high in compiled:
+        value = getattr(province, attribute)
+        if low is not None and value < low:
+            return False
+        if high is not None and value > high:
+            return False
+    return True
 
 
 class EventSystem:
@@ -16,6 +105,16 @@ class EventSystem:
         self.event_history = []  # イベント履歴
         self.general_pool = None  # GeneralPoolは後で設定
 
+    @property
+    def events(self) -> List[GameEvent]:
+        return self._events
+
+    @events.setter
+    def events(self, events: List[GameEvent]):
+        # イベントリストを差し替えたら発生判定表を作り直す
+        self._events = events
+        self._trigger_tables: Dict[Tuple[str, str], EventTriggerTable] = {}
+
     def load_events_from_file(self, events_file_path: str):
         """events.jsonからイベントを読み込む"""
         try:
@@ -37,6 +136,8 @@ class EventSystem:
             if event:
                 self.events.append(event)
 
+        self._trigger_tables.clear()
+
     def _create_event_from_dict(self, data: dict) -> Optional[GameEvent]:
         """辞書からGameEventオブジェクトを作成"""
         try:
@@ -73,6 +174,9 @@ class EventSystem:
                 )
                 event.choices.append(choice)
 
+            # 効果をコンパイル（未知の効果キーはここでエラーにする）
+            event.compiled = compile_event(event)
+
             return event
 
         except (KeyError, ValueError) as e:
@@ -84,104 +188,58 @@ class EventSystem:
         Returns: List[(event, province)]
         """
         triggered_events = []
-        triggered_provinces = set()  # 同じ領地で重複発生を防ぐ
+        rng = self.game_state.get_rng("events")
 
-        # 各領地に対してイベントチェック
+        # 各領地に対してイベントチェック（1領地につき1イベントまで、定義順で先に発生したものを採用）
         for province in self.game_state.provinces.values():
-            # 既にこの領地でイベントが発生している場合はスキップ
-            if province.id in triggered_provinces:
+            table = self._get_trigger_table(current_season, province.terrain_type)
+            if not table.events:
                 continue
 
-            # 各イベントをチェック
-            for event in self.events:
-                if self._should_trigger(event, province, current_season):
-                    triggered_events.append((event, province))
-                    triggered_provinces.add(province.id)
-                    break  # 1領地につき1イベントまで
+            event = table.draw(province, rng)
+            if event:
+                triggered_events.append((event, province))
 
         return triggered_events
 
-    def _should_trigger(self, event: GameEvent, province, season: str) -> bool:
-        """イベントが発生すべきか判定"""
-        # 季節チェック
-        if event.season_restriction and season not in event.season_restriction:
-            return False
-
-        # 地形チェック
-        if event.terrain_restriction and province.terrain not in event.terrain_restriction:
-            return False
-
-        # トリガー条件チェック
-        if event.trigger_conditions:
-            if not self._check_trigger_conditions(event, province):
-                return False
-
-        # 確率判定
-        return random.random() < event.probability
-
-    def _check_trigger_conditions(self, event: GameEvent, province) -> bool:
-        """トリガー条件をチェック"""
-        conditions = event.trigger_conditions
-
-        # 忠誠度の最大値チェック
-        if "peasant_loyalty_max" in conditions:
-            if province.peasant_loyalty > conditions["peasant_loyalty_max"]:
-                return False
-
-        # 忠誠度の最小値チェック
-        if "peasant_loyalty_min" in conditions:
-            if province.peasant_loyalty < conditions["peasant_loyalty_min"]:
-                return False
-
-        # 町レベルチェック
-        if "town_level_min" in conditions:
-            if province.town_level < conditions["town_level_min"]:
-                return False
-
-        # 兵士数チェック
-        if "soldiers_max" in conditions:
-            if province.soldiers > conditions["soldiers_max"]:
-                return False
-
-        # その他の条件は将来実装
-        return True
+    def _get_trigger_table(self, season: str, terrain: str) -> EventTriggerTable:
+        """季節・地形の発生判定表を取得（初回に作成してキャッシュ）"""
+        key = (season, terrain)
+        table = self._trigger_tables.get(key)
+        if table is None:
+            candidates = [
+                event for event in self.events
+                if event.probability > 0
+                and (not event.season_restriction or season in event.season_restriction)
+                and (not event.terrain_restriction or terrain in event.terrain_restriction)
+            ]
+            table = EventTriggerTable(candidates)
+            self._trigger_tables[key] = table
+        return table
 
     def apply_event_effect(self, event: GameEvent, province,
                           choice_id: Optional[str] = None):
         """イベント効果を適用"""
-        effects = event.effects.copy()
-        selected_choice = None
-
-        # 選択肢による効果の上書き
-        if choice_id and event.choices:
-            for choice in event.choices:
-                if choice.choice_id == choice_id:
-                    selected_choice = choice
-                    effects.update(choice.effect)
-                    # コストを差し引く
-                    if "gold" in choice.cost:
-                        province.add_gold(-choice.cost["gold"])
-                    if "rice" in choice.cost:
-                        province.add_rice(-choice.cost["rice"])
-                    break
-
-        # 軽減条件のチェック
-        if event.mitigation:
-            self._apply_mitigation(event, province, effects)
+        if event.compiled is None:
+            event.compiled = compile_event(event)
+
+        # 選択肢・軽減条件（治水レベル）に応じたコンパイル済みの効果を選ぶ
+        variant, ops, effects = event.compiled.select(province, choice_id)
 
         # 将軍登用の特殊処理
-        if selected_choice and "recruit_general" in selected_choice.effect:
-            general_id = selected_choice.effect["recruit_general"]
-            if self.general_pool and general_id:
+        if variant.recruit_general_id:
+            general_id = variant.recruit_general_id
+            if self.general_pool:
                 self.general_pool.recruit_general(general_id, province.owner_daimyo_id)
                 # 指定された領地に配置
                 general = self.game_state.get_general(general_id)
-                if general and "assign_to_province" in selected_choice.effect:
+                if general and variant.assign_to_province:
                     province.governor_general_id = general.id
                     general.assign_to_province(province.id)
 
-        # 効果を適用
-        self._apply_effects_to_province(province, effects)
+        # コスト・効果を適用
+        for apply, value in ops:
+            apply(province, value)
 
         # 履歴に記録
         self.event_history.append({
@@ -193,79 +251,6 @@ class EventSystem:
             "effects": effects
         })
 
-    def _apply_mitigation(self, event: GameEvent, province, effects: dict):
-        """軽減条件を適用"""
-        attr = event.mitigation.get("attribute")
-        threshold = event.mitigation.get("threshold", 0)
-        reduction = event.mitigation.get("reduction_factor", 1.0)
-
-        # 治水レベルによる被害軽減
-        if attr == "flood_control" and province.flood_control >= threshold:
-            # rice_multiplierの軽減
-            if "rice_multiplier" in effects:
-                # 例: 0.7 → 0.85（被害を半減）
-                original = effects["rice_multiplier"]
-                diff = 1.0 - original
-                effects["rice_multiplier"] = 1.0 - (diff * reduction)
-
-            # 損失系の軽減
-            for key in list(effects.keys()):
-                if "loss" in key or key in ["peasants", "soldiers", "gold", "rice"]:
-                    if effects[key] < 0:  # マイナス値（損失）の場合
-                        effects[key] = int(effects[key] * reduction)
-
-            # loyalty_changeの軽減（マイナスの場合）
-            if "loyalty_change" in effects and effects["loyalty_change"] < 0:
-                effects["loyalty_change"] = int(effects["loyalty_change"] * reduction)
-
-    def _apply_effects_to_province(self, province, effects: dict):
-        """効果を領地に適用"""
-        # 米の増減（multiplier）
-        if "rice_multiplier" in effects:
-            rice_production = province.calculate_rice_production()
-            rice_change = int(rice_production * (effects["rice_multiplier"] - 1.0))
-            province.add_rice(rice_change)
-
-        # 米の増減（直接）
-        if "rice" in effects:
-            province.add_rice(effects["rice"])
-
-        # 金の増減
-        if "gold" in effects:
-            province.add_gold(effects["gold"])
-
-        # 農民の増減
-        if "peasant_loss" in effects:
-            province.peasants = max(0, province.peasants + effects["peasant_loss"])
-
-        if "peasants" in effects:
-            province.peasants = max(0, province.peasants + effects["peasants"])
-
-        # 兵士の増減
-        if "soldier_loss" in effects:
-            province.soldiers = max(0, province.soldiers + effects["soldier_loss"])
-
-        if "soldiers" in effects:
-            province.soldiers = max(0, province.soldiers + effects["soldiers"])
-
-        # 兵士の割合減少
-        if "soldier_loss_percent" in effects:
-            loss_count = int(province.soldiers * abs(effects["soldier_loss_percent"]))
-            province.soldiers = max(0, province.soldiers - loss_count)
-
-        # 忠誠度
-        if "loyalty_change" in effects:
-            province.peasant_loyalty = max(0, min(100,
-                province.peasant_loyalty + effects["loyalty_change"]))
-
-        # 開発レベル
-        if "development_level" in effects:
-            province.development_level = max(0, province.development_level + effects["development_level"])
-
-        # 町レベル
-        if "town_level" in effects:
-            province.town_level = max(0, province.town_level + effects["town_level"])
-
     def get_recent_events(self, count: int = 10) -> List[dict]:
         """最近のイベント履歴を取得"""
         return self.event_history[-count:] if self.event_history else []
@@ -0,0 +1,139 @@
+"""
+GeneralAssignment - 将軍の配置の割当問題
+大名の空いている将軍を守将のいない領地へ配置する組み合わせを、将軍 × 領地の効用の合計が
+最大になるように割当問題（ハンガリアン法）で1度に決める。
+
+- 領地の優先度: 兵士数 + 城あり1000 + 敵に面した隣接領地1つにつき500（従来の配置と同じ）
+- 効用: 優先度 ×（軍事の重み × (武力 + 統率) + 内政の重み × (政治 + 知略)）
+  前線（他勢力に隣接）の領地は軍事の重みを大きく、後方の領地は内政の重みを大きくする
+- 将軍が何千人いても、各領地の効用の上位 N 人（N は領地数）の和集合だけを候補にする
+  （最適な割当は必ずこの候補の中にある）ため、ハンガリアン法は領地数の規模で解ける
+"""
+import heapq
+from typing import Callable, List, Tuple
+
+INF = float("inf")
+
+# 軍事の重み（内政の重みは 1 - 軍事の重み）
+FRONT_MILITARY_WEIGHT = 0.75
+REAR_MILITARY_WEIGHT = 0.25
+
+
+def solve_assignment(utility: List[List[float]]) -> List[int]:
+    """効用の合計が最大になる割当（ハンガリアン法、ポテンシャル付き、O(n^2 m)）
+
+    Args:
+        utility: n × m の効用の行列（n <= m）
+
+    Returns:
+        行ごとに割り当てた列の番号
+    """
+    n = len(utility)
+    if n == 0:
+        return []
+    m = len(utility[0])
+    if n > m:
+        raise ValueError(f"行数（{n}）が列数（{m}）より多い割当問題は解けません")
+
+    # 最小費用の割当として解く（費用 = -効用、行・列の番号は1から、0は番兵）
+    cost = [[0.0] + [-value for value in row] for row in utility]
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    match = [0] * (m + 1)  # 列 → 割り当てた行
+    way = [0] * (m + 1)
+    columns = range(1, m + 1)
+    for i in range(1, n + 1):
+        match[0] = i
+        j0 = 0
+        minv = [INF] * (m + 1)
+        free = set(columns)  # まだ木に入っていない列
+        tree = [0]  # 木に入った列
+        while True:
+            i0 = match[j0]
+            row = cost[i0 - 1]
+            ui0 = u[i0]
+            delta = INF
+            j1 = 0
+            for j in free:
+                current = row[j] - ui0 - v[j]
+                if current < minv[j]:
+                    minv[j] = current
+                    way[j] = j0
+                    if current < delta:
+                        delta = current
+                        j1 = j
+                elif minv[j] < delta:
+                    delta = minv[j]
+                    j1 = j
+            for j in tree:
+                u[match[j]] += delta
+                v[j] -= delta
+            for j in free:
+                minv[j] -= delta
+            j0 = j1
+            free.discard(j0)
+            tree.append(j0)
+            if match[j0] == 0:
+                break
+        # 増加路に沿って割当を入れ替える
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+
+    assignment = [0] * n
+    for j in range(1, m + 1):
+        if match[j]:
+            assignment[match[j] - 1] = j - 1
+    return assignment
+
+
+class GeneralAssignment:
+    """将軍の配置を割当問題で決めるクラス"""
+
+    def __init__(self, priority: Callable, is_front: Callable):
+        """
+        Args:
+            priority: 領地 → 優先度
+            is_front: 領地 → 他勢力に隣接しているか
+        """
+        self.priority = priority
+        self.is_front = is_front
+
+    def assign(self, provinces: List, generals: List) -> List[Tuple]:
+        """(領地, 将軍) の組のリスト（領地の優先度の高い順、組の数は領地数と将軍数の少ない方）"""
+        if not provinces or not generals:
+            return []
+
+        weights = []
+        for province in provinces:
+            military = FRONT_MILITARY_WEIGHT if self.is_front(province) else REAR_MILITARY_WEIGHT
+            weights.append((self.priority(province) + 1, military))
+
+        # 候補: 軍事の重みの種類ごとに、効用の上位 N 人（同点は generals の順）
+        count = len(provinces)
+        stats = [(g.war_skill + g.leadership, g.politics + g.intelligence) for g in generals]
+        candidates = set()
+        for military in sorted({military for _, military in weights}):
+            politics = 1 - military
+            candidates.update(heapq.nlargest(
+                count, range(len(generals)), key=lambda i: military * stats[i][0] + politics * stats[i][1]
+            ))
+        candidates = [generals[i] for i in sorted(candidates)]
+
+        utility = [
+            [scale * (military * (g.war_skill + g.leadership) + (1 - military) * (g.politics + g.intelligence))
+             for g in candidates]
+            for scale, military in weights
+        ]
+
+        # 行数 <= 列数 になるよう、将軍が少ない場合は転置して解く
+        if len(provinces) <= len(candidates):
+            pairs = [(provinces[i], candidates[j]) for i, j in enumerate(solve_assignment(utility))]
+        else:
+            transposed = [list(column) for column in zip(*utility)]
+            pairs = [(provinces[i], candidates[j]) for j, i in enumerate(solve_assignment(transposed))]
+
+        order = {id(province): -scale for province, (scale, _) in zip(provinces, weights)}
+        pairs.sort(key=lambda pair: (order[id(pair[0])], pair[0].id))
+        return pairs
@@ -2,8 +2,7 @@
 GeneralPool - 浪人将軍管理システム
 未所属の将軍を管理し、登用イベントを提供
 """
-import random
-from typing import List, Optional
+from typing import Dict, List, Optional
 from models.general import General
 
 
@@ -12,13 +11,14 @@ class GeneralPool:
 
     def __init__(self, game_state):
         self.game_state = game_state
-        self.available_generals: List[int] = []  # 浪人の将軍ID
+        # 浪人の将軍ID（値は使わない。登録順を保ったまま O(1) で削除するため辞書で持つ）
+        self.available_generals: Dict[int, None] = {}
 
     def initialize(self):
         """初期化: 全将軍を浪人プールに追加"""
         for general_id, general in self.game_state.generals.items():
             if general.serving_daimyo_id is None:
-                self.available_generals.append(general_id)
+                self.available_generals[general_id] = None
 
     def get_available_generals(self) -> List[General]:
         """登用可能な浪人将軍のリストを取得"""
@@ -33,7 +33,7 @@ class GeneralPool:
         available = self.get_available_generals()
         if not available:
             return None
-        return random.choice(available)
+        return self.game_state.get_rng("events").choice(available)
 
     def recruit_general(self, general_id: int, daimyo_id: int) -> bool:
         """将軍を登用"""
@@ -45,7 +45,7 @@ class GeneralPool:
             return False
 
         # 浪人プールから削除
-        self.available_generals.remove(general_id)
+        del self.available_generals[general_id]
 
         # 大名に仕える
         general.serving_daimyo_id = daimyo_id
@@ -61,7 +61,13 @@ class GeneralPool:
             general.unassign()
 
             if general_id not in self.available_generals:
-                self.available_generals.append(general_id)
+                self.available_generals[general_id] = None
+
+    def clone(self, game_state) -> "GeneralPool":
+        """分岐したゲーム状態用のコピーを作成（GameState.fork用）"""
+        clone = GeneralPool(game_state)
+        clone.available_generals = dict(self.available_generals)
+        return clone
 
     def calculate_recruitment_cost(self, general: General) -> int:
         """登用費用を計算（100-300金）"""
@@ -0,0 +1,313 @@
+"""
+LogisticsPlanner - 兵站計画（最小費用流）
+大名ごとに後方の自領地の余剰（兵士・金・米）を前線の自領地の不足へ配る輸送を、
+自領地の隣接関係を辺とする最小費用流で1度に求め、転送コマンドにまとめる。
+
+- 供給: 後方の領地（前線までの距離が1以上）の、守備兵・備蓄を残した余剰（1回の転送上限まで）
+- 需要: 前線の領地（他勢力に隣接する自領地）の不足
+- 辺: 隣接する自領地どうし（容量は TransferSystem.MAX_*_TRANSFER、費用は1ホップにつき1）
+
+1領地につき1コマンドのため、資源ごとの最小費用流をまだ使っていない転送元で解き、転送元ごとに
+前線の不足を埋める割合（量 ÷ 転送先の目標量）が最も大きい資源の転送を採用する。採用しなかった
+転送元は、残りの不足に対して次の回で解き直す（MAX_ROUNDS 回まで）。
+1つの転送元から複数の転送先へ流れた場合は最も多い流れだけを使う。
+転送は自領地を経由する経路（TransferSystem）で転送先へ直接送る。
+"""
+import heapq
+from collections import deque
+from typing import Dict, List, Tuple
+
+from systems.transfer_system import TransferSystem
+
+INF = float("inf")
+
+
+class MinCostFlow:
+    """最小費用流（ポテンシャル付きダイクストラ＋最短路グラフ上のブロッキングフロー）
+
+    辺の費用は非負とする。ダイクストラ1回ごとに、同じ費用の増加路へまとめて流すため、
+    反復回数は最短路の長さの種類数程度になる。
+    """
+
+    def __init__(self, node_count: int):
+        self.node_count = node_count
+        # 辺: [行き先, 残り容量, 費用, 逆辺の番号, 元の容量]
+        self.graph: List[List[list]] = [[] for _ in range(node_count)]
+
+    def add_edge(self, u: int, v: int, capacity: int, cost: int):
+        """辺を追加"""
+        self.graph[u].append([v, capacity, cost, len(self.graph[v]), capacity])
+        self.graph[v].append([u, 0, -cost, len(self.graph[u]) - 1, 0])
+
+    def flow(self, s: int, t: int) -> Tuple[int, int]:
+        """s から t へ最小費用で最大流を流す
+
+        Returns:
+            (流量, 費用)
+        """
+        graph = self.graph
+        n = self.node_count
+        potential = [0] * n
+        total_flow = 0
+        total_cost = 0
+
+        while True:
+            # 被約費用でダイクストラ
+            dist = [INF] * n
+            dist[s] = 0
+            heap = [(0, s)]
+            while heap:
+                d, u = heapq.heappop(heap)
+                if d > dist[u]:
+                    continue
+                pu = potential[u]
+                for v, capacity, cost, _, _ in graph[u]:
+                    if capacity > 0:
+                        nd = d + cost + pu - potential[v]
+                        if nd < dist[v]:
+                            dist[v] = nd
+                            heapq.heappush(heap, (nd, v))
+            if dist[t] == INF:
+                break
+            for v in range(n):
+                if dist[v] < INF:
+                    potential[v] += dist[v]
+
+            # 被約費用0の辺だけで、流せなくなるまでブロッキングフロー
+            while True:
+                level = self._levels(s, potential)
+                if level[t] < 0:
+                    break
+                iters = [0] * n
+                while True:
+                    pushed = self._push(s, t, INF, level, iters, potential)
+                    if not pushed:
+                        break
+                    total_flow += pushed
+                    total_cost += pushed * (potential[t] - potential[s])
+
+        return total_flow, total_cost
+
+    def edge_flows(self, u: int) -> List[Tuple[int, int]]:
+        """u から出る元の辺ごとの (行き先, 流量)（流量0の辺を除く）"""
+        return [
+            (v, original - capacity) for v, capacity, _, _, original in self.graph[u]
+            if original > 0 and original > capacity
+        ]
+
+    def _levels(self, s: int, potential: List[int]) -> List[int]:
+        """被約費用0・残り容量ありの辺だけをたどる幅優先探索の深さ（到達できない頂点は-1）"""
+        graph = self.graph
+        level = [-1] * self.node_count
+        level[s] = 0
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            pu = potential[u]
+            for v, capacity, cost, _, _ in graph[u]:
+                if capacity > 0 and level[v] < 0 and cost + pu - potential[v] == 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+        return level
+
+    def _push(self, u: int, t: int, limit, level: List[int], iters: List[int], potential: List[int]) -> int:
+        """深さが1ずつ増える被約費用0の辺で u から t へ流す（流せた量を返す）"""
+        if u == t:
+            return limit
+        edges = self.graph[u]
+        pu = potential[u]
+        while iters[u] < len(edges):
+            edge = edges[iters[u]]
+            v, capacity, cost, rev, _ = edge
+            if capacity > 0 and level[v] == level[u] + 1 and cost + pu - potential[v] == 0:
+                pushed = self._push(v, t, min(limit, capacity), level, iters, potential)
+                if pushed:
+                    edge[1] -= pushed
+                    self.graph[v][rev][1] += pushed
+                    return pushed
+            iters[u] += 1
+        return 0
+
+
+class LogisticsPlanner:
+    """兵站計画クラス"""
+
+    # 資源ごとの (コマンド, Provinceの属性, 1回の転送上限)（埋める割合が同じならこの順に選ぶ）
+    RESOURCES = (
+        ("transfer_soldiers", "soldiers", TransferSystem.MAX_SOLDIERS_TRANSFER),
+        ("transfer_gold", "gold", TransferSystem.MAX_GOLD_TRANSFER),
+        ("transfer_rice", "rice", TransferSystem.MAX_RICE_TRANSFER),
+    )
+
+    # 後方の領地に残す量
+    SOLDIER_GARRISON = 100
+    GOLD_RESERVE = 80
+    RICE_RESERVE = 200
+
+    # 前線の領地の目標量（兵士は隣接する他勢力の最大兵力の1.35倍が300を超える場合はそちら）
+    FRONT_SOLDIERS = 300
+    FRONT_ENEMY_RATIO = 1.35
+    FRONT_GOLD = 500
+    FRONT_RICE = 500
+
+    # これ未満の転送はしない
+    MIN_TRANSFER_AMOUNT = 10
+
+    # 採用しなかった転送元で解き直す回数の上限（1回目を含む）
+    MAX_ROUNDS = 3
+
+    def __init__(self, game_state):
+        self.game_state = game_state
+
+    def plan(self, daimyo_id: int) -> Dict[int, Dict]:
+        """大名の兵站計画を作成
+
+        Returns:
+            転送元の領地ID → 転送コマンド（{"type", "target_id", "amount"}）
+        """
+        game_state = self.game_state
+        provinces = game_state.provinces
+        frontline_field = game_state.frontline_field
+        owned = sorted(game_state.provinces_by_owner.get(daimyo_id, ()))
+        if len(owned) < 2:
+            return {}
+
+        index = {province_id: i for i, province_id in enumerate(owned)}
+        distance = {province_id: frontline_field.get_distance(province_id) for province_id in owned}
+        front = [province_id for province_id in owned if distance[province_id] == 0]
+        rear = [province_id for province_id in owned if distance[province_id] is not None and distance[province_id] > 0]
+        if not front or not rear:
+            return {}
+
+        # 前線の目標量と残りの不足、後方の送り出せる量（資源ごと）
+        targets = {}
+        demands = {}
+        supplies = {}
+        for _, attribute, max_amount in self.RESOURCES:
+            targets[attribute] = {}
+            demands[attribute] = {}
+            for province_id in front:
+                target = self._get_target(provinces[province_id], attribute)
+                targets[attribute][province_id] = target
+                demands[attribute][province_id] = target - getattr(provinces[province_id], attribute)
+            supplies[attribute] = {}
+            for province_id in rear:
+                amount = min(self.get_surplus(provinces[province_id], attribute), max_amount)
+                if amount >= self.MIN_TRANSFER_AMOUNT:
+                    supplies[attribute][province_id] = amount
+
+        plan = {}
+        pending = {attribute for _, attribute, _ in self.RESOURCES}
+        for _ in range(self.MAX_ROUNDS):
+            if not pending:
+                break
+            # 転送元 → (埋める割合, コマンド, Provinceの属性, 転送先, 量)
+            candidates = {}
+            flows = {}
+            for command, attribute, max_amount in self.RESOURCES:
+                if attribute not in pending:
+                    continue
+                demand = {
+                    province_id: amount for province_id, amount in demands[attribute].items()
+                    if amount >= self.MIN_TRANSFER_AMOUNT
+                }
+                supply = {
+                    province_id: amount for province_id, amount in supplies[attribute].items()
+                    if province_id not in plan
+                }
+                if not supply or not demand:
+                    continue
+                flows[attribute], transfers = self._solve(owned, index, supply, demand, max_amount)
+                for source_id, target_id, amount in transfers:
+                    if amount < self.MIN_TRANSFER_AMOUNT:
+                        continue
+                    score = amount / targets[attribute][target_id]
+                    if source_id not in candidates or score > candidates[source_id][0]:
+                        candidates[source_id] = (score, command, attribute, target_id, amount)
+            if not candidates:
+                break
+
+            # 資源ごとに1つの流れの一部なので、採用しても転送先の不足を超えない
+            adopted = dict.fromkeys(flows, 0)
+            for source_id, (_, command, attribute, target_id, amount) in candidates.items():
+                plan[source_id] = {"type": command, "target_id": target_id, "amount": amount}
+                demands[attribute][target_id] -= amount
+                adopted[attribute] += amount
+
+            # 流れをすべて採用できた資源は、解き直しても流れが増えないため解き直さない
+            pending = {attribute for attribute, flow in flows.items() if adopted[attribute] < flow}
+
+        return plan
+
+    @classmethod
+    def get_surplus(cls, province, attribute: str) -> int:
+        """後方の領地から送り出せる量（残す量を除く）"""
+        if attribute == "soldiers":
+            return province.soldiers - cls.SOLDIER_GARRISON
+        if attribute == "gold":
+            return province.gold - cls.GOLD_RESERVE
+        return province.rice - cls.RICE_RESERVE
+
+    def _get_target(self, province, attribute: str) -> int:
+        """前線の領地の目標量"""
+        if attribute == "soldiers":
+            enemy = self.game_state.border_index.get_max_foreign_soldiers(province.id)
+            return max(self.FRONT_SOLDIERS, int(enemy * self.FRONT_ENEMY_RATIO))
+        if attribute == "gold":
+            return self.FRONT_GOLD
+        return self.FRONT_RICE
+
+    def _solve(self, owned: List[int], index: Dict[int, int], supplies: Dict[int, int],
+               demands: Dict[int, int], edge_capacity: int) -> Tuple[int, List[Tuple[int, int, int]]]:
+        """1資源の最小費用流を解き、(流量, 転送元ごとに最も多い流れの (転送元, 転送先, 量) のリスト) を返す"""
+        provinces = self.game_state.provinces
+        source = len(owned)
+        sink = source + 1
+        network = MinCostFlow(len(owned) + 2)
+
+        for province_id in owned:
+            u = index[province_id]
+            for adj_id in provinces[province_id].adjacent_provinces:
+                v = index.get(adj_id)
+                if v is not None and v != u:
+                    network.add_edge(u, v, edge_capacity, 1)
+        for province_id, amount in supplies.items():
+            network.add_edge(source, index[province_id], amount, 0)
+        for province_id, amount in demands.items():
+            network.add_edge(index[province_id], sink, amount, 0)
+
+        total_flow = network.flow(source, sink)[0]
+        if total_flow == 0:
+            return 0, []
+
+        # 流れを転送元 → 転送先の経路に分解（前線に着いたら需要の辺を優先して終える）
+        remaining = [dict() for _ in range(len(owned) + 2)]
+        for u in range(len(owned) + 2):
+            for v, amount in network.edge_flows(u):
+                remaining[u][v] = remaining[u].get(v, 0) + amount
+
+        transfers = []
+        for province_id in sorted(supplies):
+            start = index[province_id]
+            best = None
+            while remaining[source].get(start, 0) > 0:
+                path = [start]
+                amount = remaining[source][start]
+                u = start
+                while u != sink:
+                    v = sink if remaining[u].get(sink, 0) > 0 else next(
+                        w for w, flow in remaining[u].items() if flow > 0
+                    )
+                    amount = min(amount, remaining[u][v])
+                    path.append(v)
+                    u = v
+                remaining[source][start] -= amount
+                for u, v in zip(path, path[1:]):
+                    remaining[u][v] -= amount
+                target_id = owned[path[-2]]
+                if target_id != province_id and (best is None or amount > best[2]):
+                    best = (province_id, target_id, amount)
+            if best is not None:
+                transfers.append(best)
+
+        return total_flow, transfers
@@ -0,0 +1,343 @@
+"""
+SearchAI - モンテカルロ木探索によるAI大名のコマンド決定
+
+AI大名の領地を順に並べ、「i番目の領地のコマンド」を木のi段目の選択として探索する（UCT）。
+各ノードは GameState.fork() で分岐した状態を持つ。内政・転送コマンドは実際のターンと同様に
+即時に適用し、軍事コマンド（徴兵・攻撃）は保留して全領地の決定後にまとめて実行する。
+
+プレイアウトでは残りの領地に従来AIのコマンドを割り当てて軍事コマンドを実行し、
+AI_SEARCH_HORIZON_TURNS ターンを全大名AIで進めてから、領地・兵力・資源の占有率で評価する。
+
+異なる手順で同じ局面（探索の深さ・領地の数値列・保留中の軍事コマンドが一致）に達した場合は
+置換表（局面ハッシュ → ノード）で同じノードにまとめ、統計を共有する。
+（例: 資金不足で失敗するコマンドと「何もしない」は同じ局面になる）
+
+近似:
+    - 同じターン内で手番より後の大名の行動は先読みせず、次のターンから進める
+    - プレイアウト中はプレイヤー大名も従来AIとして扱う
+"""
+import math
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+import config
+from core.game_initializer import create_game_systems
+from core.sequential_turn_manager import SequentialTurnManager, run_to_completion
+from debug.log_channels import get_logger
+
+logger = get_logger("ai")
+
+# 評価値の重み（領地数・兵力・金と米の占有率）
+PROVINCE_WEIGHT = 0.6
+SOLDIER_WEIGHT = 0.25
+WEALTH_WEIGHT = 0.15
+
+
+class SearchNode:
+    """探索木のノード（先頭から depth 個の領地のコマンドを決めた局面）"""
+
+    __slots__ = ("systems", "pending", "depth", "candidates", "untried", "children", "visits", "value_sum")
+
+    def __init__(self, systems: Dict, pending: Tuple, depth: int, candidates: List[Dict]):
+        self.systems = systems  # 分岐した状態に対するシステム一式（create_game_systems の辞書）
+        self.pending = pending  # 保留中の軍事コマンド ((領地ID, コマンドの項目), ...)
+        self.depth = depth
+        self.candidates = candidates  # 次の領地の候補コマンド（先頭は従来AIの選択）
+        self.untried = list(range(len(candidates) - 1, -1, -1))  # 未展開の候補番号（末尾から取り出す）
+        self.children: Dict[int, "SearchNode"] = {}  # 候補番号 → 子ノード
+        self.visits = 0
+        self.value_sum = 0.0
+
+
+class SearchAI:
+    """探索AIクラス"""
+
+    def __init__(self, game_state, events: Optional[List] = None):
+        """
+        Args:
+            game_state: ゲーム状態（探索中は変更しない）
+            events: 読み込み済みのイベントリスト（プレイアウトのイベント発生に使う）
+        """
+        self.game_state = game_state
+        self.events = events if events is not None else []
+        self.budget_ms = config.AI_SEARCH_BUDGET_MS
+        self.max_iterations = config.AI_SEARCH_MAX_ITERATIONS
+        self.horizon_turns = config.AI_SEARCH_HORIZON_TURNS
+        self.exploration = config.AI_SEARCH_EXPLORATION
+        self.max_candidates = config.AI_SEARCH_MAX_CANDIDATES
+
+        # 置換表（局面ハッシュ → ノード、plan() ごとに作り直す）
+        self.table: Dict[int, SearchNode] = {}
+
+        # 直前の plan() の統計
+        self.last_iterations = 0
+        self.last_transpositions = 0  # 置換表で既存ノードにまとめた展開の数
+        self.last_elapsed_ms = 0.0
+        # 1反復あたりの時間（直前に反復した plan() の平均、探索時間が足りるかの見積もり）
+        self.iteration_ms: Optional[float] = None
+
+    # ========================================
+    # 探索
+    # ========================================
+
+    def plan(self, daimyo_id: int, province_ids: List[int], rng: Optional[random.Random] = None,
+             budget_ms: Optional[float] = None) -> Dict[int, Dict]:
+        """領地ごとのコマンドを決める
+
+        探索の最初の展開は従来AIの選択のため、時間が足りず探索が浅い場合も
+        従来AIと同じか、それより評価値の高いコマンドが返る。
+
+        Args:
+            daimyo_id: 大名ID
+            province_ids: コマンドを決める領地ID（この順で決める）
+            rng: プレイアウトの乱数（Noneの場合は forecast ストリーム）
+            budget_ms: この呼び出しの探索時間（Noneの場合は AI_SEARCH_BUDGET_MS）。
+                0以下か、直前の1反復あたりの時間より短い場合は探索しない
+
+        Returns:
+            領地ID → コマンド（{"type": ...}、"none" は何もしない）。
+            探索が届かなかった領地は含まない（呼び出し側で従来AIを使う）
+        """
+        start = time.perf_counter()
+        if budget_ms is None:
+            budget_ms = self.budget_ms
+        elif budget_ms <= 0 or (self.iteration_ms is not None and budget_ms < self.iteration_ms):
+            logger.debug("[SearchAI] 大名%d: 探索時間%.1fmsが1反復（%sms）に満たないため従来AI",
+                         daimyo_id, budget_ms, self.iteration_ms)
+            self.last_iterations = 0
+            self.last_elapsed_ms = 0.0
+            return {}
+        deadline = None if budget_ms is None else start + budget_ms / 1000
+        if rng is None:
+            rng = self.game_state.get_rng("forecast")
+
+        self.table = {}
+        self.last_iterations = 0
+        self.last_transpositions = 0
+
+        if not province_ids:
+            return {}
+
+        root = self._create_node(self._create_systems(self.game_state.fork()), (), 0, daimyo_id, province_ids)
+        while self.last_iterations < self.max_iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self._iterate(root, daimyo_id, province_ids, rng)
+            self.last_iterations += 1
+
+        # 訪問回数の最も多い子をたどる
+        plan = {}
+        node = root
+        while node.children:
+            index, child = max(node.children.items(), key=lambda item: item[1].visits)
+            plan[province_ids[node.depth]] = dict(node.candidates[index])
+            node = child
+
+        self.last_elapsed_ms = (time.perf_counter() - start) * 1000
+        if self.last_iterations:
+            self.iteration_ms = self.last_elapsed_ms / self.last_iterations
+        logger.debug("[SearchAI] 大名%d: %d領地中%d領地を決定（反復%d回、置換%d回、%.1fms）",
+                     daimyo_id, len(province_ids), len(plan), self.last_iterations,
+                     self.last_transpositions, self.last_elapsed_ms)
+        return plan
+
+    def _iterate(self, root: SearchNode, daimyo_id: int, province_ids: List[int], rng):
+        """選択 → 展開 → プレイアウト → 逆伝播 を1回行う"""
+        path = [root]
+        node = root
+
+        # 選択: 全候補を展開済みのノードはUCB1で子を選ぶ
+        while node.depth < len(province_ids) and not node.untried:
+            log_visits = math.log(node.visits)
+            node = max(
+                node.children.values(),
+                key=lambda child: child.value_sum / child.visits
+                + self.exploration * math.sqrt(log_visits / child.visits)
+            )
+            path.append(node)
+
+        # 展開: 未展開の候補を1つ適用
+        if node.depth < len(province_ids) and node.untried:
+            index = node.untried.pop()
+            child = self._expand(node, index, daimyo_id, province_ids)
+            node.children[index] = child
+            node = child
+            path.append(node)
+
+        value = self._playout(node, daimyo_id, province_ids, rng)
+        for visited in path:
+            visited.visits += 1
+            visited.value_sum += value
+
+    def _expand(self, node: SearchNode, index: int, daimyo_id: int, province_ids: List[int]) -> SearchNode:
+        """候補コマンドを適用した子ノードを作成（同じ局面のノードがあれば置換表から返す）"""
+        action = node.candidates[index]
+        province_id = province_ids[node.depth]
+        systems = node.systems
+        pending = node.pending
+
+        if action["type"] in SequentialTurnManager.MILITARY_COMMANDS:
+            pending = pending + ((province_id, tuple(sorted(action.items()))),)
+        elif action["type"] != "none":
+            # 内政・転送は即時に適用（元のノードの状態は変更しない）
+            systems = self._create_systems(systems["game_state"].fork())
+            state = systems["game_state"]
+            run_to_completion(systems["turn_manager"]._execute_internal_command(
+                state.get_province(province_id), state.get_daimyo(daimyo_id), action
+            ))
+
+        depth = node.depth + 1
+        key = _position_key(systems["game_state"], pending, depth)
+        child = self.table.get(key)
+        if child is not None:
+            self.last_transpositions += 1
+            return child
+
+        child = self._create_node(systems, pending, depth, daimyo_id, province_ids)
+        self.table[key] = child
+        return child
+
+    def _create_node(self, systems: Dict, pending: Tuple, depth: int,
+                     daimyo_id: int, province_ids: List[int]) -> SearchNode:
+        candidates = []
+        if depth < len(province_ids):
+            candidates = self._candidate_actions(systems, province_ids[depth], daimyo_id)
+        return SearchNode(systems, pending, depth, candidates)
+
+    # ========================================
+    # 候補コマンド
+    # ========================================
+
+    def _candidate_actions(self, systems: Dict, province_id: int, daimyo_id: int) -> List[Dict]:
+        """領地の候補コマンド（先頭は従来AIの選択、重複なし、最大 max_candidates 個）"""
+        state = systems["game_state"]
+        turn_manager = systems["turn_manager"]
+        province = state.get_province(province_id)
+        daimyo = state.get_daimyo(daimyo_id)
+
+        candidates = [_default_action(turn_manager, province, daimyo), {"type": "none"}]
+
+        # 攻撃: 攻撃可能な隣接領地（兵力の少ない順）× 派遣率
+        if province.soldiers > config.MIN_GARRISON_TROOPS:
+            targets = []
+            for adj_id in province.adjacent_provinces:
+                adj = state.get_province(adj_id)
+                if adj and adj.owner_daimyo_id != daimyo_id and \
+                        systems["diplomacy_system"].can_attack(daimyo_id, adj.owner_daimyo_id):
+                    targets.append(adj)
+            targets.sort(key=lambda adj: adj.soldiers)
+            for adj in targets:
+                for ratio in config.ATTACK_RATIO_OPTIONS[1:3]:
+                    candidates.append({
+                        "type": "attack",
+                        "target_id": adj.id,
+                        "attack_force": int(province.soldiers * ratio),
+                        "general_id": province.governor_general_id
+                    })
+
+        # 徴兵
+        if province.peasants >= 100 and province.gold >= config.RECRUIT_COST_PER_SOLDIER * 100:
+            candidates.append({"type": "recruit", "amount": 100})
+
+        # 内政
+        if province.gold >= config.CULTIVATION_COST:
+            candidates.append({"type": "cultivate"})
+        if province.gold >= config.TOWN_DEVELOPMENT_COST:
+            candidates.append({"type": "develop_town"})
+        if province.rice >= config.GIVE_RICE_AMOUNT:
+            candidates.append({"type": "give_rice"})
+
+        unique = []
+        for action in candidates:
+            if action not in unique:
+                unique.append(action)
+            if len(unique) >= self.max_candidates:
+                break
+        return unique
+
+    # ========================================
+    # プレイアウト・評価
+    # ========================================
+
+    def _playout(self, node: SearchNode, daimyo_id: int, province_ids: List[int], rng) -> float:
+        """残りの領地を従来AIで決め、数ターン進めて評価値（0.0～1.0）を返す"""
+        state = node.systems["game_state"].fork()
+        state.seed_rng(rng.getrandbits(32), state.independent_rng_streams)
+        for daimyo in state.daimyo.values():
+            daimyo.is_player = False
+        systems = self._create_systems(state)
+        turn_manager = systems["turn_manager"]
+        daimyo = state.get_daimyo(daimyo_id)
+
+        commands = [dict(items, province_id=province_id) for province_id, items in node.pending]
+        for province_id in province_ids[node.depth:]:
+            province = state.get_province(province_id)
+            if province.owner_daimyo_id != daimyo_id:
+                continue
+            action = _default_action(turn_manager, province, daimyo)
+            if action["type"] in SequentialTurnManager.MILITARY_COMMANDS:
+                action["province_id"] = province_id
+                commands.append(action)
+            elif action["type"] != "none":
+                run_to_completion(turn_manager._execute_internal_command(province, daimyo, action))
+
+        result = run_to_completion(turn_manager._execute_military_commands(daimyo, commands))
+        for _ in range(self.horizon_turns):
+            if result or not daimyo.is_alive:
+                break
+            result = run_to_completion(turn_manager.execute_turn())
+            turn_manager.pending_event_choices.clear()
+
+        return evaluate(state, daimyo_id)
+
+    def _create_systems(self, state) -> Dict:
+        """分岐した状態に対するシステム一式（戦闘演出なし・探索の入れ子なし）"""
+        systems = create_game_systems(state, self.events)
+        systems["turn_manager"].quiet_battles = True
+        systems["turn_manager"].parallel_planning = False
+        systems["ai_system"].allow_search = False
+        return systems
+
+
+def evaluate(game_state, daimyo_id: int) -> float:
+    """大名の評価値（領地数・兵力・金と米の占有率の重み付き和、滅亡時は0.0）"""
+    daimyo = game_state.get_daimyo(daimyo_id)
+    if not daimyo or not daimyo.is_alive:
+        return 0.0
+
+    columns = game_state.province_store.columns
+    own_provinces = own_soldiers = own_wealth = 0
+    total_soldiers = total_wealth = 0
+    for owner_id, soldiers, gold, rice in zip(columns["owner_daimyo_id"], columns["soldiers"],
+                                              columns["gold"], columns["rice"]):
+        total_soldiers += soldiers
+        total_wealth += gold + rice
+        if owner_id == daimyo_id:
+            own_provinces += 1
+            own_soldiers += soldiers
+            own_wealth += gold + rice
+
+    return (PROVINCE_WEIGHT * own_provinces / max(len(columns["owner_daimyo_id"]), 1)
+            + SOLDIER_WEIGHT * own_soldiers / max(total_soldiers, 1)
+            + WEALTH_WEIGHT * own_wealth / max(total_wealth, 1))
+
+
+def _default_action(turn_manager, province, daimyo) -> Dict:
+    """従来AIのコマンド（軍事を優先し、なければ内政・転送）"""
+    action = turn_manager._ai_decide_military_action(province, daimyo)
+    if action["type"] == "none":
+        action = turn_manager._ai_decide_internal_action(province, daimyo)
+    return action
+
+
+def _position_key(game_state, pending: Tuple, depth: int) -> int:
+    """置換表のキー（探索の深さ・保留中の軍事コマンド・領地の状態のハッシュ）"""
+    columns = game_state.province_store.columns
+    return hash((
+        depth,
+        pending,
+        tuple(tuple(column) for column in columns.values()),
+        tuple(province.flood_control for province in game_state.provinces.values())
+    ))
+
@@ -1,9 +1,13 @@
 """
 TransferSystem - リソース転送システム
-隣接する自領地間で兵士・金・米を転送
+自領地間で兵士・金・米を転送（自領地だけを通る経路があれば隣接していなくてもよい）
 """
 from typing import Optional, List, Tuple
+import logging
 from models.province import Province
+from debug.log_channels import get_logger
+
+logger = get_logger("transfer")
 
 
 class TransferResult:
@@ -16,6 +20,7 @@ class TransferResult:
         self.to_province_name = ""
         self.resource_type = ""
         self.amount = 0
+        self.route: List[int] = []  # 経路（転送元・転送先を含む領地ID）
 
 
 class TransferSystem:
@@ -26,33 +31,34 @@ class TransferSystem:
     MAX_GOLD_TRANSFER = 500
     MAX_RICE_TRANSFER = 300
 
+    # 経路の最大ホップ数（Noneは無制限、1は隣接する自領地のみ）
+    MAX_ROUTE_HOPS = None
+
     def __init__(self, game_state):
         self.game_state = game_state
 
     def get_valid_transfer_targets(self, from_province_id: int) -> List[Province]:
         """
-        転送可能な隣接領地のリストを取得
+        転送可能な自領地のリストを取得（近い順）
 
         条件:
-        - 隣接している
         - 同じ大名が支配している
+        - 同じ大名の領地だけを通って到達できる（MAX_ROUTE_HOPS以内）
         """
-        from_province = self.game_state.get_province(from_province_id)
-        if not from_province or not from_province.owner_daimyo_id:
-            return []
-
-        valid_targets = []
-
-        for adj_id in from_province.adjacent_provinces:
-            adj_province = self.game_state.get_province(adj_id)
-            if not adj_province:
-                continue
-
-            # 同じ大名が支配しているか確認
-            if adj_province.owner_daimyo_id == from_province.owner_daimyo_id:
-                valid_targets.append(adj_province)
-
-        return valid_targets
+        provinces = self.game_state.provinces
+        return [
+            provinces[province_id]
+            for province_id in self.game_state.route_cache.get_reachable(from_province_id, self.MAX_ROUTE_HOPS)
+        ]
+
+    def get_transfer_route(self, from_province_id: int, to_province_id: int) -> Optional[List[int]]:
+        """転送の経路（転送元・転送先を含む領地ID、転送できない場合はNone）"""
+        route = self.game_state.route_cache.get_route(from_province_id, to_province_id)
+        if route is None or len(route) < 2:
+            return None
+        if self.MAX_ROUTE_HOPS is not None and len(route) - 1 > self.MAX_ROUTE_HOPS:
+            return None
+        return route
 
     def transfer_soldiers(
         self,
@@ -64,11 +70,11 @@ class TransferSystem:
         result = TransferResult()
         result.resource_type = "兵士"
 
-        # デバッグログ
-        debug = self.game_state.get_player_daimyo() is None
+        # デバッグログ（全AI操作モードのみ、transferチャンネル無効時はメッセージを組み立てない）
+        debug = logger.isEnabledFor(logging.DEBUG) and self.game_state.get_player_daimyo() is None
         if debug:
-            print(f"[TRANSFER SYSTEM] transfer_soldiers called")
-            print(f"[TRANSFER SYSTEM]   from_id={from_province_id}, to_id={to_province_id}, amount={amount}")
+            logger.debug("[TRANSFER SYSTEM] transfer_soldiers called")
+            logger.debug("[TRANSFER SYSTEM]   from_id=%s, to_id=%s, amount=%s", from_province_id, to_province_id, amount)
 
         # バリデーション
         validation_msg = self._validate_transfer(from_province_id, to_province_id)
@@ -76,35 +82,35 @@ class TransferSystem:
             result.success = False
             result.message = validation_msg
             if debug:
-                print(f"[TRANSFER SYSTEM]   ✗ Validation failed: {validation_msg}")
+                logger.debug("[TRANSFER SYSTEM]   ✗ Validation failed: %s", validation_msg)
             return result
 
         from_province = self.game_state.get_province(from_province_id)
         to_province = self.game_state.get_province(to_province_id)
 
         if debug:
-            print(f"[TRANSFER SYSTEM]   from={from_province.name}(兵{from_province.soldiers}) → to={to_province.name}(兵{to_province.soldiers})")
+            logger.debug("[TRANSFER SYSTEM]   from=%s(兵%s) → to=%s(兵%s)", from_province.name, from_province.soldiers, to_province.name, to_province.soldiers)
 
         # 転送量の検証
         if amount <= 0:
             result.success = False
             result.message = "転送量は1以上を指定してください"
             if debug:
-                print(f"[TRANSFER SYSTEM]   ✗ amount <= 0")
+                logger.debug("[TRANSFER SYSTEM]   ✗ amount <= 0")
             return result
 
         if amount > self.MAX_SOLDIERS_TRANSFER:
             result.success = False
             result.message = f"兵士は1ターンに最大{self.MAX_SOLDIERS_TRANSFER}人まで転送可能です"
             if debug:
-                print(f"[TRANSFER SYSTEM]   ✗ amount > MAX_SOLDIERS_TRANSFER ({amount} > {self.MAX_SOLDIERS_TRANSFER})")
+                logger.debug("[TRANSFER SYSTEM]   ✗ amount > MAX_SOLDIERS_TRANSFER (%s > %s)", amount, self.MAX_SOLDIERS_TRANSFER)
             return result
 
         if from_province.soldiers < amount:
             result.success = False
             result.message = f"兵士が不足しています（必要: {amount}人、保有: {from_province.soldiers}人）"
             if debug:
-                print(f"[TRANSFER SYSTEM]   ✗ 兵士不足 ({from_province.soldiers} < {amount})")
+                logger.debug("[TRANSFER SYSTEM]   ✗ 兵士不足 (%s < %s)", from_province.soldiers, amount)
             return result
 
         # 最低守備兵を残す（10人）
@@ -112,7 +118,7 @@ class TransferSystem:
             result.success = False
             result.message = "最低10人の兵士を残す必要があります"
             if debug:
-                print(f"[TRANSFER SYSTEM]   ✗ 最低守備兵不足 ({from_province.soldiers} - {amount} = {from_province.soldiers - amount} < 10)")
+                logger.debug("[TRANSFER SYSTEM]   ✗ 最低守備兵不足 (%s - %s = %s < 10)", from_province.soldiers, amount, from_province.soldiers - amount)
             return result
 
         # 転送実行
@@ -123,11 +129,12 @@ class TransferSystem:
         result.from_province_name = from_province.name
         result.to_province_name = to_province.name
         result.amount = amount
-        result.message = f"👥 {from_province.name} → {to_province.name}: 兵士{amount}人を移動"
+        result.route = self.get_transfer_route(from_province_id, to_province_id)
+        result.message = f"👥 {from_province.name} → {to_province.name}: 兵士{amount}人を移動{self._route_text(result.route)}"
 
         if debug:
-            print(f"[TRANSFER SYSTEM]   ✓ 転送成功!")
-            print(f"[TRANSFER SYSTEM]   転送後: {from_province.name}(兵{from_province.soldiers}) / {to_province.name}(兵{to_province.soldiers})")
+            logger.debug("[TRANSFER SYSTEM]   ✓ 転送成功!")
+            logger.debug("[TRANSFER SYSTEM]   転送後: %s(兵%s) / %s(兵%s)", from_province.name, from_province.soldiers, to_province.name, to_province.soldiers)
 
         return result
 
@@ -175,7 +182,8 @@ class TransferSystem:
         result.from_province_name = from_province.name
         result.to_province_name = to_province.name
         result.amount = amount
-        result.message = f"💰 {from_province.name} → {to_province.name}: 金{amount}を送付"
+        result.route = self.get_transfer_route(from_province_id, to_province_id)
+        result.message = f"💰 {from_province.name} → {to_province.name}: 金{amount}を送付{self._route_text(result.route)}"
 
         return result
 
@@ -223,7 +231,8 @@ class TransferSystem:
         result.from_province_name = from_province.name
         result.to_province_name = to_province.name
         result.amount = amount
-        result.message = f"🌾 {from_province.name} → {to_province.name}: 米{amount}を運搬"
+        result.route = self.get_transfer_route(from_province_id, to_province_id)
+        result.message = f"🌾 {from_province.name} → {to_province.name}: 米{amount}を運搬{self._route_text(result.route)}"
 
         return result
 
@@ -242,10 +251,6 @@ class TransferSystem:
         if from_province_id == to_province_id:
             return "同じ領地への転送はできません"
 
-        # 隣接チェック
-        if to_province_id not in from_province.adjacent_provinces:
-            return "隣接していない領地への転送はできません"
-
         # 所有者チェック
         if from_province.owner_daimyo_id != to_province.owner_daimyo_id:
             return "異なる大名の領地への転送はできません"
@@ -253,4 +258,15 @@ class TransferSystem:
         if not from_province.owner_daimyo_id:
             return "無所属の領地からは転送できません"
 
+        # 経路チェック（自領地だけを通って到達できるか）
+        if self.get_transfer_route(from_province_id, to_province_id) is None:
+            return "自領地を通って到達できない領地への転送はできません"
+
         return None
+
+    def _route_text(self, route: List[int]) -> str:
+        """経由地の表示（隣接への転送は空文字）"""
+        if len(route) <= 2:
+            return ""
+        names = "・".join(self.game_state.provinces[province_id].name for province_id in route[1:-1])
+        return f"（{names}経由）"
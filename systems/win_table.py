@@ -0,0 +1,276 @@
+"""
+WinTable - 戦闘の勝率表
+CombatSystem のラウンド処理を事前に試行した結果（勝率・期待損失）をバイナリファイルに保存し、
+実行時は補間で引く。AIの攻撃判断で戦闘を毎回試行せずに勝率を使うためのもの。
+
+表の軸:
+    - 攻撃速度 = 攻撃側戦力 / 守備側兵力（1ラウンドで守備側の何割を削れるか）
+    - 反撃速度 = 守備側戦力 × 防御ボーナス / 攻撃側兵力（1ラウンドで攻撃側の何割を削られるか）
+    - 防御ボーナス（ダメージの切り捨て後に掛かるため、小規模な戦闘では速度だけでは決まらない）
+    - 兵力規模 = 守備側兵力（整数の切り捨て・最低ダメージ1の影響）
+ダメージは戦力に比例し兵力に依存しないため、戦力比・防御ボーナス・兵力の組み合わせは
+この4軸で表せる（戦力比 = 攻撃速度 / 反撃速度 × 守備側兵力 / 攻撃側兵力）。
+
+config.py の戦闘ラウンド定数から作るハッシュをファイルに記録し、
+定数が変わっていれば読み込み時に作り直す。手動で作り直す場合:
+    python -m systems.win_table --trials 400
+"""
+import argparse
+import bisect
+import hashlib
+import math
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+from typing import List, Optional, Tuple
+
+import config
+from debug.log_channels import get_logger
+
+logger = get_logger("combat")
+
+# ファイル形式のバージョン（形式を変えたら上げる。軸の値はハッシュに含まれる）
+TABLE_VERSION = 1
+MAGIC = b"NWT1"
+
+# 軸の値（対数で等間隔）
+ATTACK_RATE_AXIS = [0.25 * 1.2 ** i for i in range(24)]  # 0.25 ～ 16.5
+DEFENSE_RATE_AXIS = [0.25 * 1.2 ** i for i in range(24)]
+DEFENSE_BONUS_AXIS = [1.0, 1.2, 1.4, 1.65]  # 地形 × 城（最大 1.15 × 1.42）
+TROOP_SCALE_AXIS = [20, 40, 80, 160, 320, 800, 2000, 6000]
+
+# 1マスあたりの値: 勝率, 攻撃側損失率（攻撃側兵力比）, 守備側損失率（守備側兵力比）
+VALUES_PER_CELL = 3
+
+# ファイルヘッダ: MAGIC, ハッシュ, 試行回数, 各軸の要素数
+HEADER_FORMAT = "<4s16sIHHHH"
+
+
+def combat_constants() -> tuple:
+    """勝率表の内容を決める config の戦闘ラウンド定数"""
+    return (
+        config.BATTLE_MAX_ROUNDS,
+        config.BATTLE_DAMAGE_SCALE,
+        tuple(config.ATTACKER_DAMAGE_RATIO),
+        tuple(config.DEFENDER_DAMAGE_RATIO),
+        config.RETREAT_TROOP_RATIO,
+        config.RETREAT_PROBABILITY,
+    )
+
+
+def table_key(constants: Optional[tuple] = None) -> bytes:
+    """戦闘定数・軸・形式バージョンのハッシュ（16バイト）"""
+    if constants is None:
+        constants = combat_constants()
+    source = repr((TABLE_VERSION, constants, ATTACK_RATE_AXIS, DEFENSE_RATE_AXIS,
+                   DEFENSE_BONUS_AXIS, TROOP_SCALE_AXIS))
+    return hashlib.sha256(source.encode("utf-8")).digest()[:16]
+
+
+class WinTable:
+    """勝率表クラス"""
+
+    def __init__(self, key: bytes, trials: int, values: array):
+        self.key = key
+        self.trials = trials  # 1マスあたりの試行回数
+        self.values = values  # float32、[攻撃速度][反撃速度][防御ボーナス][兵力規模][値] の順
+
+        self._log_attack = [math.log(v) for v in ATTACK_RATE_AXIS]
+        self._log_defense = [math.log(v) for v in DEFENSE_RATE_AXIS]
+        self._log_scale = [math.log(v) for v in TROOP_SCALE_AXIS]
+        self._stride_bonus = len(TROOP_SCALE_AXIS) * VALUES_PER_CELL
+        self._stride_defense = len(DEFENSE_BONUS_AXIS) * self._stride_bonus
+        self._stride_attack = len(DEFENSE_RATE_AXIS) * self._stride_defense
+
+    # ========================================
+    # 参照
+    # ========================================
+
+    def lookup(self, attacker_power: int, attacker_troops: int, defender_power: int,
+               defense_bonus: float, defender_troops: int) -> Tuple[float, float, float]:
+        """勝率と期待損失を補間で求める
+
+        Args:
+            attacker_power: 攻撃側戦力（CombatSystem.get_battle_powers の値）
+            attacker_troops: 攻撃側兵力
+            defender_power: 守備側戦力（防御ボーナスを含まない）
+            defense_bonus: 防御ボーナス（Province.get_defense_bonus）
+            defender_troops: 守備側兵力
+
+        Returns:
+            (勝率, 攻撃側の期待損失, 守備側の期待損失)
+        """
+        if attacker_troops <= 0:
+            return 0.0, 0.0, 0.0
+        if defender_troops <= 0:
+            return 1.0, 0.0, 0.0
+
+        attack_rate = max(attacker_power, 1) / defender_troops
+        defense_rate = max(defender_power * defense_bonus, 1.0) / attacker_troops
+
+        ia, ta = _locate(self._log_attack, math.log(attack_rate))
+        id_, td = _locate(self._log_defense, math.log(defense_rate))
+        ib, tb = _locate(DEFENSE_BONUS_AXIS, defense_bonus)
+        is_, ts = _locate(self._log_scale, math.log(defender_troops))
+
+        # 16隅の重み付き平均（多重線形補間）
+        values = self.values
+        stride_a = self._stride_attack
+        stride_d = self._stride_defense
+        stride_b = self._stride_bonus
+        win = attacker_loss = defender_loss = 0.0
+        for da, wa in ((0, 1.0 - ta), (1, ta)):
+            if wa == 0.0:
+                continue
+            for dd, wd in ((0, 1.0 - td), (1, td)):
+                if wd == 0.0:
+                    continue
+                for db, wb in ((0, 1.0 - tb), (1, tb)):
+                    if wb == 0.0:
+                        continue
+                    base = (ia + da) * stride_a + (id_ + dd) * stride_d + (ib + db) * stride_b
+                    for ds, ws in ((0, 1.0 - ts), (1, ts)):
+                        weight = wa * wd * wb * ws
+                        if weight == 0.0:
+                            continue
+                        offset = base + (is_ + ds) * VALUES_PER_CELL
+                        win += weight * values[offset]
+                        attacker_loss += weight * values[offset + 1]
+                        defender_loss += weight * values[offset + 2]
+
+        return win, attacker_loss * attacker_troops, defender_loss * defender_troops
+
+    # ========================================
+    # 保存・読み込み
+    # ========================================
+
+    def save(self, path: str):
+        """バイナリファイルに保存（一時ファイルに書いてから置き換える）"""
+        header = struct.pack(
+            HEADER_FORMAT, MAGIC, self.key, self.trials, *_axis_sizes()
+        )
+        data = array("f", self.values)
+        if sys.byteorder == "big":
+            data.byteswap()
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(header)
+            f.write(data.tobytes())
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["WinTable"]:
+        """バイナリファイルから読み込む（存在しない・形式が違う場合はNone）"""
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+
+        header_size = struct.calcsize(HEADER_FORMAT)
+        if len(content) < header_size:
+            return None
+        magic, key, trials, *sizes = struct.unpack_from(HEADER_FORMAT, content)
+        if magic != MAGIC or tuple(sizes) != _axis_sizes():
+            return None
+
+        values = array("f")
+        values.frombytes(content[header_size:])
+        if sys.byteorder == "big":
+            values.byteswap()
+        if len(values) != math.prod(sizes) * VALUES_PER_CELL:
+            return None
+
+        return cls(key, trials, values)
+
+
+def _axis_sizes() -> Tuple[int, int, int, int]:
+    return len(ATTACK_RATE_AXIS), len(DEFENSE_RATE_AXIS), len(DEFENSE_BONUS_AXIS), len(TROOP_SCALE_AXIS)
+
+
+def _locate(axis: List[float], value: float) -> Tuple[int, float]:
+    """軸上の区間の開始位置と区間内の位置（0.0～1.0）を返す（範囲外は端に丸める）"""
+    if value <= axis[0]:
+        return 0, 0.0
+    if value >= axis[-1]:
+        return len(axis) - 2, 1.0
+    index = bisect.bisect_right(axis, value) - 1
+    return index, (value - axis[index]) / (axis[index + 1] - axis[index])
+
+
+# ========================================
+# 作成
+# ========================================
+
+def build_win_table(trials: int = config.WIN_TABLE_TRIALS, seed: int = 0) -> WinTable:
+    """全マスで戦闘を試行して勝率表を作成"""
+    from systems.combat import simulate_rounds
+
+    rng = random.Random(seed)
+    values = array("f")
+    for attack_rate in ATTACK_RATE_AXIS:
+        for defense_rate in DEFENSE_RATE_AXIS:
+            for defense_bonus in DEFENSE_BONUS_AXIS:
+                for troops in TROOP_SCALE_AXIS:
+                    # 両軍の兵力を揃え、戦力で速度を表す
+                    result = simulate_rounds(
+                        int(round(attack_rate * troops)), int(round(defense_rate * troops / defense_bonus)),
+                        defense_bonus, troops, troops, trials, rng
+                    )
+                    values.append(result["win_probability"])
+                    values.append(result["expected_attacker_casualties"] / troops)
+                    values.append(result["expected_defender_casualties"] / troops)
+
+    return WinTable(table_key(), trials, values)
+
+
+_cached_table: Optional[WinTable] = None
+_cached_constants: Optional[tuple] = None
+
+
+def get_win_table(path: str = config.WIN_TABLE_DATA) -> WinTable:
+    """現在の戦闘定数に対応する勝率表を取得
+
+    ファイルが存在しないか、戦闘定数のハッシュが一致しない場合は作り直して保存する
+    （保存できない場合はメモリ上でのみ使う）。
+    """
+    global _cached_table, _cached_constants
+
+    constants = combat_constants()
+    if _cached_table is not None and constants == _cached_constants:
+        return _cached_table
+
+    key = table_key(constants)
+    table = WinTable.load(path)
+    if table is None or table.key != key:
+        logger.warning("[WinTable] 戦闘定数が変わったため勝率表を作り直します（%s）", path)
+        table = build_win_table()
+        try:
+            table.save(path)
+        except OSError as e:
+            logger.warning("[WinTable] 勝率表を保存できません: %s", e)
+
+    _cached_table = table
+    _cached_constants = constants
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="戦闘の勝率表を作成する")
+    parser.add_argument("--trials", type=int, default=config.WIN_TABLE_TRIALS, help="1マスあたりの試行回数")
+    parser.add_argument("--output", default=config.WIN_TABLE_DATA, help="出力ファイル")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    table = build_win_table(args.trials)
+    table.save(args.output)
+    cells = math.prod(_axis_sizes())
+    print(f"{args.output}: {cells}マス × {args.trials}試行 ({time.perf_counter() - start:.1f}秒)")
+
+
+if __name__ == "__main__":
+    main()
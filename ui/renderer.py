@@ -29,6 +29,9 @@ class GameRenderer:
         self.image_manager = image_manager
         self.power_map = power_map
 
+        # 攻撃選択画面の戦闘予測キャッシュ（毎フレーム試行し直さないため）
+        self._battle_prediction_cache = {}
+
     def _render_overlays(self, dialogs, ui_state):
         """ダイアログとオーバーレイを描画
 
@@ -514,7 +517,7 @@ class GameRenderer:
         transfer_panel = Panel(770, 220-60, 220, 250, "転送コマンド", self.font_medium)
         transfer_panel.draw(self.screen)
 
-        # 転送可能な隣接領地があるかチェック
+        # 転送可能な自領地があるかチェック
         valid_targets = transfer_system.get_valid_transfer_targets(selected_province_id)
         has_targets = len(valid_targets) > 0
 
@@ -561,9 +564,9 @@ class GameRenderer:
         # 転送情報の表示
         transfer_info_y = 490-70
         if has_targets:
-            info_text = f"転送できる隣接領地: {len(valid_targets)}箇所"
+            info_text = f"転送できる自領地: {len(valid_targets)}箇所"
         else:
-            info_text = "転送できる隣接領地なし"
+            info_text = "転送できる自領地なし"
         text = self.font_small.render(info_text, True, config.UI_TEXT_COLOR)
         self.screen.blit(text, (810, transfer_info_y))
 
@@ -572,6 +575,27 @@ class GameRenderer:
         if btn_close_detail:
             btn_close_detail.draw(self.screen)
 
+    def _predict_win_probability(self, combat_system, game_state, origin_province, target, attack_force):
+        """攻撃の勝率を戦闘の試行で予測（同じ条件の結果はキャッシュする）
+
+        Returns:
+            勝率（0.0～1.0）。戦闘システムがない場合はNone
+        """
+        if not combat_system or attack_force <= 0:
+            return None
+
+        general_id = origin_province.governor_general_id
+        key = (game_state.current_turn, origin_province.id, target.id, attack_force, general_id,
+               origin_province.soldier_morale, origin_province.rice, target.soldiers, target.governor_general_id)
+        win_probability = self._battle_prediction_cache.get(key)
+        if win_probability is None:
+            if len(self._battle_prediction_cache) > 256:
+                self._battle_prediction_cache.clear()
+            army = combat_system.create_preview_army(origin_province, attack_force, general_id)
+            win_probability = combat_system.predict_battle_outcome(army, target)["win_probability"]
+            self._battle_prediction_cache[key] = win_probability
+        return win_probability
+
     def render_attack_selection(self, game_state, ui_state, buttons):
         """攻撃対象選択画面を描画
 
@@ -643,15 +667,27 @@ class GameRenderer:
 
                 # 勝率予測（選択中の比率を使用）
                 attack_force = int(origin_province.soldiers * selected_attack_ratio)
-                if attack_force > target.soldiers * 1.5:
+                win_probability = self._predict_win_probability(
+                    ui_state.get('combat_system'), game_state, origin_province, target, attack_force
+                )
+                if win_probability is not None:
+                    advantage = win_probability > 0.6
+                    even = win_probability > 0.4
+                else:
+                    # 戦闘システムがない場合は兵力比で判定
+                    advantage = attack_force > target.soldiers * 1.5
+                    even = attack_force > target.soldiers
+                if advantage:
                     recommendation = "有利"
                     color = config.STATUS_POSITIVE
-                elif attack_force > target.soldiers:
+                elif even:
                     recommendation = "互角"
                     color = config.STATUS_NEUTRAL
                 else:
                     recommendation = "不利"
                     color = config.STATUS_NEGATIVE
+                if win_probability is not None:
+                    recommendation += f"（勝率{int(win_probability * 100)}%）"
 
                 pred_text = self.font_small.render(f"  予測: {recommendation}", True, text_color if selected_attack_target_id == target.id else color)
                 self.screen.blit(pred_text, (650, y))
@@ -1,6 +1,6 @@
 """
 TransferDialog - リソース転送ダイアログ
-隣接する自領地へのリソース転送UI
+自領地へのリソース転送UI（自領地を経由する転送先を含む）
 """
 import pygame
 import config
@@ -20,7 +20,9 @@ class TransferDialog:
         self.is_visible = False
         self.from_province = None
         self.target_provinces: List[Province] = []
+        self.target_hops: List[int] = []  # 転送先ごとの経路のホップ数
         self.selected_target_index = 0
+        self.target_scroll = 0  # 転送先リストの表示開始位置
         self.resource_type = ""  # "soldiers", "gold", "rice"
         self.transfer_amount = 0
         self.max_amount = 0
@@ -34,6 +36,7 @@ class TransferDialog:
         self.dialog_height = 450  # 高さを増やしてヘルプテキスト用スペースを確保
         self.dialog_x = (config.SCREEN_WIDTH - self.dialog_width) // 2
         self.dialog_y = (config.SCREEN_HEIGHT - self.dialog_height) // 2
+        self.visible_target_rows = 5  # 転送先リストの表示行数（超える分はスクロール）
 
         # 色設定
         self.bg_color = (35, 30, 25)
@@ -59,12 +62,19 @@ class TransferDialog:
         resource_type: str,
         max_amount: int,
         on_confirm: Callable,
-        on_cancel: Callable
+        on_cancel: Callable,
+        target_hops: Optional[List[int]] = None
     ):
-        """ダイアログを表示"""
+        """ダイアログを表示
+
+        Args:
+            target_hops: 転送先ごとの経路のホップ数（Noneの場合はすべて隣接として扱う）
+        """
         self.is_visible = True
         self.from_province = from_province
         self.target_provinces = target_provinces
+        self.target_hops = target_hops if target_hops is not None else [1] * len(target_provinces)
+        self.target_scroll = 0
         self.resource_type = resource_type
         self.max_amount = max_amount
         self.transfer_amount = min(10, max_amount)  # 初期値は10
@@ -89,21 +99,26 @@ class TransferDialog:
             elif event.key == pygame.K_RETURN:
                 self._confirm()
             elif event.key == pygame.K_UP:
-                self.selected_target_index = max(0, self.selected_target_index - 1)
+                self._select_target(self.selected_target_index - 1)
             elif event.key == pygame.K_DOWN:
-                self.selected_target_index = min(len(self.target_provinces) - 1, self.selected_target_index + 1)
+                self._select_target(self.selected_target_index + 1)
             elif event.key == pygame.K_LEFT:
                 self._decrease_amount(1)
             elif event.key == pygame.K_RIGHT:
                 self._increase_amount(1)
 
+        elif event.type == pygame.MOUSEWHEEL:
+            # 転送先リストのスクロール
+            max_scroll = max(0, len(self.target_provinces) - self.visible_target_rows)
+            self.target_scroll = max(0, min(max_scroll, self.target_scroll - event.y))
+
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mouse_pos = event.pos
 
             # 転送先クリック
             for i, rect in enumerate(self.target_rects):
                 if rect.collidepoint(mouse_pos):
-                    self.selected_target_index = i
+                    self.selected_target_index = self.target_scroll + i
                     return
 
             # ボタンクリック
@@ -168,7 +183,9 @@ class TransferDialog:
         target_y += 25
         self.target_rects = []
 
-        for i, province in enumerate(self.target_provinces):
+        visible = self.target_provinces[self.target_scroll:self.target_scroll + self.visible_target_rows]
+        for offset, province in enumerate(visible):
+            i = self.target_scroll + offset
             rect = pygame.Rect(self.dialog_x + 30, target_y, 440, 25)
             self.target_rects.append(rect)
 
@@ -180,13 +197,23 @@ class TransferDialog:
 
             pygame.draw.rect(self.screen, (100, 90, 80), rect, 1)
 
-            # 領地名を表示
+            # 領地名を表示（隣接していない領地は経由数も表示）
             province_text = f"{province.name} (兵{province.soldiers}, 金{province.gold}, 米{province.rice})"
+            hops = self.target_hops[i] if i < len(self.target_hops) else 1
+            if hops > 1:
+                province_text += f" {hops - 1}領地経由"
             province_surface = self.small_font.render(province_text, True, (240, 240, 240))
             self.screen.blit(province_surface, (rect.x + 10, rect.y + 5))
 
             target_y += 30
 
+        # 表示しきれない転送先がある場合は件数を表示
+        if len(self.target_provinces) > self.visible_target_rows:
+            last = self.target_scroll + len(visible)
+            scroll_text = f"{self.target_scroll + 1}～{last} / {len(self.target_provinces)}箇所"
+            scroll_surface = self.small_font.render(scroll_text, True, (150, 150, 150))
+            self.screen.blit(scroll_surface, (self.dialog_x + 90, self.dialog_y + 100))
+
         # 転送量の設定
         amount_y = target_y + 20
         amount_text = self.small_font.render(f"転送量: {self.transfer_amount} / {self.max_amount}", True, config.UI_TEXT_COLOR)
@@ -289,6 +316,16 @@ class TransferDialog:
         help_rect = help_surface.get_rect(center=(self.dialog_x + self.dialog_width // 2, self.dialog_y + self.dialog_height - 15))
         self.screen.blit(help_surface, help_rect)
 
+    def _select_target(self, index):
+        """転送先を選択（選択した転送先が見えるようにスクロール）"""
+        if not self.target_provinces:
+            return
+        self.selected_target_index = max(0, min(len(self.target_provinces) - 1, index))
+        if self.selected_target_index < self.target_scroll:
+            self.target_scroll = self.selected_target_index
+        elif self.selected_target_index >= self.target_scroll + self.visible_target_rows:
+            self.target_scroll = self.selected_target_index - self.visible_target_rows + 1
+
     def _increase_amount(self, delta):
         """転送量を増やす"""
         self.transfer_amount = min(self.max_amount, self.transfer_amount + delta)